@@ -0,0 +1,113 @@
+"""
+Gemini context caching for Education agents
+Registers each agent's static instructions once and references them by handle
+"""
+
+import logging
+import threading
+from typing import Optional
+from agno.models.google.gemini import Gemini
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Instruction agno prepends for agents created with markdown=True
+MARKDOWN_INSTRUCTION = "Use markdown to format your answers."
+
+
+class CachedInstructionGemini(Gemini):
+    """Gemini model that skips the inline system instruction while a context cache is active"""
+
+    def get_request_params(self, system_message: Optional[str] = None, **kwargs):
+        """
+        Build request params, dropping the system instruction when it is served from cache
+
+        Gemini rejects requests that set both ``cached_content`` and
+        ``system_instruction``, and the cached copy already carries it.
+        """
+        if self.cached_content:
+            system_message = None
+        return super().get_request_params(system_message=system_message, **kwargs)
+
+
+class InstructionCache:
+    """Keep a Gemini cached-content handle alive for one agent's instructions"""
+
+    def __init__(self, model: CachedInstructionGemini, system_instruction: str, ttl_seconds: int):
+        """
+        Initialize instruction cache
+
+        Args:
+            model: Gemini model that should reference the cache
+            system_instruction: Static instruction text to cache
+            ttl_seconds: Lifetime of the cached content
+        """
+        self.model = model
+        self.system_instruction = system_instruction
+        self.ttl_seconds = ttl_seconds
+        self.name: Optional[str] = None
+        self._timer: Optional[threading.Timer] = None
+
+    def create(self) -> None:
+        """Register the instructions with Gemini and point the model at the handle"""
+        from google.genai import types
+
+        cached = self.model.get_client().caches.create(
+            model=self.model.id,
+            config=types.CreateCachedContentConfig(
+                system_instruction=self.system_instruction,
+                ttl=f"{self.ttl_seconds}s"
+            )
+        )
+        self.name = cached.name
+        self.model.cached_content = cached.name
+        self._schedule_refresh()
+
+    def _schedule_refresh(self) -> None:
+        """Refresh the handle before its TTL expires"""
+        delay = max(self.ttl_seconds - settings.CONTEXT_CACHE_REFRESH_MARGIN_SECONDS, 60)
+        self._timer = threading.Timer(delay, self._refresh)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _refresh(self) -> None:
+        """Re-create the cached content; fall back to inline instructions on failure"""
+        try:
+            self.create()
+            logger.info("Context cache refreshed: %s", self.name)
+        except Exception as e:
+            logger.warning("Context cache refresh failed, using inline instructions: %s", e)
+            self.name = None
+            self.model.cached_content = None
+
+    def stop(self) -> None:
+        """Cancel the background refresher"""
+        if self._timer is not None:
+            self._timer.cancel()
+
+
+def enable_context_cache(model: CachedInstructionGemini, instructions: str, markdown: bool = True) -> Optional[InstructionCache]:
+    """
+    Serve an agent's static instructions from a Gemini context cache
+
+    Args:
+        model: The agent's Gemini model
+        instructions: The agent's instruction text
+        markdown: Whether the agent asks for markdown output
+
+    Returns:
+        Active instruction cache, or None when caching is disabled or unavailable
+    """
+    if not settings.CONTEXT_CACHE_ENABLED or not settings.GEMINI_API_KEY:
+        return None
+
+    system_instruction = f"{instructions}\n\n{MARKDOWN_INSTRUCTION}" if markdown else instructions
+    cache = InstructionCache(model, system_instruction, settings.CONTEXT_CACHE_TTL_SECONDS)
+    try:
+        cache.create()
+        logger.info("Context cache created: %s", cache.name)
+        return cache
+    except Exception as e:
+        # Gemini enforces a minimum cached token count; short preambles stay inline
+        logger.warning("Context cache unavailable, using inline instructions: %s", e)
+        return None
@@ -0,0 +1,61 @@
+"""
+Shared Agno database for Education agents
+One SqliteDb (and SQLAlchemy connection pool) reused by every agent
+"""
+
+import logging
+from agno.db.sqlite import SqliteDb
+from sqlalchemy import event
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Applied to every new pooled connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+)
+
+# Serves "latest sessions for an agent" lookups; verify with
+# EXPLAIN QUERY PLAN SELECT * FROM agno_sessions WHERE agent_id = ? ORDER BY updated_at DESC
+SESSION_INDEX = "CREATE INDEX IF NOT EXISTS ix_sessions_agent_time ON {table}(agent_id, updated_at DESC)"
+
+
+class IndexedSqliteDb(SqliteDb):
+    """SqliteDb that indexes the session table once Agno has created it"""
+
+    _session_index_ready = False
+
+    def _get_table(self, table_type: str, *args, **kwargs):
+        table = super()._get_table(table_type, *args, **kwargs)
+        if table is not None and table_type == "sessions" and not self._session_index_ready:
+            self._create_session_index()
+        return table
+
+    def _create_session_index(self) -> None:
+        """Add SESSION_INDEX to the session table, once per process"""
+        try:
+            with self.db_engine.begin() as connection:
+                connection.exec_driver_sql(SESSION_INDEX.format(table=self.session_table_name))
+            self._session_index_ready = True
+        except Exception as e:
+            logger.warning("Session table indexing failed: %s", e)
+
+
+shared_db = IndexedSqliteDb(db_file=settings.DB_FILE)
+
+
+@event.listens_for(shared_db.db_engine, "connect")
+def _configure_connection(dbapi_connection, connection_record):
+    """Tune each new SQLite connection"""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    except Exception as e:
+        logger.warning("SQLite connection tuning failed: %s", e)
+    finally:
+        cursor.close()
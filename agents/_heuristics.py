@@ -0,0 +1,57 @@
+"""
+Local skill classification for Education agents
+Answers clear-cut assessments from accuracy alone, without a model call
+"""
+
+import math
+from typing import Tuple
+
+# Upper accuracy bound (exclusive) of each skill band, lowest first
+SKILL_BANDS = (
+    (0.5, "Beginner"),
+    (0.8, "Intermediate"),
+    (math.inf, "Advanced")
+)
+
+# Scales accuracy by question difficulty: a high score on easy questions says less
+DIFFICULTY_WEIGHTS = {
+    "beginner": 0.9,
+    "intermediate": 1.0,
+    "advanced": 1.1
+}
+
+
+def classify_skill(correct: float, total: float, difficulty: str = "intermediate") -> Tuple[str, float]:
+    """
+    Classify a skill level from assessment accuracy
+
+    Confidence is the approximate probability that the student's true,
+    difficulty-weighted accuracy falls in the same band as the observed one,
+    using an Agresti-Coull interval. A few questions near a band boundary
+    give low confidence; many questions far from one give confidence
+    close to 1.
+
+    Args:
+        correct: Number of correct answers
+        total: Number of questions
+        difficulty: Question difficulty level
+
+    Returns:
+        Skill level and confidence in [0, 1]
+    """
+    if total <= 0:
+        return "Intermediate", 0.0
+
+    correct = min(max(correct, 0), total)
+    weight = DIFFICULTY_WEIGHTS.get(str(difficulty).lower(), 1.0)
+    accuracy = correct / total * weight
+    level = next(name for bound, name in SKILL_BANDS if accuracy < bound)
+
+    boundaries = [bound for bound, _ in SKILL_BANDS if math.isfinite(bound)]
+    margin = min(abs(accuracy - bound) for bound in boundaries)
+
+    n = total + 4
+    p = (correct + 2) / n
+    std_error = weight * math.sqrt(p * (1 - p) / n)
+    confidence = 0.5 * (1 + math.erf(margin / (std_error * math.sqrt(2))))
+    return level, confidence
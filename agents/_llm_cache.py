@@ -0,0 +1,429 @@
+"""
+LLM response cache for Education agents
+Exact tier keyed on normalized student data plus an optional semantic tier
+"""
+
+import functools
+import hashlib
+import inspect
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple, List, Callable, AsyncIterator
+from agents._utils import dumps_sorted
+from config import settings
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:
+    faiss = None
+    np = None
+    SentenceTransformer = None
+
+logger = logging.getLogger(__name__)
+
+
+# Free-text fields compared by meaning; every other field must match exactly for a semantic hit
+SEMANTIC_FIELDS = frozenset({"subject", "learning_style", "weak_areas", "strong_areas", "career_interests"})
+
+
+def canonical_text(student_data: Dict[str, Any]) -> str:
+    """
+    Render the free-text student fields as stable text for embedding
+
+    Args:
+        student_data: Student data dictionary
+
+    Returns:
+        One "key: value" line per SEMANTIC_FIELDS entry present, sorted by key
+    """
+    return "\n".join(f"{key}: {student_data[key]}" for key in sorted(student_data) if key in SEMANTIC_FIELDS)
+
+
+def identity_key(student_data: Dict[str, Any]) -> str:
+    """
+    Digest of the identity and numeric student fields
+
+    Two records only share a semantic cache entry when these agree, so one
+    student's name and scores never answer for another's.
+
+    Args:
+        student_data: Student data dictionary
+
+    Returns:
+        Hex digest of every field outside SEMANTIC_FIELDS
+    """
+    exact = {key: value for key, value in student_data.items() if key not in SEMANTIC_FIELDS}
+    return hashlib.blake2b(dumps_sorted(exact), digest_size=16).hexdigest()
+
+
+@functools.cache
+def get_encoder():
+    """Get the shared sentence transformer, loading it on first use"""
+    return SentenceTransformer(settings.EMBEDDING_MODEL, device="cpu")
+
+
+class LLMCache:
+    """Two-tier cache for agent responses"""
+
+    def __init__(
+        self,
+        directory: str,
+        ttl_seconds: int,
+        similarity_threshold: float,
+        semantic: bool = True,
+        max_memory_entries: int = 1024,
+        max_index_entries: int = 4096
+    ):
+        """
+        Initialize LLM cache
+
+        Args:
+            directory: Directory for the on-disk exact tier
+            ttl_seconds: Time-to-live for cached responses
+            similarity_threshold: Minimum cosine similarity for a semantic hit
+            semantic: Enable the embedding-based tier when its dependencies are installed
+            max_memory_entries: Size bound for the in-memory exact tier fallback
+            max_index_entries: Size bound for each template's semantic index
+        """
+        self.directory = directory
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.semantic_enabled = semantic and faiss is not None
+        self.max_memory_entries = max_memory_entries
+        self.max_index_entries = max_index_entries
+
+        self._store = None
+        self._memory: Dict[str, Tuple[float, str]] = {}
+        self._indexes: Dict[str, Any] = {}
+        self._index_keys: Dict[str, List[str]] = {}
+        # template id -> exact key -> (expires_at, vector, identity_key), oldest first; the index is rebuilt from it
+        self._index_entries: Dict[str, "OrderedDict[str, Tuple[float, Any]]"] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(template_id: str, student_data: Dict[str, Any]) -> str:
+        """
+        Build the exact-tier key for a prompt template and its inputs
+
+        Args:
+            template_id: Prompt template identifier
+            student_data: Student data used to render the prompt
+
+        Returns:
+            Hex digest key
+        """
+        payload = dumps_sorted(student_data) + template_id.encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def embed(self, student_data: Dict[str, Any]):
+        """
+        Embed student data once so several lookups can share the vector
+
+        Args:
+            student_data: Student data dictionary
+
+        Returns:
+            Normalized embedding, or None when the semantic tier is disabled
+        """
+        if not self.semantic_enabled:
+            return None
+        return self._embed(student_data)
+
+    def get(self, template_id: str, student_data: Dict[str, Any], vector=None) -> Optional[str]:
+        """
+        Look up a cached response, trying the exact tier then the semantic tier
+
+        Args:
+            template_id: Prompt template identifier
+            student_data: Student data used to render the prompt
+            vector: Precomputed embedding from embed(), to skip re-encoding
+
+        Returns:
+            Cached response content or None on miss
+        """
+        match = self.lookup(template_id, student_data, vector=vector)
+        return match[1] if match is not None else None
+
+    def lookup(
+        self,
+        template_id: str,
+        student_data: Dict[str, Any],
+        threshold: Optional[float] = None,
+        vector=None
+    ) -> Optional[Tuple[float, str]]:
+        """
+        Look up a cached response along with how closely it matches
+
+        Args:
+            template_id: Prompt template identifier
+            student_data: Student data used to render the prompt
+            threshold: Minimum semantic similarity; values below the cache threshold are raised to it
+            vector: Precomputed embedding from embed(), to skip re-encoding
+
+        Returns:
+            (similarity, content), with similarity 1.0 for exact hits, or None on miss
+        """
+        key = self.make_key(template_id, student_data)
+        content = self._get_exact(key)
+        if content is not None:
+            logger.info("LLM cache hit (exact) for %s", template_id)
+            return 1.0, content
+
+        if self.semantic_enabled:
+            match = self._search(template_id, student_data, threshold, vector)
+            if match is not None:
+                similarity, matched_key = match
+                content = self._get_exact(matched_key)
+                if content is not None:
+                    logger.info("LLM cache hit (semantic %.3f) for %s", similarity, template_id)
+                    return similarity, content
+
+        return None
+
+    def set(self, template_id: str, student_data: Dict[str, Any], content: str, vector=None) -> None:
+        """
+        Store a response in both tiers
+
+        Args:
+            template_id: Prompt template identifier
+            student_data: Student data used to render the prompt
+            content: Response content to cache
+            vector: Precomputed embedding from embed(), to skip re-encoding
+        """
+        key = self.make_key(template_id, student_data)
+        self._set_exact(key, content)
+
+        if self.semantic_enabled:
+            self._add_vector(template_id, student_data, key, vector)
+
+    def clear(self) -> None:
+        """Drop every cached response"""
+        with self._lock:
+            self._memory.clear()
+            self._indexes.clear()
+            self._index_keys.clear()
+            self._index_entries.clear()
+        if self._store is not None:
+            self._store.clear()
+
+    def _get_store(self):
+        """Open the on-disk exact tier on first use"""
+        if self._store is None and diskcache is not None:
+            self._store = diskcache.Cache(self.directory)
+        return self._store
+
+    def _get_exact(self, key: str) -> Optional[str]:
+        """Read an entry from the exact tier"""
+        store = self._get_store()
+        if store is not None:
+            return store.get(key)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            expires_at, content = entry
+            if expires_at < time.monotonic():
+                del self._memory[key]
+                return None
+            return content
+
+    def _set_exact(self, key: str, content: str) -> None:
+        """Write an entry to the exact tier"""
+        store = self._get_store()
+        if store is not None:
+            store.set(key, content, expire=self.ttl_seconds)
+            return
+
+        with self._lock:
+            self._memory.pop(key, None)
+            self._memory[key] = (time.monotonic() + self.ttl_seconds, content)
+            while len(self._memory) > self.max_memory_entries:
+                del self._memory[next(iter(self._memory))]
+
+    def _embed(self, student_data: Dict[str, Any]):
+        """Embed student data with the shared sentence transformer"""
+        vector = get_encoder().encode(canonical_text(student_data), normalize_embeddings=True)
+        return np.asarray([vector], dtype="float32")
+
+    def _search(
+        self,
+        template_id: str,
+        student_data: Dict[str, Any],
+        threshold: Optional[float] = None,
+        vector=None
+    ) -> Optional[Tuple[float, str]]:
+        """
+        Find the closest cached entry for a template above the similarity threshold
+
+        Only entries with the same identity_key count.
+        """
+        index = self._indexes.get(template_id)
+        if index is None or index.ntotal == 0:
+            return None
+
+        if vector is None:
+            vector = self._embed(student_data)
+        threshold = self.similarity_threshold if threshold is None else max(threshold, self.similarity_threshold)
+        identity = identity_key(student_data)
+        with self._lock:
+            # A flat index scores every entry anyway, so ranking them all costs little
+            similarities, positions = index.search(vector, index.ntotal)
+            entries = self._index_entries[template_id]
+            keys = self._index_keys[template_id]
+            for similarity, position in zip(similarities[0], positions[0]):
+                if position < 0 or similarity < threshold:
+                    return None
+                key = keys[position]
+                if entries[key][2] == identity:
+                    return float(similarity), key
+            return None
+
+    def _add_vector(self, template_id: str, student_data: Dict[str, Any], key: str, vector=None) -> None:
+        """
+        Insert an entry into the semantic tier
+
+        Re-setting a key only refreshes its expiry. Expired entries and
+        entries beyond max_index_entries are dropped by rebuilding the index.
+        """
+        entries = self._index_entries.get(template_id)
+        if entries is not None and key in entries:
+            with self._lock:
+                _, entry_vector, identity = entries[key]
+                entries[key] = (time.monotonic() + self.ttl_seconds, entry_vector, identity)
+            return
+
+        if vector is None:
+            vector = self._embed(student_data)
+        with self._lock:
+            entries = self._index_entries.setdefault(template_id, OrderedDict())
+            if key in entries:
+                return
+            now = time.monotonic()
+            entries[key] = (now + self.ttl_seconds, vector, identity_key(student_data))
+
+            stale = False
+            while entries and next(iter(entries.values()))[0] < now:
+                entries.popitem(last=False)
+                stale = True
+            if len(entries) > self.max_index_entries:
+                # Evict down to three quarters of the cap so rebuilds stay rare
+                while len(entries) > max(1, self.max_index_entries * 3 // 4):
+                    entries.popitem(last=False)
+                stale = True
+
+            index = self._indexes.get(template_id)
+            if index is None or stale:
+                index = faiss.IndexFlatIP(vector.shape[1])
+                index.add(np.vstack([entry[1] for entry in entries.values()]))
+                self._indexes[template_id] = index
+                self._index_keys[template_id] = list(entries)
+            else:
+                index.add(vector)
+                self._index_keys[template_id].append(key)
+
+
+def cached_llm(template_id: str) -> Callable:
+    """
+    Cache an agent method's successful analysis by its student data
+
+    Works for both sync and async agent methods taking ``student_data``
+    as their first argument and returning ``{"status", "analysis"}``.
+    The wrapped method also accepts a ``student_vec`` keyword with a
+    precomputed embedding from ``llm_cache.embed``.
+
+    Args:
+        template_id: Prompt template identifier; bump it when the prompt changes
+
+    Returns:
+        Method decorator
+    """
+    def store(student_data: Dict[str, Any], result: Dict[str, Any], student_vec) -> None:
+        if not isinstance(result, dict) or result.get("status") != "success":
+            return
+        analysis = result.get("analysis")
+        if isinstance(analysis, str) and analysis:
+            llm_cache.set(template_id, student_data, analysis, vector=student_vec)
+
+    def decorator(method: Callable) -> Callable:
+        if inspect.iscoroutinefunction(method):
+            @functools.wraps(method)
+            async def async_wrapper(self, student_data: Dict[str, Any], *args, student_vec=None, **kwargs):
+                if settings.LLM_CACHE_ENABLED:
+                    cached = llm_cache.get(template_id, student_data, vector=student_vec)
+                    if cached is not None:
+                        return {"status": "success", "analysis": cached}
+
+                result = await method(self, student_data, *args, **kwargs)
+                if settings.LLM_CACHE_ENABLED:
+                    store(student_data, result, student_vec)
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self, student_data: Dict[str, Any], *args, student_vec=None, **kwargs):
+            if settings.LLM_CACHE_ENABLED:
+                cached = llm_cache.get(template_id, student_data, vector=student_vec)
+                if cached is not None:
+                    return {"status": "success", "analysis": cached}
+
+            result = method(self, student_data, *args, **kwargs)
+            if settings.LLM_CACHE_ENABLED:
+                store(student_data, result, student_vec)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+async def cached_stream(
+    template_id: str,
+    student_data: Dict[str, Any],
+    stream_factory: Callable[[], AsyncIterator[str]],
+    student_vec=None
+) -> AsyncIterator[str]:
+    """
+    Stream a response, serving it from cache on hit and caching it on completion
+
+    Args:
+        template_id: Prompt template identifier
+        student_data: Student data used to render the prompt
+        stream_factory: Starts the model stream on a cache miss
+        student_vec: Precomputed embedding from llm_cache.embed
+
+    Yields:
+        Response content chunks
+    """
+    if settings.LLM_CACHE_ENABLED:
+        cached = llm_cache.get(template_id, student_data, vector=student_vec)
+        if cached is not None:
+            yield cached
+            return
+
+    chunks = []
+    async for chunk in stream_factory():
+        chunks.append(chunk)
+        yield chunk
+
+    if settings.LLM_CACHE_ENABLED and chunks:
+        llm_cache.set(template_id, student_data, "".join(chunks), vector=student_vec)
+
+
+# Create singleton instance
+llm_cache = LLMCache(
+    directory=settings.LLM_CACHE_DIR,
+    ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+    similarity_threshold=settings.LLM_CACHE_SIMILARITY_THRESHOLD,
+    semantic=settings.LLM_CACHE_SEMANTIC
+)
@@ -0,0 +1,236 @@
+"""
+Gemini API key pool for Education agents
+Spreads model calls across keys and fails over when a key is rate limited
+"""
+
+import asyncio
+import dataclasses
+import logging
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Sequence
+from agno.exceptions import ModelProviderError
+from agno.models.response import ModelResponse
+from agents._context_cache import CachedInstructionGemini
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+RATE_LIMIT_STATUS = 429
+
+
+class Endpoint:
+    """One Gemini API key, its live load and its concurrency limit"""
+
+    def __init__(self, api_key: str, label: str, concurrency_limit: int):
+        """
+        Initialize endpoint
+
+        Args:
+            api_key: Gemini API key
+            label: Name used in logs instead of the key
+            concurrency_limit: Maximum concurrent async calls on this key
+        """
+        self.api_key = api_key
+        self.label = label
+        self.concurrency_limit = concurrency_limit
+        self.inflight = 0
+        self.cooldown_until = 0.0
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def semaphore(self) -> asyncio.Semaphore:
+        """
+        Get the semaphore capping calls on this key
+
+        asyncio primitives cannot be shared across loops, so each running
+        event loop gets its own.
+
+        Returns:
+            Semaphore for the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(self.concurrency_limit)
+            return semaphore
+
+
+class GeminiPool:
+    """Least-loaded selection over a set of Gemini API keys"""
+
+    def __init__(self, api_keys: Sequence[str], cooldown_seconds: float, concurrency_limit: int = 8):
+        """
+        Initialize pool
+
+        Args:
+            api_keys: Gemini API keys; the first is the primary key
+            cooldown_seconds: How long a rate-limited key is avoided
+            concurrency_limit: Maximum concurrent async calls on each key
+        """
+        self.endpoints = [Endpoint(key, f"key#{i}", concurrency_limit) for i, key in enumerate(api_keys)]
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def acquire(self, exclude: Sequence[Endpoint] = ()) -> Endpoint:
+        """
+        Reserve the least loaded key, preferring keys that are not cooling down
+
+        Args:
+            exclude: Keys already tried for this call
+
+        Returns:
+            Reserved endpoint; pass it to release() when the call finishes
+        """
+        with self._lock:
+            now = time.monotonic()
+            candidates = [e for e in self.endpoints if e not in exclude] or self.endpoints
+            endpoint = min(candidates, key=lambda e: (e.cooldown_until > now, e.inflight))
+            endpoint.inflight += 1
+            return endpoint
+
+    def release(self, endpoint: Endpoint) -> None:
+        """Return a reserved endpoint to the pool"""
+        with self._lock:
+            endpoint.inflight -= 1
+
+    @asynccontextmanager
+    async def limit(self, endpoint: Endpoint) -> AsyncIterator[None]:
+        """Hold one of an endpoint's concurrency slots"""
+        async with endpoint.semaphore():
+            yield
+
+    def cool_down(self, endpoint: Endpoint) -> None:
+        """Avoid a rate-limited key until its cool-down has passed"""
+        with self._lock:
+            endpoint.cooldown_until = time.monotonic() + self.cooldown_seconds
+        logger.warning("Gemini %s rate limited, cooling down for %ss", endpoint.label, self.cooldown_seconds)
+
+
+class PooledGemini(CachedInstructionGemini):
+    """Gemini model that runs each call on the least loaded pooled key"""
+
+    def _bound(self, endpoint: Endpoint, method: str) -> Callable:
+        """
+        Get a model method bound to an endpoint's key
+
+        The primary key runs on this model, which owns the context cache.
+        Other keys run on a plain copy that sends its instructions inline,
+        since cached content belongs to the project that created it.
+        """
+        if endpoint.api_key == self.api_key or len(gemini_pool) < 2:
+            return getattr(super(), method)
+
+        clones: Dict[str, CachedInstructionGemini] = self.__dict__.setdefault("_clones", {})
+        clone = clones.get(endpoint.api_key)
+        if clone is None:
+            clone = CachedInstructionGemini(**{
+                f.name: getattr(self, f.name) for f in dataclasses.fields(self) if f.init
+            })
+            clone.api_key = endpoint.api_key
+            clone.client = None
+            clone.cached_content = None
+            clone = clones.setdefault(endpoint.api_key, clone)
+        return getattr(clone, method)
+
+    def _fail_over(self, error: ModelProviderError, endpoint: Endpoint, tried: List[Endpoint]) -> bool:
+        """
+        Record a failed attempt
+
+        Returns:
+            True if the call should be retried on another key
+        """
+        if error.status_code != RATE_LIMIT_STATUS:
+            return False
+        gemini_pool.cool_down(endpoint)
+        tried.append(endpoint)
+        return len(tried) < len(gemini_pool)
+
+    def invoke(self, *args: Any, **kwargs: Any) -> ModelResponse:
+        if len(gemini_pool) < 2:
+            return super().invoke(*args, **kwargs)
+
+        tried: List[Endpoint] = []
+        while True:
+            endpoint = gemini_pool.acquire(tried)
+            try:
+                return self._bound(endpoint, "invoke")(*args, **kwargs)
+            except ModelProviderError as e:
+                if not self._fail_over(e, endpoint, tried):
+                    raise
+            finally:
+                gemini_pool.release(endpoint)
+
+    async def ainvoke(self, *args: Any, **kwargs: Any) -> ModelResponse:
+        if not len(gemini_pool):
+            return await super().ainvoke(*args, **kwargs)
+
+        tried: List[Endpoint] = []
+        while True:
+            endpoint = gemini_pool.acquire(tried)
+            try:
+                async with gemini_pool.limit(endpoint):
+                    return await self._bound(endpoint, "ainvoke")(*args, **kwargs)
+            except ModelProviderError as e:
+                if not self._fail_over(e, endpoint, tried):
+                    raise
+            finally:
+                gemini_pool.release(endpoint)
+
+    def invoke_stream(self, *args: Any, **kwargs: Any) -> Iterator[ModelResponse]:
+        if len(gemini_pool) < 2:
+            yield from super().invoke_stream(*args, **kwargs)
+            return
+
+        # A stream only fails over before its first chunk has been delivered
+        tried: List[Endpoint] = []
+        while True:
+            endpoint = gemini_pool.acquire(tried)
+            started = False
+            try:
+                for chunk in self._bound(endpoint, "invoke_stream")(*args, **kwargs):
+                    started = True
+                    yield chunk
+                return
+            except ModelProviderError as e:
+                if started or not self._fail_over(e, endpoint, tried):
+                    raise
+            finally:
+                gemini_pool.release(endpoint)
+
+    async def ainvoke_stream(self, *args: Any, **kwargs: Any) -> AsyncIterator[ModelResponse]:
+        if not len(gemini_pool):
+            async for chunk in super().ainvoke_stream(*args, **kwargs):
+                yield chunk
+            return
+
+        tried: List[Endpoint] = []
+        while True:
+            endpoint = gemini_pool.acquire(tried)
+            started = False
+            try:
+                async with gemini_pool.limit(endpoint):
+                    async for chunk in self._bound(endpoint, "ainvoke_stream")(*args, **kwargs):
+                        started = True
+                        yield chunk
+                return
+            except ModelProviderError as e:
+                if started or not self._fail_over(e, endpoint, tried):
+                    raise
+            finally:
+                gemini_pool.release(endpoint)
+
+
+gemini_pool = GeminiPool(
+    settings.GEMINI_API_KEYS,
+    settings.GEMINI_KEY_COOLDOWN_SECONDS,
+    settings.GEMINI_KEY_CONCURRENCY
+)
@@ -0,0 +1,83 @@
+"""
+Structured output schemas for Education agents
+"""
+
+from typing import List, Union
+from pydantic import BaseModel, ConfigDict, Field
+
+Number = Union[int, float]
+Areas = Union[str, List[str]]
+
+
+class StudentData(BaseModel):
+    """Student fields read by the agent prompts, with the value each renders when missing"""
+
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
+    # Profile
+    student_name: str = "N/A"
+    subject: str = "N/A"
+    skill_level: str = "Intermediate"
+    target_level: str = "Advanced"
+    learning_style: str = "mixed"
+    hours_per_week: Number = 5
+    weak_areas: Areas = "N/A"
+    strong_areas: Areas = "N/A"
+    career_interests: Areas = "Not specified"
+    previous_assessments: int = 0
+
+    # Assessment
+    difficulty_level: str = "intermediate"
+    questions_count: int = 10
+    correct_answers: int = 0
+    incorrect_answers: int = 0
+    partial_answers: int = 0
+
+    # Progress
+    initial_score: Union[Number, str] = "N/A"
+    current_score: Union[Number, str] = "N/A"
+    assessments_completed: int = 0
+    study_weeks: Union[Number, str] = "N/A"
+    topics_completed: int = 0
+    total_topics: int = 0
+    practice_hours: Number = 0
+    daily_study_minutes: Number = 0
+    milestones_completed: int = 0
+    milestones_in_progress: int = 0
+    milestones_remaining: int = 0
+
+
+class AssessmentSection(BaseModel):
+    """Assessment part of a unified analysis"""
+
+    skill_level: str = Field(description="Overall skill level: Beginner, Intermediate or Advanced")
+    strengths: List[str] = Field(description="Identified strengths")
+    weaknesses: List[str] = Field(description="Identified weaknesses and knowledge gaps")
+    summary: str = Field(description="Markdown assessment with accuracy, misconceptions and actionable feedback")
+
+
+class ProgressSection(BaseModel):
+    """Progress part of a unified analysis"""
+
+    analysis: str = Field(description="Markdown progress analysis with trends, milestones and time to goal")
+
+
+class LearningPathSection(BaseModel):
+    """Learning path part of a unified analysis"""
+
+    analysis: str = Field(description="Markdown learning path with topic sequence, schedule and resources")
+
+
+class RecommendationsSection(BaseModel):
+    """Recommendations part of a unified analysis"""
+
+    analysis: str = Field(description="Markdown recommendations with next topic, techniques, tools and career alignment")
+
+
+class UnifiedAnalysis(BaseModel):
+    """All four agent analyses produced by a single model call"""
+
+    assessment: AssessmentSection
+    progress: ProgressSection
+    learning_path: LearningPathSection
+    recommendations: RecommendationsSection
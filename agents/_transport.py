@@ -0,0 +1,114 @@
+"""
+Shared HTTP transport for Gemini clients
+One keep-alive (HTTP/2 when available) connection pool reused by every agent
+"""
+
+import asyncio
+import importlib.util
+import weakref
+from typing import Any, AsyncGenerator, Dict, Tuple
+import httpx
+from config import settings
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+if uvloop is not None and settings.USE_UVLOOP:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# httpx only speaks HTTP/2 with the optional h2 package installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _client_kwargs() -> Dict[str, Any]:
+    """Connection settings shared by the sync and async clients"""
+    return {
+        "http2": HTTP2_AVAILABLE,
+        "timeout": settings.GEMINI_HTTP_TIMEOUT_SECONDS,
+        "limits": httpx.Limits(
+            max_connections=settings.GEMINI_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.GEMINI_HTTP_MAX_KEEPALIVE
+        )
+    }
+
+
+class _UnusedTransport(httpx.AsyncBaseTransport):
+    """Placeholder transport for the outer client, whose requests go to per-loop clients"""
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        raise RuntimeError("LoopLocalAsyncClient sends through its per-loop clients")
+
+
+# Only affect how a client builds its own transport, so the outer client skips them
+_TRANSPORT_KWARGS = ("transport", "limits", "http2", "mounts", "verify", "cert", "trust_env")
+
+
+class LoopLocalAsyncClient(httpx.AsyncClient):
+    """
+    Async client that keeps one connection pool per event loop
+
+    Pooled connections belong to the loop that opened them, and the sync
+    orchestrator entry points start a fresh loop per call with asyncio.run.
+    Each loop's client is closed when that loop shuts down its async
+    generators, which asyncio.run does before closing the loop.
+    """
+
+    def __init__(self, **kwargs: Any):
+        """
+        Initialize client
+
+        Args:
+            **kwargs: httpx.AsyncClient arguments used for every per-loop client
+        """
+        base_kwargs = {key: value for key, value in kwargs.items() if key not in _TRANSPORT_KWARGS}
+        super().__init__(transport=_UnusedTransport(), trust_env=False, **base_kwargs)
+        self._client_kwargs = kwargs
+        self._loop_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[httpx.AsyncClient, AsyncGenerator]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def _close_on_shutdown(self, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> AsyncGenerator:
+        """Suspend until the loop finalizes its async generators, then close client"""
+        try:
+            yield
+        finally:
+            self._loop_clients.pop(loop, None)
+            await client.aclose()
+
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        loop = asyncio.get_running_loop()
+        entry = self._loop_clients.get(loop)
+        if entry is None:
+            client = httpx.AsyncClient(**self._client_kwargs)
+            closer = self._close_on_shutdown(loop, client)
+            entry = self._loop_clients[loop] = (client, closer)
+            # First iteration registers the generator with the loop's shutdown_asyncgens
+            await closer.__anext__()
+        return await entry[0].send(request, **kwargs)
+
+    async def aclose(self) -> None:
+        entry = self._loop_clients.get(asyncio.get_running_loop())
+        if entry is not None:
+            await entry[1].aclose()
+        await super().aclose()
+
+
+shared_http = httpx.Client(**_client_kwargs())
+shared_async_http = LoopLocalAsyncClient(**_client_kwargs())
+
+
+def gemini_client_params() -> Dict[str, Any]:
+    """
+    Client params that route a Gemini model through the shared transport
+
+    Returns:
+        ``client_params`` for agno's Gemini model
+    """
+    return {
+        "http_options": {
+            "httpx_client": shared_http,
+            "httpx_async_client": shared_async_http
+        }
+    }
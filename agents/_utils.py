@@ -0,0 +1,105 @@
+"""
+Shared helpers for Education agents
+"""
+
+import json
+from typing import Any, AsyncIterator, Union
+from agno.agent import Agent
+from agno.run.agent import RunContentEvent
+from agents._schemas import StudentData
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_sorted(obj: Any) -> bytes:
+    """
+    Serialize to compact JSON with sorted keys, for hashing
+
+    Args:
+        obj: JSON-compatible value; other values are serialized with str()
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, sort_keys=True, default=str, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize to compact JSON with orjson when it is installed
+
+    Args:
+        obj: JSON-compatible value; other values are serialized with str()
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON with orjson when it is installed
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def render_prompt(template: str, student_data: StudentData, **extra: Any) -> str:
+    """
+    Render a module-level prompt template with student fields
+
+    Args:
+        template: Prompt template with ``{field}`` placeholders
+        student_data: Validated student data supplying the fields
+        **extra: Additional fields that are not part of the student data
+
+    Returns:
+        Prompt text
+    """
+    fields = student_data.model_dump()
+    fields.update(extra)
+    return template.format_map(fields)
+
+
+def extract_content(response: Any) -> str:
+    """
+    Get the text content of an agent run
+
+    Never falls back to ``str(response)``: a RunOutput repr serializes the
+    whole message history.
+
+    Args:
+        response: Agent run output
+
+    Returns:
+        Response text, or an empty string when there is none
+    """
+    return getattr(response, 'content', None) or getattr(response, 'output_text', None) or ''
+
+
+async def stream_content(agent: Agent, prompt: str) -> AsyncIterator[str]:
+    """
+    Stream the text content of an agent run as it is generated
+
+    Args:
+        agent: Agent to run
+        prompt: Prompt text
+
+    Yields:
+        Content chunks in generation order
+    """
+    async for event in agent.arun(prompt, stream=True):
+        if isinstance(event, RunContentEvent) and isinstance(event.content, str) and event.content:
+            yield event.content
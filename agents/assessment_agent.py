@@ -3,15 +3,97 @@ Assessment Agent - Agno Framework
 Evaluates student knowledge and identifies skill levels
 """
 
+import functools
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, List, AsyncIterator
 from agno.agent import Agent
-from agno.models.google.gemini import Gemini
-from agno.db.sqlite import SqliteDb
+from agents._context_cache import enable_context_cache
+from agents._db import shared_db
+from agents._pool import PooledGemini
+from agents._transport import gemini_client_params
+from agents._schemas import StudentData
+from agents._utils import extract_content, loads, render_prompt, stream_content
+from agents._llm_cache import cached_llm, cached_stream
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+_PROMPT = """Analyze this student assessment:
+
+Student: {student_name}
+Subject: {subject}
+Difficulty Level: {difficulty_level}
+Total Questions: {questions_count}
+
+Assessment Data:
+- Correct Answers: {correct_answers}
+- Incorrect Answers: {incorrect_answers}
+- Partial Answers: {partial_answers}
+
+Please provide:
+1. Overall accuracy percentage
+2. Skill level determination (Beginner/Intermediate/Advanced)
+3. Performance breakdown by topic (if applicable)
+4. Identified strengths
+5. Identified weaknesses and knowledge gaps
+6. Confidence scores for each area
+7. Misconceptions detected
+8. Specific, actionable feedback for each weak area
+9. Estimated effort needed to improve
+10. Overall assessment summary
+
+Format with clear sections and bullet points."""
+
+BATCH_RESULT_SCHEMA = """{
+  "student_name": string,
+  "accuracy": number (percentage of correct answers),
+  "skill_level": "Beginner" | "Intermediate" | "Advanced",
+  "strengths": list of strings,
+  "weaknesses": list of strings,
+  "summary": string (markdown summary with actionable feedback for each weak area)
+}"""
+
+_BATCH_PROMPT = """Analyze these {count} student assessments.
+
+Return a JSON array of length {count}. For each student i, produce {schema}
+at position i of the array, in the same order as the students below.
+Respond with the JSON array only.
+
+"""
+
+_BATCH_STUDENT_PROMPT = """Student {index}:
+- Name: {student_name}
+- Subject: {subject}
+- Difficulty Level: {difficulty_level}
+- Total Questions: {questions_count}
+- Correct Answers: {correct_answers}
+- Incorrect Answers: {incorrect_answers}
+- Partial Answers: {partial_answers}
+- Weak Areas: {weak_areas}
+- Strong Areas: {strong_areas}"""
+
+
+def _parse_json_array(content: str) -> List[Any]:
+    """
+    Parse a JSON array from model output, tolerating markdown code fences
+
+    Args:
+        content: Raw model response content
+
+    Returns:
+        Parsed list
+
+    Raises:
+        ValueError: If the content is not a JSON array
+    """
+    text = (content or "").strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[-1].rsplit("```", 1)[0]
+    parsed = loads(text)
+    if not isinstance(parsed, list):
+        raise ValueError("Expected a JSON array")
+    return parsed
+
 
 class AssessmentAgent(Agent):
     """Assessment Agent using Agno"""
@@ -20,11 +102,12 @@ class AssessmentAgent(Agent):
         """Initialize Assessment Agent"""
         super().__init__(
             name="AssessmentAgent",
-            model=Gemini(
+            model=PooledGemini(
                 id=settings.AGENT_MODEL,
-                api_key=settings.GEMINI_API_KEY
+                api_key=settings.GEMINI_API_KEY,
+                client_params=gemini_client_params()
             ),
-            db=SqliteDb(db_file=settings.DB_FILE),
+            db=shared_db,
             instructions="""You are an expert educational assessment specialist.
             Your role is to:
             1. Analyze student quiz/test responses
@@ -43,7 +126,24 @@ class AssessmentAgent(Agent):
             - Be encouraging while being honest about areas needing work""",
             markdown=True
         )
+        self._cache_handle = enable_context_cache(self.model, self.instructions)
 
+    def _build_prompt(self, student_data: Dict[str, Any]) -> str:
+        """
+        Build the assessment analysis prompt
+
+        Args:
+            student_data: Student assessment information
+
+        Returns:
+            Prompt text
+
+        Raises:
+            pydantic.ValidationError: If a student field has the wrong type
+        """
+        return render_prompt(_PROMPT, StudentData.model_validate(student_data))
+
+    @cached_llm(template_id="assessment")
     def assess_student(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Assess student knowledge and skills
@@ -54,50 +154,171 @@ class AssessmentAgent(Agent):
         Returns:
             Assessment analysis
         """
-        prompt = f"""Analyze this student assessment:
+        try:
+            prompt = self._build_prompt(student_data)
+            response = self.run(prompt)
+            logger.info("Assessment completed for: %s", student_data.get('student_name'))
 
-Student: {student_data.get('student_name', 'N/A')}
-Subject: {student_data.get('subject', 'N/A')}
-Difficulty Level: {student_data.get('difficulty_level', 'intermediate')}
-Total Questions: {student_data.get('questions_count', 10)}
+            response_content = extract_content(response)
 
-Assessment Data:
-- Correct Answers: {student_data.get('correct_answers', 0)}
-- Incorrect Answers: {student_data.get('incorrect_answers', 0)}
-- Partial Answers: {student_data.get('partial_answers', 0)}
+            return {
+                "status": "success",
+                "analysis": response_content
+            }
+        except Exception as e:
+            logger.exception("Assessment error: %s", e)
+            return {
+                "status": "error",
+                "error": str(e)
+            }
 
-Please provide:
-1. Overall accuracy percentage
-2. Skill level determination (Beginner/Intermediate/Advanced)
-3. Performance breakdown by topic (if applicable)
-4. Identified strengths
-5. Identified weaknesses and knowledge gaps
-6. Confidence scores for each area
-7. Misconceptions detected
-8. Specific, actionable feedback for each weak area
-9. Estimated effort needed to improve
-10. Overall assessment summary
+    @cached_llm(template_id="assessment")
+    async def aassess_student(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Assess student knowledge and skills without blocking the event loop
 
-Format with clear sections and bullet points."""
+        Args:
+            student_data: Student assessment information
 
+        Returns:
+            Assessment analysis
+        """
         try:
-            response = self.run(prompt)
-            logger.info(f"Assessment completed for: {student_data.get('student_name')}")
+            prompt = self._build_prompt(student_data)
+            response = await self.arun(prompt)
+            logger.info("Assessment completed for: %s", student_data.get('student_name'))
 
-            # Extract content from response
-            response_content = response.content if hasattr(response, 'content') else str(response)
+            response_content = extract_content(response)
 
             return {
                 "status": "success",
                 "analysis": response_content
             }
         except Exception as e:
-            logger.error(f"Assessment error: {str(e)}")
+            logger.exception("Assessment error: %s", e)
             return {
                 "status": "error",
                 "error": str(e)
             }
 
+    async def stream_assess_student(self, student_data: Dict[str, Any], student_vec=None) -> AsyncIterator[str]:
+        """
+        Assess student knowledge and skills, yielding content as it is generated
+
+        Args:
+            student_data: Student assessment information
+            student_vec: Precomputed embedding of student_data for the response cache
+
+        Yields:
+            Response content chunks
+
+        Raises:
+            Exception: Any model or cache error, after it is logged
+        """
+        try:
+            prompt = self._build_prompt(student_data)
+            async for chunk in cached_stream("assessment", student_data, lambda: stream_content(self, prompt), student_vec):
+                yield chunk
+            logger.info("Assessment streamed for: %s", student_data.get('student_name'))
+        except Exception as e:
+            logger.exception("Assessment error: %s", e)
+            raise
+
+    def _build_batch_prompt(self, students: List[Dict[str, Any]]) -> str:
+        """
+        Build one prompt assessing several students
+
+        Args:
+            students: Student assessment information, one entry per student
+
+        Returns:
+            Prompt text
+
+        Raises:
+            pydantic.ValidationError: If a student field has the wrong type
+        """
+        blocks = [
+            render_prompt(_BATCH_STUDENT_PROMPT, StudentData.model_validate(student_data), index=i)
+            for i, student_data in enumerate(students, 1)
+        ]
+        header = _BATCH_PROMPT.format(count=len(students), schema=BATCH_RESULT_SCHEMA)
+        return header + "\n\n".join(blocks)
+
+    def _parse_batch_response(self, content: str, students: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Split a batch response into one result per student
+
+        Args:
+            content: Raw model response content
+            students: Students included in the batch prompt
+
+        Returns:
+            Assessment results in input order
+
+        Raises:
+            ValueError: If the response does not contain one result per student
+        """
+        items = _parse_json_array(content)
+        if len(items) != len(students):
+            raise ValueError(f"Expected {len(students)} results, got {len(items)}")
+
+        results = []
+        for item in items:
+            results.append({
+                "status": "success",
+                "skill_level": item.get("skill_level", "Intermediate"),
+                "strengths": item.get("strengths", []),
+                "weaknesses": item.get("weaknesses", []),
+                "analysis": item.get("summary", "")
+            })
+        return results
+
+    def assess_students_batch(self, students: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Assess several students with a single model call
+
+        Args:
+            students: Student assessment information, one entry per student
+
+        Returns:
+            One assessment result per student, in input order
+        """
+        if not students:
+            return []
+
+        try:
+            response = self.run(self._build_batch_prompt(students))
+            results = self._parse_batch_response(extract_content(response), students)
+            logger.info("Batch assessment completed for %s students", len(students))
+            return results
+        except Exception as e:
+            logger.exception("Batch assessment error: %s", e)
+            return [{"status": "error", "error": str(e)} for _ in students]
+
+    async def aassess_students_batch(self, students: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Assess several students with a single model call without blocking the event loop
+
+        Args:
+            students: Student assessment information, one entry per student
+
+        Returns:
+            One assessment result per student, in input order
+        """
+        if not students:
+            return []
+
+        try:
+            response = await self.arun(self._build_batch_prompt(students))
+            results = self._parse_batch_response(extract_content(response), students)
+            logger.info("Batch assessment completed for %s students", len(students))
+            return results
+        except Exception as e:
+            logger.exception("Batch assessment error: %s", e)
+            return [{"status": "error", "error": str(e)} for _ in students]
+
 
-# Create singleton instance
-assessment_agent = AssessmentAgent()
+@functools.cache
+def get_assessment_agent() -> AssessmentAgent:
+    """Get the shared Assessment Agent, creating it on first use"""
+    return AssessmentAgent()
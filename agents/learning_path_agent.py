@@ -3,16 +3,52 @@ Learning Path Agent - Agno Framework
 Recommends personalized learning paths based on student profile
 """
 
+import functools
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator
 from agno.agent import Agent
-from agno.models.google.gemini import Gemini
-from agno.db.sqlite import SqliteDb
+from agents._context_cache import enable_context_cache
+from agents._db import shared_db
+from agents._pool import PooledGemini
+from agents._transport import gemini_client_params
+from agents._schemas import StudentData
+from agents._utils import extract_content, render_prompt, stream_content
+from agents._llm_cache import cached_llm, cached_stream
 from config import settings
 
 logger = logging.getLogger(__name__)
 
 
+_PROMPT = """Create a personalized learning path for this student:
+
+Student: {student_name}
+Subject: {subject}
+Current Level: {skill_level}
+Goal Level: {target_level}
+Learning Style: {learning_style}
+Available Time: {hours_per_week} hours per week
+Weak Areas: {weak_areas}
+Strong Areas: {strong_areas}
+
+Please provide:
+1. Recommended topic sequence (from foundational to advanced)
+2. Estimated completion timeline
+3. Daily/weekly study schedule and time breakdown
+4. Resource recommendations:
+   - Video tutorials (with specific titles/platforms)
+   - Textbooks and study materials
+   - Interactive practice tools
+   - Real-world projects
+5. Weekly milestones and checkpoints
+6. Specific practice problems or exercises recommended
+7. Difficulty progression strategy
+8. Integration opportunities (how topics connect)
+9. Review and reinforcement schedule
+10. Success checklist and assessment points
+
+Format with clear sections, timelines, and specific resources."""
+
+
 class LearningPathAgent(Agent):
     """Learning Path Agent using Agno"""
 
@@ -20,11 +56,12 @@ class LearningPathAgent(Agent):
         """Initialize Learning Path Agent"""
         super().__init__(
             name="LearningPathAgent",
-            model=Gemini(
+            model=PooledGemini(
                 id=settings.AGENT_MODEL,
-                api_key=settings.GEMINI_API_KEY
+                api_key=settings.GEMINI_API_KEY,
+                client_params=gemini_client_params()
             ),
-            db=SqliteDb(db_file=settings.DB_FILE),
+            db=shared_db,
             instructions="""You are an expert educational curriculum designer and learning specialist.
             Your role is to:
             1. Design custom, personalized learning routes for each student
@@ -45,7 +82,24 @@ class LearningPathAgent(Agent):
             - Provide clear daily/weekly study recommendations""",
             markdown=True
         )
+        self._cache_handle = enable_context_cache(self.model, self.instructions)
+
+    def _build_prompt(self, student_data: Dict[str, Any]) -> str:
+        """
+        Build the learning path recommendation prompt
+
+        Args:
+            student_data: Student profile and assessment results
 
+        Returns:
+            Prompt text
+
+        Raises:
+            pydantic.ValidationError: If a student field has the wrong type
+        """
+        return render_prompt(_PROMPT, StudentData.model_validate(student_data))
+
+    @cached_llm(template_id="learning_path")
     def recommend_learning_path(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Recommend personalized learning path
@@ -56,53 +110,78 @@ class LearningPathAgent(Agent):
         Returns:
             Learning path recommendation
         """
-        prompt = f"""Create a personalized learning path for this student:
+        try:
+            prompt = self._build_prompt(student_data)
+            response = self.run(prompt)
+            logger.info("Learning path generated for: %s", student_data.get('student_name'))
 
-Student: {student_data.get('student_name', 'N/A')}
-Subject: {student_data.get('subject', 'N/A')}
-Current Level: {student_data.get('skill_level', 'Intermediate')}
-Goal Level: {student_data.get('target_level', 'Advanced')}
-Learning Style: {student_data.get('learning_style', 'mixed')}
-Available Time: {student_data.get('hours_per_week', 5)} hours per week
-Weak Areas: {student_data.get('weak_areas', 'N/A')}
-Strong Areas: {student_data.get('strong_areas', 'N/A')}
+            response_content = extract_content(response)
 
-Please provide:
-1. Recommended topic sequence (from foundational to advanced)
-2. Estimated completion timeline
-3. Daily/weekly study schedule and time breakdown
-4. Resource recommendations:
-   - Video tutorials (with specific titles/platforms)
-   - Textbooks and study materials
-   - Interactive practice tools
-   - Real-world projects
-5. Weekly milestones and checkpoints
-6. Specific practice problems or exercises recommended
-7. Difficulty progression strategy
-8. Integration opportunities (how topics connect)
-9. Review and reinforcement schedule
-10. Success checklist and assessment points
+            return {
+                "status": "success",
+                "analysis": response_content
+            }
+        except Exception as e:
+            logger.exception("Learning path generation error: %s", e)
+            return {
+                "status": "error",
+                "error": str(e)
+            }
 
-Format with clear sections, timelines, and specific resources."""
+    @cached_llm(template_id="learning_path")
+    async def arecommend_learning_path(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Recommend personalized learning path without blocking the event loop
 
+        Args:
+            student_data: Student profile and assessment results
+
+        Returns:
+            Learning path recommendation
+        """
         try:
-            response = self.run(prompt)
-            logger.info(f"Learning path generated for: {student_data.get('student_name')}")
+            prompt = self._build_prompt(student_data)
+            response = await self.arun(prompt)
+            logger.info("Learning path generated for: %s", student_data.get('student_name'))
 
-            # Extract content from response
-            response_content = response.content if hasattr(response, 'content') else str(response)
+            response_content = extract_content(response)
 
             return {
                 "status": "success",
                 "analysis": response_content
             }
         except Exception as e:
-            logger.error(f"Learning path generation error: {str(e)}")
+            logger.exception("Learning path generation error: %s", e)
             return {
                 "status": "error",
                 "error": str(e)
             }
 
+    async def stream_recommend_learning_path(self, student_data: Dict[str, Any], student_vec=None) -> AsyncIterator[str]:
+        """
+        Recommend personalized learning path, yielding content as it is generated
+
+        Args:
+            student_data: Student profile and assessment results
+            student_vec: Precomputed embedding of student_data for the response cache
+
+        Yields:
+            Response content chunks
+
+        Raises:
+            Exception: Any model or cache error, after it is logged
+        """
+        try:
+            prompt = self._build_prompt(student_data)
+            async for chunk in cached_stream("learning_path", student_data, lambda: stream_content(self, prompt), student_vec):
+                yield chunk
+            logger.info("Learning path streamed for: %s", student_data.get('student_name'))
+        except Exception as e:
+            logger.exception("Learning path generation error: %s", e)
+            raise
+
 
-# Create singleton instance
-learning_path_agent = LearningPathAgent()
+@functools.cache
+def get_learning_path_agent() -> LearningPathAgent:
+    """Get the shared Learning Path Agent, creating it on first use"""
+    return LearningPathAgent()
@@ -3,89 +3,205 @@ Education System Orchestrator - Agno Framework
 Coordinates all education agents for comprehensive student analysis
 """
 
+import asyncio
+import concurrent.futures
+import json
 import logging
-from typing import Dict, Any
+import os
+import uuid
+from typing import Dict, Any, List, Optional, AsyncIterator, Callable, Sequence
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from agents.assessment_agent import assessment_agent
-from agents.learning_path_agent import learning_path_agent
-from agents.progress_agent import progress_agent
-from agents.recommendation_agent import recommendation_agent
+from agents.assessment_agent import AssessmentAgent, get_assessment_agent
+from agents.learning_path_agent import LearningPathAgent, get_learning_path_agent
+from agents.progress_agent import ProgressAgent, get_progress_agent
+from agents.recommendation_agent import RecommendationAgent, get_recommendation_agent
+from agents.unified_analysis_agent import UnifiedAnalysisAgent, get_unified_analysis_agent
+from agents import _llm_cache
+from agents._heuristics import classify_skill
+from agents._schemas import StudentData
+from agents._utils import dumps, extract_content, loads
+from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Section name -> (response cache template id, heading in combined answers)
+COMBINED_SECTIONS = {
+    "assessment": ("assessment", "Assessment"),
+    "progress": ("progress", "Progress"),
+    "learning_path": ("learning_path", "Learning Path"),
+    "recommendations": ("recommendations", "Recommendations")
+}
+
 
 class EducationOrchestrator:
     """Coordinates multiple education analysis agents"""
 
     def __init__(self):
         """Initialize orchestrator"""
-        self.assessment_agent = assessment_agent
-        self.learning_path_agent = learning_path_agent
-        self.progress_agent = progress_agent
-        self.recommendation_agent = recommendation_agent
+        self._llm_semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._background_tasks: set = set()
+        self._assessments_total = 0
+        self._assessments_bypassed = 0
         logger.info("Education Orchestrator initialized")
 
-    def assess_student(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
+    @property
+    def assessment_agent(self) -> AssessmentAgent:
+        """Assessment agent, built on first use"""
+        return get_assessment_agent()
+
+    @property
+    def learning_path_agent(self) -> LearningPathAgent:
+        """Learning path agent, built on first use"""
+        return get_learning_path_agent()
+
+    @property
+    def progress_agent(self) -> ProgressAgent:
+        """Progress agent, built on first use"""
+        return get_progress_agent()
+
+    @property
+    def recommendation_agent(self) -> RecommendationAgent:
+        """Recommendation agent, built on first use"""
+        return get_recommendation_agent()
+
+    @property
+    def unified_analysis_agent(self) -> UnifiedAnalysisAgent:
+        """Unified analysis agent, built on first use"""
+        return get_unified_analysis_agent()
+
+    def _embed(self, student_data: Dict[str, Any]):
         """
-        Orchestrate comprehensive student assessment
+        Embed student data once per request so every cache lookup can share it
+
+        Args:
+            student_data: Student data dictionary
+
+        Returns:
+            Embedding, or None when the semantic cache is not in use
+        """
+        if not settings.LLM_CACHE_ENABLED:
+            return None
+        return _llm_cache.llm_cache.embed(student_data)
+
+    def _score_assessment(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Compute the deterministic assessment fields without calling the model
 
         Args:
             student_data: Student assessment data
 
+        Returns:
+            Student identity, score and question count
+        """
+        accuracy = (student_data.get("correct_answers", 0) / max(student_data.get("questions_count", 1), 1)) * 100
+        return {
+            "student_name": student_data.get("student_name"),
+            "subject": student_data.get("subject"),
+            "overall_score": accuracy,
+            "questions_answered": student_data.get("questions_count", 0)
+        }
+
+    def _build_assessment(self, student_data: Dict[str, Any], assessment_result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Shape an assessment agent result into the orchestrator response
+
+        Args:
+            student_data: Student assessment data
+            assessment_result: Result returned by the assessment agent
+
         Returns:
             Complete assessment analysis
         """
-        logger.info(f"Starting comprehensive assessment for: {student_data.get('student_name')}")
+        if assessment_result.get("status") != "success":
+            return assessment_result
+
+        analysis = assessment_result.get("analysis", "Assessment complete")
+        analysis_text = analysis if isinstance(analysis, str) else extract_content(analysis)
+
+        return {
+            "status": "success",
+            "assessment": {
+                **self._score_assessment(student_data),
+                "skill_level": assessment_result.get("skill_level", "Intermediate"),
+                "time_taken_minutes": 0,
+                "performance_by_topic": {},
+                "strengths": assessment_result.get("strengths", ["Good accuracy"]),
+                "weaknesses": assessment_result.get("weaknesses", []),
+                "learning_path": {},
+                "progress_metrics": {},
+                "final_summary": analysis_text
+            }
+        }
 
-        try:
-            logger.info("Starting assessment with Agno agents")
+    def _classify_locally(self, student_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Answer a clear-cut assessment from accuracy alone
 
-            assessment_result = self.assessment_agent.assess_student(student_data)
+        Args:
+            student_data: Student assessment data
 
-            if assessment_result.get("status") == "success":
-                # Extract analysis content - handle RunOutput object
-                analysis = assessment_result.get("analysis", "Assessment complete")
+        Returns:
+            Complete assessment analysis, or None when the model is needed
+        """
+        student = StudentData.model_validate(student_data)
+        skill_level, confidence = classify_skill(
+            student.correct_answers, student.questions_count, student.difficulty_level
+        )
+
+        self._assessments_total += 1
+        if confidence <= settings.SKILL_BYPASS_CONFIDENCE:
+            return None
+        self._assessments_bypassed += 1
+        logger.info(
+            "Assessment classified locally as %s (confidence %.2f); bypassed %d of %d",
+            skill_level, confidence, self._assessments_bypassed, self._assessments_total
+        )
+
+        return self._build_assessment(student_data, {
+            "status": "success",
+            "skill_level": skill_level,
+            "strengths": [],
+            "weaknesses": [],
+            "analysis": (
+                f"{skill_level} level: {student.correct_answers} of {student.questions_count} "
+                f"{student.difficulty_level} questions correct."
+            )
+        })
+
+    def assess_student(self, student_data: Dict[str, Any], detailed: bool = False) -> Dict[str, Any]:
+        """
+        Orchestrate comprehensive student assessment
 
-                # If analysis is a RunOutput object, get the content
-                try:
-                    if hasattr(analysis, 'content') and analysis.content:
-                        analysis_text = analysis.content
-                    else:
-                        analysis_text = str(analysis)
-                except:
-                    analysis_text = str(analysis)
+        Args:
+            student_data: Student assessment data
+            detailed: Always run the assessment agent, even when accuracy alone
+                settles the skill level
 
-                accuracy = (student_data.get("correct_answers", 0) / max(student_data.get("questions_count", 1), 1)) * 100
+        Returns:
+            Complete assessment analysis
+        """
+        logger.info("Starting comprehensive assessment for: %s", student_data.get('student_name'))
 
-                return {
-                    "status": "success",
-                    "assessment": {
-                        "student_name": student_data.get("student_name"),
-                        "subject": student_data.get("subject"),
-                        "overall_score": accuracy,
-                        "skill_level": "Intermediate",
-                        "questions_answered": student_data.get("questions_count", 0),
-                        "time_taken_minutes": 0,
-                        "performance_by_topic": {},
-                        "strengths": ["Good accuracy"],
-                        "weaknesses": [],
-                        "learning_path": {},
-                        "progress_metrics": {},
-                        "final_summary": analysis_text
-                    }
-                }
-            else:
-                return assessment_result
+        try:
+            if not detailed:
+                local_result = self._classify_locally(student_data)
+                if local_result is not None:
+                    return local_result
+
+            logger.info("Starting assessment with Agno agents")
+
+            assessment_result = self.assessment_agent.assess_student(student_data, student_vec=self._embed(student_data))
+            return self._build_assessment(student_data, assessment_result)
 
         except Exception as e:
-            logger.error(f"Orchestration error: {str(e)}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Orchestration error: %s", e)
             return {
                 "status": "error",
                 "error": str(e),
@@ -102,15 +218,15 @@ class EducationOrchestrator:
         Returns:
             Progress analysis
         """
-        logger.info(f"Getting progress analysis for: {student_data.get('student_name')}")
+        logger.info("Getting progress analysis for: %s", student_data.get('student_name'))
 
         try:
-            result = self.progress_agent.analyze_progress(student_data)
+            result = self.progress_agent.analyze_progress(student_data, student_vec=self._embed(student_data))
             logger.info("Progress analysis completed")
             return result
 
         except Exception as e:
-            logger.error(f"Progress analysis error: {str(e)}")
+            logger.exception("Progress analysis error: %s", e)
             return {
                 "status": "error",
                 "error": str(e)
@@ -126,15 +242,15 @@ class EducationOrchestrator:
         Returns:
             Learning path recommendation
         """
-        logger.info(f"Getting learning path for: {student_data.get('student_name')}")
+        logger.info("Getting learning path for: %s", student_data.get('student_name'))
 
         try:
-            result = self.learning_path_agent.recommend_learning_path(student_data)
+            result = self.learning_path_agent.recommend_learning_path(student_data, student_vec=self._embed(student_data))
             logger.info("Learning path generated")
             return result
 
         except Exception as e:
-            logger.error(f"Learning path error: {str(e)}")
+            logger.exception("Learning path error: %s", e)
             return {
                 "status": "error",
                 "error": str(e)
@@ -150,20 +266,533 @@ class EducationOrchestrator:
         Returns:
             Recommendations
         """
-        logger.info(f"Getting recommendations for: {student_data.get('student_name')}")
+        logger.info("Getting recommendations for: %s", student_data.get('student_name'))
 
         try:
-            result = self.recommendation_agent.get_recommendations(student_data)
+            result = self.recommendation_agent.get_recommendations(student_data, student_vec=self._embed(student_data))
             logger.info("Recommendations generated")
             return result
 
         except Exception as e:
-            logger.error(f"Recommendation error: {str(e)}")
+            logger.exception("Recommendation error: %s", e)
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Get the semaphore bounding concurrent LLM calls
+
+        The semaphore is recreated whenever a new event loop is running,
+        since asyncio primitives cannot be shared across loops.
+
+        Returns:
+            Semaphore for the running event loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._llm_semaphore is None or self._semaphore_loop is not loop:
+            self._llm_semaphore = asyncio.Semaphore(settings.MAX_CONCURRENT_LLM_CALLS)
+            self._semaphore_loop = loop
+        return self._llm_semaphore
+
+    async def _bounded(self, coro):
+        """Await an agent coroutine while holding the LLM semaphore"""
+        async with self._get_semaphore():
+            return await coro
+
+    async def afull_analysis(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run assessment, progress, learning path and recommendations concurrently
+
+        Args:
+            student_data: Student profile, assessment and progress data
+
+        Returns:
+            Combined analysis from all agents
+        """
+        logger.info("Starting full analysis for: %s", student_data.get('student_name'))
+
+        try:
+            student_vec = await asyncio.to_thread(self._embed, student_data)
+            assessment, progress, learning_path, recommendations = await asyncio.gather(
+                self._bounded(self.assessment_agent.aassess_student(student_data, student_vec=student_vec)),
+                self._bounded(self.progress_agent.aanalyze_progress(student_data, student_vec=student_vec)),
+                self._bounded(self.learning_path_agent.arecommend_learning_path(student_data, student_vec=student_vec)),
+                self._bounded(self.recommendation_agent.aget_recommendations(student_data, student_vec=student_vec))
+            )
+            logger.info("Full analysis completed")
+
+            return {
+                "status": "success",
+                "assessment": self._build_assessment(student_data, assessment),
+                "progress": progress,
+                "learning_path": learning_path,
+                "recommendations": recommendations
+            }
+
+        except Exception as e:
+            logger.exception("Full analysis error: %s", e)
             return {
                 "status": "error",
                 "error": str(e)
             }
 
+    def full_analysis(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run the full concurrent analysis from synchronous code
+
+        Args:
+            student_data: Student profile, assessment and progress data
+
+        Returns:
+            Combined analysis from all agents
+        """
+        return asyncio.run(self.afull_analysis(student_data))
+
+    def _section_call(self, section: str, student_data: Dict[str, Any], student_vec=None):
+        """Start the agent call that produces one combined-analysis section"""
+        calls = {
+            "assessment": self.assessment_agent.aassess_student,
+            "progress": self.progress_agent.aanalyze_progress,
+            "learning_path": self.learning_path_agent.arecommend_learning_path,
+            "recommendations": self.recommendation_agent.aget_recommendations
+        }
+        return calls[section](student_data, student_vec=student_vec)
+
+    def _combine_from_cache(
+        self,
+        student_data: Dict[str, Any],
+        sections: Sequence[str],
+        student_vec=None
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Assemble the requested sections from cached responses
+
+        Every section must match at LLM_CACHE_SECTION_THRESHOLD or better (never
+        below the cache's own threshold) and the similarities must sum to
+        LLM_CACHE_COMBINED_THRESHOLD. Sections are only reused from records with
+        the same identity and score fields, so an answer is never stitched
+        together from other students' analyses.
+
+        Returns:
+            Section results keyed by section name, or None if the cache cannot answer
+        """
+        if not settings.LLM_CACHE_ENABLED:
+            return None
+
+        matches = {}
+        for section in sections:
+            template_id = COMBINED_SECTIONS[section][0]
+            match = _llm_cache.llm_cache.lookup(
+                template_id,
+                student_data,
+                threshold=settings.LLM_CACHE_SECTION_THRESHOLD,
+                vector=student_vec
+            )
+            if match is None:
+                return None
+            matches[section] = match
+
+        if sum(similarity for similarity, _ in matches.values()) < settings.LLM_CACHE_COMBINED_THRESHOLD:
+            return None
+        return {section: {"status": "success", "analysis": content} for section, (_, content) in matches.items()}
+
+    async def aget_combined(
+        self,
+        student_data: Dict[str, Any],
+        sections: Sequence[str] = ("learning_path", "recommendations")
+    ) -> Dict[str, Any]:
+        """
+        Answer a composite query, reusing cached section answers when they match closely
+
+        Args:
+            student_data: Student profile, assessment and progress data
+            sections: Sections to combine, from COMBINED_SECTIONS
+
+        Returns:
+            Per-section results and their concatenated analysis
+        """
+        logger.info("Starting combined analysis (%s) for: %s", ", ".join(sections), student_data.get('student_name'))
+
+        unknown = [section for section in sections if section not in COMBINED_SECTIONS]
+        if unknown:
+            return {
+                "status": "error",
+                "error": f"Unknown sections: {', '.join(unknown)}"
+            }
+
+        try:
+            student_vec = await asyncio.to_thread(self._embed, student_data)
+            results = self._combine_from_cache(student_data, sections, student_vec)
+            source = "cache"
+            if results is None:
+                outputs = await asyncio.gather(*(
+                    self._bounded(self._section_call(section, student_data, student_vec))
+                    for section in sections
+                ))
+                results = dict(zip(sections, outputs))
+                source = "agents"
+
+            failed = [section for section in sections if results[section].get("status") != "success"]
+            if failed:
+                return {
+                    "status": "error",
+                    "error": f"Failed sections: {', '.join(failed)}",
+                    "sections": results
+                }
+
+            logger.info("Combined analysis completed from %s", source)
+            return {
+                "status": "success",
+                "source": source,
+                "sections": results,
+                "analysis": "\n\n".join(
+                    f"## {COMBINED_SECTIONS[section][1]}\n\n{results[section]['analysis']}"
+                    for section in sections
+                )
+            }
+
+        except Exception as e:
+            logger.exception("Combined analysis error: %s", e)
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+
+    def get_combined(
+        self,
+        student_data: Dict[str, Any],
+        sections: Sequence[str] = ("learning_path", "recommendations")
+    ) -> Dict[str, Any]:
+        """
+        Run the combined analysis from synchronous code
+
+        Args:
+            student_data: Student profile, assessment and progress data
+            sections: Sections to combine, from COMBINED_SECTIONS
+
+        Returns:
+            Per-section results and their concatenated analysis
+        """
+        return asyncio.run(self.aget_combined(student_data, sections=sections))
+
+    def _unified_result(self, student_data: Dict[str, Any], analysis) -> Dict[str, Any]:
+        """Map a unified analysis onto the full_analysis result shape"""
+        assessment = self._build_assessment(student_data, {
+            "status": "success",
+            "analysis": analysis.assessment.summary,
+            "skill_level": analysis.assessment.skill_level,
+            "strengths": analysis.assessment.strengths,
+            "weaknesses": analysis.assessment.weaknesses
+        })
+
+        return {
+            "status": "success",
+            "assessment": assessment,
+            "progress": {"status": "success", "analysis": analysis.progress.analysis},
+            "learning_path": {"status": "success", "analysis": analysis.learning_path.analysis},
+            "recommendations": {"status": "success", "analysis": analysis.recommendations.analysis}
+        }
+
+    async def aunified_analysis(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run all four analyses with a single structured model call
+
+        Falls back to the concurrent per-agent path if the unified call
+        fails or returns a response that does not match the schema.
+
+        Args:
+            student_data: Student profile, assessment and progress data
+
+        Returns:
+            Combined analysis in the same shape as full_analysis
+        """
+        logger.info("Starting unified analysis for: %s", student_data.get('student_name'))
+
+        try:
+            analysis = await self._bounded(self.unified_analysis_agent.aanalyze(student_data))
+        except Exception as e:
+            logger.warning("Unified analysis failed, falling back to per-agent calls: %s", e)
+            return await self.afull_analysis(student_data)
+
+        return self._unified_result(student_data, analysis)
+
+    def unified_analysis(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run all four analyses with a single structured model call
+
+        Falls back to the concurrent per-agent path if the unified call
+        fails or returns a response that does not match the schema. Async
+        callers should await aunified_analysis instead; called on a running
+        event loop, the fallback runs on a worker thread with its own loop.
+
+        Args:
+            student_data: Student profile, assessment and progress data
+
+        Returns:
+            Combined analysis in the same shape as full_analysis
+        """
+        logger.info("Starting unified analysis for: %s", student_data.get('student_name'))
+
+        try:
+            analysis = self.unified_analysis_agent.analyze(student_data)
+        except Exception as e:
+            logger.warning("Unified analysis failed, falling back to per-agent calls: %s", e)
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return self.full_analysis(student_data)
+            # asyncio.run cannot nest inside a running loop
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(self.full_analysis, student_data).result()
+
+        return self._unified_result(student_data, analysis)
+
+    def _checkpoint_id(self, student_data: Dict[str, Any]) -> Optional[str]:
+        """Identify a student across bulk runs, or None if the data carries no identity"""
+        student_id = student_data.get("student_id") or student_data.get("student_name")
+        return str(student_id) if student_id else None
+
+    def _load_checkpoint(self, output_jsonl: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Read completed assessments from a bulk checkpoint file
+
+        Args:
+            output_jsonl: Checkpoint file path
+
+        Returns:
+            Completed results keyed by student id
+        """
+        completed = {}
+        if not os.path.exists(output_jsonl):
+            return completed
+
+        with open(output_jsonl, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write leaves a truncated last line
+                    continue
+                student_id = record.pop("student_id", None)
+                if student_id is not None:
+                    completed[student_id] = record
+        return completed
+
+    async def abulk_assess(
+        self,
+        students: List[Dict[str, Any]],
+        batch_size: int = 5,
+        output_jsonl: Optional[str] = "bulk.jsonl",
+        resume: bool = True,
+        fsync_every: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        Assess a cohort of students, packing several students into each model call
+
+        Successful assessments are appended to ``output_jsonl`` as each batch
+        finishes, so an interrupted run resumes from the last completed student.
+
+        Args:
+            students: Student assessment data, one entry per student
+            batch_size: Number of students per model call
+            output_jsonl: Checkpoint file path, or None to disable checkpointing
+            resume: Skip students already completed in the checkpoint file
+            fsync_every: Force checkpoint records to disk after this many writes
+
+        Returns:
+            One assessment result per student, in input order
+        """
+        completed = self._load_checkpoint(output_jsonl) if output_jsonl and resume else {}
+        pending = [s for s in students if self._checkpoint_id(s) not in completed]
+        logger.info("Starting bulk assessment for %s students (%s resumed)", len(pending), len(students) - len(pending))
+
+        async def run_chunk(chunk: List[Dict[str, Any]]):
+            return chunk, await self._bounded(self.assessment_agent.aassess_students_batch(chunk))
+
+        chunks = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        checkpoint = open(output_jsonl, "ab") if output_jsonl else None
+        fresh: Dict[int, Dict[str, Any]] = {}
+        unsynced = 0
+        try:
+            for next_chunk in asyncio.as_completed([run_chunk(chunk) for chunk in chunks]):
+                chunk, chunk_result = await next_chunk
+                for student_data, assessment_result in zip(chunk, chunk_result):
+                    result = self._build_assessment(student_data, assessment_result)
+                    fresh[id(student_data)] = result
+
+                    student_id = self._checkpoint_id(student_data)
+                    if checkpoint and student_id is not None and result.get("status") == "success":
+                        checkpoint.write(dumps({"student_id": student_id, **result}) + b"\n")
+                        unsynced += 1
+
+                if checkpoint and unsynced >= fsync_every:
+                    checkpoint.flush()
+                    os.fsync(checkpoint.fileno())
+                    unsynced = 0
+        finally:
+            if checkpoint:
+                checkpoint.flush()
+                os.fsync(checkpoint.fileno())
+                checkpoint.close()
+
+        logger.info("Bulk assessment completed")
+        return [
+            fresh[id(s)] if id(s) in fresh else completed[self._checkpoint_id(s)]
+            for s in students
+        ]
+
+    def bulk_assess(
+        self,
+        students: List[Dict[str, Any]],
+        batch_size: int = 5,
+        output_jsonl: Optional[str] = "bulk.jsonl",
+        resume: bool = True,
+        fsync_every: int = 20
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the bulk assessment from synchronous code
+
+        Args:
+            students: Student assessment data, one entry per student
+            batch_size: Number of students per model call
+            output_jsonl: Checkpoint file path, or None to disable checkpointing
+            resume: Skip students already completed in the checkpoint file
+            fsync_every: Force checkpoint records to disk after this many writes
+
+        Returns:
+            One assessment result per student, in input order
+        """
+        return asyncio.run(self.abulk_assess(
+            students,
+            batch_size=batch_size,
+            output_jsonl=output_jsonl,
+            resume=resume,
+            fsync_every=fsync_every
+        ))
+
+    async def _stream_bounded(
+        self,
+        stream: Callable[..., AsyncIterator[str]],
+        student_data: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """Embed the student data off the event loop, then relay an agent stream while holding the LLM semaphore"""
+        student_vec = await asyncio.to_thread(self._embed, student_data)
+        async with self._get_semaphore():
+            async for chunk in stream(student_data, student_vec=student_vec):
+                yield chunk
+
+    def stream_assess_student(self, student_data: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream the assessment analysis as it is generated
+
+        Args:
+            student_data: Student assessment data
+
+        Returns:
+            Async iterator of content chunks
+        """
+        logger.info("Streaming assessment for: %s", student_data.get('student_name'))
+        return self._stream_bounded(self.assessment_agent.stream_assess_student, student_data)
+
+    def stream_progress(self, student_data: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream the progress analysis as it is generated
+
+        Args:
+            student_data: Student progress data
+
+        Returns:
+            Async iterator of content chunks
+        """
+        logger.info("Streaming progress analysis for: %s", student_data.get('student_name'))
+        return self._stream_bounded(self.progress_agent.stream_analyze_progress, student_data)
+
+    def stream_learning_path(self, student_data: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream the learning path as it is generated
+
+        Args:
+            student_data: Student profile and assessment data
+
+        Returns:
+            Async iterator of content chunks
+        """
+        logger.info("Streaming learning path for: %s", student_data.get('student_name'))
+        return self._stream_bounded(self.learning_path_agent.stream_recommend_learning_path, student_data)
+
+    def stream_recommendations(self, student_data: Dict[str, Any]) -> AsyncIterator[str]:
+        """
+        Stream the recommendations as they are generated
+
+        Args:
+            student_data: Student profile and history
+
+        Returns:
+            Async iterator of content chunks
+        """
+        logger.info("Streaming recommendations for: %s", student_data.get('student_name'))
+        return self._stream_bounded(self.recommendation_agent.stream_get_recommendations, student_data)
+
+    async def submit_assessment(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Return the scored assessment now and refine it with the model in the background
+
+        Must be awaited on a running event loop, which keeps the refinement task alive.
+
+        Args:
+            student_data: Student assessment data
+
+        Returns:
+            Pending job with its id and the deterministic assessment fields
+        """
+        job_id = uuid.uuid4().hex
+        partial = self._score_assessment(student_data)
+        self._track_job(job_id, {"status": "pending", "partial": partial})
+
+        task = asyncio.create_task(self._refine_assessment(student_data, job_id))
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+        logger.info("Assessment job %s submitted for: %s", job_id, student_data.get('student_name'))
+        return {"status": "pending", "job_id": job_id, "partial": partial}
+
+    async def _refine_assessment(self, student_data: Dict[str, Any], job_id: str) -> None:
+        """
+        Run the model assessment for a submitted job and store the result
+
+        Args:
+            student_data: Student assessment data
+            job_id: Job to complete
+        """
+        try:
+            student_vec = await asyncio.to_thread(self._embed, student_data)
+            assessment_result = await self._bounded(self.assessment_agent.aassess_student(student_data, student_vec=student_vec))
+            self._track_job(job_id, self._build_assessment(student_data, assessment_result))
+        except Exception as e:
+            logger.exception("Assessment job %s failed: %s", job_id, e)
+            self._track_job(job_id, {"status": "error", "error": str(e)})
+
+    def _track_job(self, job_id: str, result: Dict[str, Any]) -> None:
+        """Store a job result, forgetting the oldest jobs beyond the retention limit"""
+        self._jobs.pop(job_id, None)
+        self._jobs[job_id] = result
+        while len(self._jobs) > settings.MAX_TRACKED_ASSESSMENT_JOBS:
+            self._jobs.pop(next(iter(self._jobs)))
+
+    def get_assessment_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the current state of a submitted assessment
+
+        Args:
+            job_id: Job id returned by submit_assessment
+
+        Returns:
+            Pending, completed or failed job result, or None if unknown
+        """
+        return self._jobs.get(job_id)
+
 
 # Create singleton instance
 orchestrator = EducationOrchestrator()
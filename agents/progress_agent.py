@@ -3,16 +3,61 @@ Progress Tracking Agent - Agno Framework
 Monitors and analyzes student learning progress over time
 """
 
+import functools
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator
 from agno.agent import Agent
-from agno.models.google.gemini import Gemini
-from agno.db.sqlite import SqliteDb
+from agents._context_cache import enable_context_cache
+from agents._db import shared_db
+from agents._pool import PooledGemini
+from agents._transport import gemini_client_params
+from agents._schemas import StudentData
+from agents._utils import extract_content, render_prompt, stream_content
+from agents._llm_cache import cached_llm, cached_stream
 from config import settings
 
 logger = logging.getLogger(__name__)
 
 
+_PROMPT = """Analyze the learning progress for this student:
+
+Student: {student_name}
+Subject: {subject}
+
+Assessment History:
+- Initial Score: {initial_score}
+- Current Score: {current_score}
+- Number of Assessments: {assessments_completed}
+- Time Period: {study_weeks} weeks
+
+Learning Activity:
+- Topics Completed: {topics_completed}
+- Total Topics: {total_topics}
+- Practice Hours: {practice_hours}
+- Average Daily Study: {daily_study_minutes} minutes
+
+Milestone Status:
+- Completed: {milestones_completed}
+- In Progress: {milestones_in_progress}
+- Remaining: {milestones_remaining}
+
+Please provide:
+1. Overall progress score and summary
+2. Improvement rate and trajectory analysis
+3. Topic-by-topic progress breakdown
+4. Strengths and improvements achieved
+5. Areas still needing work
+6. Progress trends (accelerating/steady/plateauing/declining)
+7. Detected learning patterns
+8. Milestone achievement analysis
+9. Estimated time to goal completion
+10. Specific recommendations for optimization
+11. Motivational assessment and encouragement
+12. Risk factors or areas of concern
+
+Format with clear sections, data-backed insights, and actionable recommendations."""
+
+
 class ProgressAgent(Agent):
     """Progress Tracking Agent using Agno"""
 
@@ -20,11 +65,12 @@ class ProgressAgent(Agent):
         """Initialize Progress Agent"""
         super().__init__(
             name="ProgressAgent",
-            model=Gemini(
+            model=PooledGemini(
                 id=settings.AGENT_MODEL,
-                api_key=settings.GEMINI_API_KEY
+                api_key=settings.GEMINI_API_KEY,
+                client_params=gemini_client_params()
             ),
-            db=SqliteDb(db_file=settings.DB_FILE),
+            db=shared_db,
             instructions="""You are an expert learning analytics specialist and educational psychologist.
             Your role is to:
             1. Track learning metrics and progress over time
@@ -45,7 +91,24 @@ class ProgressAgent(Agent):
             - Track both quantitative and qualitative improvements""",
             markdown=True
         )
+        self._cache_handle = enable_context_cache(self.model, self.instructions)
+
+    def _build_prompt(self, student_data: Dict[str, Any]) -> str:
+        """
+        Build the progress analysis prompt
+
+        Args:
+            student_data: Student progress data
+
+        Returns:
+            Prompt text
+
+        Raises:
+            pydantic.ValidationError: If a student field has the wrong type
+        """
+        return render_prompt(_PROMPT, StudentData.model_validate(student_data))
 
+    @cached_llm(template_id="progress")
     def analyze_progress(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyze student progress
@@ -56,62 +119,78 @@ class ProgressAgent(Agent):
         Returns:
             Progress analysis
         """
-        prompt = f"""Analyze the learning progress for this student:
-
-Student: {student_data.get('student_name', 'N/A')}
-Subject: {student_data.get('subject', 'N/A')}
-
-Assessment History:
-- Initial Score: {student_data.get('initial_score', 'N/A')}
-- Current Score: {student_data.get('current_score', 'N/A')}
-- Number of Assessments: {student_data.get('assessments_completed', 0)}
-- Time Period: {student_data.get('study_weeks', 'N/A')} weeks
+        try:
+            prompt = self._build_prompt(student_data)
+            response = self.run(prompt)
+            logger.info("Progress analysis completed for: %s", student_data.get('student_name'))
 
-Learning Activity:
-- Topics Completed: {student_data.get('topics_completed', 0)}
-- Total Topics: {student_data.get('total_topics', 0)}
-- Practice Hours: {student_data.get('practice_hours', 0)}
-- Average Daily Study: {student_data.get('daily_study_minutes', 0)} minutes
+            response_content = extract_content(response)
 
-Milestone Status:
-- Completed: {student_data.get('milestones_completed', 0)}
-- In Progress: {student_data.get('milestones_in_progress', 0)}
-- Remaining: {student_data.get('milestones_remaining', 0)}
+            return {
+                "status": "success",
+                "analysis": response_content
+            }
+        except Exception as e:
+            logger.exception("Progress analysis error: %s", e)
+            return {
+                "status": "error",
+                "error": str(e)
+            }
 
-Please provide:
-1. Overall progress score and summary
-2. Improvement rate and trajectory analysis
-3. Topic-by-topic progress breakdown
-4. Strengths and improvements achieved
-5. Areas still needing work
-6. Progress trends (accelerating/steady/plateauing/declining)
-7. Detected learning patterns
-8. Milestone achievement analysis
-9. Estimated time to goal completion
-10. Specific recommendations for optimization
-11. Motivational assessment and encouragement
-12. Risk factors or areas of concern
+    @cached_llm(template_id="progress")
+    async def aanalyze_progress(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Analyze student progress without blocking the event loop
 
-Format with clear sections, data-backed insights, and actionable recommendations."""
+        Args:
+            student_data: Student progress data
 
+        Returns:
+            Progress analysis
+        """
         try:
-            response = self.run(prompt)
-            logger.info(f"Progress analysis completed for: {student_data.get('student_name')}")
+            prompt = self._build_prompt(student_data)
+            response = await self.arun(prompt)
+            logger.info("Progress analysis completed for: %s", student_data.get('student_name'))
 
-            # Extract content from response
-            response_content = response.content if hasattr(response, 'content') else str(response)
+            response_content = extract_content(response)
 
             return {
                 "status": "success",
                 "analysis": response_content
             }
         except Exception as e:
-            logger.error(f"Progress analysis error: {str(e)}")
+            logger.exception("Progress analysis error: %s", e)
             return {
                 "status": "error",
                 "error": str(e)
             }
 
+    async def stream_analyze_progress(self, student_data: Dict[str, Any], student_vec=None) -> AsyncIterator[str]:
+        """
+        Analyze student progress, yielding content as it is generated
+
+        Args:
+            student_data: Student progress data
+            student_vec: Precomputed embedding of student_data for the response cache
+
+        Yields:
+            Response content chunks
+
+        Raises:
+            Exception: Any model or cache error, after it is logged
+        """
+        try:
+            prompt = self._build_prompt(student_data)
+            async for chunk in cached_stream("progress", student_data, lambda: stream_content(self, prompt), student_vec):
+                yield chunk
+            logger.info("Progress analysis streamed for: %s", student_data.get('student_name'))
+        except Exception as e:
+            logger.exception("Progress analysis error: %s", e)
+            raise
+
 
-# Create singleton instance
-progress_agent = ProgressAgent()
+@functools.cache
+def get_progress_agent() -> ProgressAgent:
+    """Get the shared Progress Agent, creating it on first use"""
+    return ProgressAgent()
@@ -3,71 +3,33 @@ Recommendation Engine Agent - Agno Framework
 Provides AI-driven learning recommendations and personalized suggestions
 """
 
+import functools
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator
 from agno.agent import Agent
-from agno.models.google.gemini import Gemini
-from agno.db.sqlite import SqliteDb
+from agents._context_cache import enable_context_cache
+from agents._db import shared_db
+from agents._pool import PooledGemini
+from agents._transport import gemini_client_params
+from agents._schemas import StudentData
+from agents._utils import extract_content, render_prompt, stream_content
+from agents._llm_cache import cached_llm, cached_stream
 from config import settings
 
 logger = logging.getLogger(__name__)
 
 
-class RecommendationAgent(Agent):
-    """Recommendation Engine Agent using Agno"""
+_PROMPT = """Provide personalized learning recommendations for this student:
 
-    def __init__(self):
-        """Initialize Recommendation Engine Agent"""
-        super().__init__(
-            name="RecommendationAgent",
-            model=Gemini(
-                id=settings.AGENT_MODEL,
-                api_key=settings.GEMINI_API_KEY
-            ),
-            db=SqliteDb(db_file=settings.DB_FILE),
-            instructions="""You are an expert educational advisor and career guidance counselor.
-            Your role is to:
-            1. Recommend next topics to study based on progress
-            2. Suggest proven and effective study techniques
-            3. Recommend similar or alternative content
-            4. Find and suggest peer study groups
-            5. Recommend tools, apps, and resources
-            6. Provide career path guidance aligned with learning goals
-
-            Guidelines:
-            - Make recommendations based on learning style and preferences
-            - Suggest tools and techniques with documented effectiveness
-            - Consider student's career aspirations
-            - Identify synergies between topics and career paths
-            - Predict success factors based on data
-            - Provide multiple options/alternatives
-            - Explain the 'why' behind recommendations
-            - Be encouraging and supportive
-            - Consider time and resource constraints""",
-            markdown=True
-        )
-
-    def get_recommendations(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Generate personalized learning recommendations
-
-        Args:
-            student_data: Student profile, history, and goals
-
-        Returns:
-            Recommendations
-        """
-        prompt = f"""Provide personalized learning recommendations for this student:
-
-Student: {student_data.get('student_name', 'N/A')}
-Subject: {student_data.get('subject', 'N/A')}
-Current Level: {student_data.get('skill_level', 'Intermediate')}
-Learning Style: {student_data.get('learning_style', 'mixed')}
-Weak Areas: {student_data.get('weak_areas', 'N/A')}
-Strong Areas: {student_data.get('strong_areas', 'N/A')}
-Career Interests: {student_data.get('career_interests', 'Not specified')}
-Available Time: {student_data.get('hours_per_week', 5)} hours/week
-Previous Attempts: {student_data.get('previous_assessments', 0)}
+Student: {student_name}
+Subject: {subject}
+Current Level: {skill_level}
+Learning Style: {learning_style}
+Weak Areas: {weak_areas}
+Strong Areas: {strong_areas}
+Career Interests: {career_interests}
+Available Time: {hours_per_week} hours/week
+Previous Attempts: {previous_assessments}
 
 Please provide:
 1. Next topic recommendation (with justification)
@@ -110,24 +72,141 @@ Please provide:
 
 Format with clear sections, specific recommendations, and actionable next steps."""
 
+
+class RecommendationAgent(Agent):
+    """Recommendation Engine Agent using Agno"""
+
+    def __init__(self):
+        """Initialize Recommendation Engine Agent"""
+        super().__init__(
+            name="RecommendationAgent",
+            model=PooledGemini(
+                id=settings.AGENT_MODEL,
+                api_key=settings.GEMINI_API_KEY,
+                client_params=gemini_client_params()
+            ),
+            db=shared_db,
+            instructions="""You are an expert educational advisor and career guidance counselor.
+            Your role is to:
+            1. Recommend next topics to study based on progress
+            2. Suggest proven and effective study techniques
+            3. Recommend similar or alternative content
+            4. Find and suggest peer study groups
+            5. Recommend tools, apps, and resources
+            6. Provide career path guidance aligned with learning goals
+
+            Guidelines:
+            - Make recommendations based on learning style and preferences
+            - Suggest tools and techniques with documented effectiveness
+            - Consider student's career aspirations
+            - Identify synergies between topics and career paths
+            - Predict success factors based on data
+            - Provide multiple options/alternatives
+            - Explain the 'why' behind recommendations
+            - Be encouraging and supportive
+            - Consider time and resource constraints""",
+            markdown=True
+        )
+        self._cache_handle = enable_context_cache(self.model, self.instructions)
+
+    def _build_prompt(self, student_data: Dict[str, Any]) -> str:
+        """
+        Build the recommendations prompt
+
+        Args:
+            student_data: Student profile, history, and goals
+
+        Returns:
+            Prompt text
+
+        Raises:
+            pydantic.ValidationError: If a student field has the wrong type
+        """
+        return render_prompt(_PROMPT, StudentData.model_validate(student_data))
+
+    @cached_llm(template_id="recommendations")
+    def get_recommendations(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate personalized learning recommendations
+
+        Args:
+            student_data: Student profile, history, and goals
+
+        Returns:
+            Recommendations
+        """
         try:
+            prompt = self._build_prompt(student_data)
             response = self.run(prompt)
-            logger.info(f"Recommendations generated for: {student_data.get('student_name')}")
+            logger.info("Recommendations generated for: %s", student_data.get('student_name'))
 
-            # Extract content from response
-            response_content = response.content if hasattr(response, 'content') else str(response)
+            response_content = extract_content(response)
 
             return {
                 "status": "success",
                 "analysis": response_content
             }
         except Exception as e:
-            logger.error(f"Recommendation generation error: {str(e)}")
+            logger.exception("Recommendation generation error: %s", e)
             return {
                 "status": "error",
                 "error": str(e)
             }
 
+    @cached_llm(template_id="recommendations")
+    async def aget_recommendations(self, student_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Generate personalized learning recommendations without blocking the event loop
+
+        Args:
+            student_data: Student profile, history, and goals
+
+        Returns:
+            Recommendations
+        """
+        try:
+            prompt = self._build_prompt(student_data)
+            response = await self.arun(prompt)
+            logger.info("Recommendations generated for: %s", student_data.get('student_name'))
+
+            response_content = extract_content(response)
+
+            return {
+                "status": "success",
+                "analysis": response_content
+            }
+        except Exception as e:
+            logger.exception("Recommendation generation error: %s", e)
+            return {
+                "status": "error",
+                "error": str(e)
+            }
+
+    async def stream_get_recommendations(self, student_data: Dict[str, Any], student_vec=None) -> AsyncIterator[str]:
+        """
+        Generate personalized learning recommendations, yielding content as it is generated
+
+        Args:
+            student_data: Student profile, history, and goals
+            student_vec: Precomputed embedding of student_data for the response cache
+
+        Yields:
+            Response content chunks
+
+        Raises:
+            Exception: Any model or cache error, after it is logged
+        """
+        try:
+            prompt = self._build_prompt(student_data)
+            async for chunk in cached_stream("recommendations", student_data, lambda: stream_content(self, prompt), student_vec):
+                yield chunk
+            logger.info("Recommendations streamed for: %s", student_data.get('student_name'))
+        except Exception as e:
+            logger.exception("Recommendation generation error: %s", e)
+            raise
+
 
-# Create singleton instance
-recommendation_agent = RecommendationAgent()
+@functools.cache
+def get_recommendation_agent() -> RecommendationAgent:
+    """Get the shared Recommendation Engine Agent, creating it on first use"""
+    return RecommendationAgent()
@@ -0,0 +1,151 @@
+"""
+Unified Analysis Agent - Agno Framework
+Produces assessment, progress, learning path and recommendations in one call
+"""
+
+import functools
+import logging
+from typing import Dict, Any
+from agno.agent import Agent
+from agents._context_cache import enable_context_cache
+from agents._db import shared_db
+from agents._pool import PooledGemini
+from agents._transport import gemini_client_params
+from agents._schemas import StudentData, UnifiedAnalysis
+from agents._utils import extract_content, render_prompt
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+_PROMPT = """Analyze this student:
+
+Student: {student_name}
+Subject: {subject}
+Current Level: {skill_level}
+Goal Level: {target_level}
+Learning Style: {learning_style}
+Available Time: {hours_per_week} hours per week
+Weak Areas: {weak_areas}
+Strong Areas: {strong_areas}
+Career Interests: {career_interests}
+
+Assessment Data:
+- Difficulty Level: {difficulty_level}
+- Total Questions: {questions_count}
+- Correct Answers: {correct_answers}
+- Incorrect Answers: {incorrect_answers}
+- Partial Answers: {partial_answers}
+
+Progress Data:
+- Initial Score: {initial_score}
+- Current Score: {current_score}
+- Number of Assessments: {assessments_completed}
+- Time Period: {study_weeks} weeks
+- Topics Completed: {topics_completed} of {total_topics}
+- Practice Hours: {practice_hours}
+- Milestones Completed: {milestones_completed}
+- Milestones Remaining: {milestones_remaining}
+
+Return a JSON object with these sections:
+1. assessment: skill level, strengths, weaknesses and a summary covering accuracy,
+   knowledge gaps, misconceptions and specific feedback for each weak area
+2. progress: progress score, improvement trajectory, trends, milestone analysis,
+   estimated time to goal and risk factors
+3. learning_path: topic sequence, timeline, weekly schedule, resources,
+   milestones and review schedule
+4. recommendations: next topic with justification, study techniques, resources,
+   tools, career path alignment, success factors and a motivational message"""
+
+
+class UnifiedAnalysisAgent(Agent):
+    """Unified Analysis Agent using Agno"""
+
+    def __init__(self):
+        """Initialize Unified Analysis Agent"""
+        super().__init__(
+            name="UnifiedAnalysisAgent",
+            model=PooledGemini(
+                id=settings.AGENT_MODEL,
+                api_key=settings.GEMINI_API_KEY,
+                client_params=gemini_client_params(),
+                generative_model_kwargs={
+                    "response_mime_type": "application/json",
+                    "response_schema": UnifiedAnalysis
+                }
+            ),
+            db=shared_db,
+            instructions="""You are a team of expert educators working together on one student:
+            an assessment specialist, a learning analytics specialist, a curriculum designer
+            and an educational advisor.
+            Your role is to:
+            1. Assess the student's knowledge, skill level, strengths and weaknesses
+            2. Analyze learning progress, trends and milestone achievement
+            3. Design a personalized, well-sequenced learning path with resources
+            4. Recommend next topics, study techniques, tools and career alignment
+
+            Guidelines:
+            - Keep the four sections consistent with each other
+            - Be encouraging while being honest about areas needing work
+            - Use markdown with clear sections inside each text field
+            - Respond only with the requested JSON object""",
+            markdown=False
+        )
+        self._cache_handle = enable_context_cache(self.model, self.instructions, markdown=False)
+
+    def _build_prompt(self, student_data: Dict[str, Any]) -> str:
+        """
+        Build the unified analysis prompt
+
+        Args:
+            student_data: Student profile, assessment and progress data
+
+        Returns:
+            Prompt text
+
+        Raises:
+            pydantic.ValidationError: If a student field has the wrong type
+        """
+        return render_prompt(_PROMPT, StudentData.model_validate(student_data))
+
+    def analyze(self, student_data: Dict[str, Any]) -> UnifiedAnalysis:
+        """
+        Produce all four analyses with a single model call
+
+        Args:
+            student_data: Student profile, assessment and progress data
+
+        Returns:
+            Parsed unified analysis
+
+        Raises:
+            pydantic.ValidationError: If the model response does not match the schema
+        """
+        response = self.run(self._build_prompt(student_data))
+        analysis = UnifiedAnalysis.model_validate_json(extract_content(response))
+        logger.info("Unified analysis completed for: %s", student_data.get('student_name'))
+        return analysis
+
+    async def aanalyze(self, student_data: Dict[str, Any]) -> UnifiedAnalysis:
+        """
+        Produce all four analyses with a single model call, without blocking the event loop
+
+        Args:
+            student_data: Student profile, assessment and progress data
+
+        Returns:
+            Parsed unified analysis
+
+        Raises:
+            pydantic.ValidationError: If the model response does not match the schema
+        """
+        response = await self.arun(self._build_prompt(student_data))
+        analysis = UnifiedAnalysis.model_validate_json(extract_content(response))
+        logger.info("Unified analysis completed for: %s", student_data.get('student_name'))
+        return analysis
+
+
+@functools.cache
+def get_unified_analysis_agent() -> UnifiedAnalysisAgent:
+    """Get the shared Unified Analysis Agent, creating it on first use"""
+    return UnifiedAnalysisAgent()
@@ -0,0 +1 @@
+"""REST API package for Education Intelligence System"""
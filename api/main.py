@@ -0,0 +1,136 @@
+"""
+REST API for Education & Learning Intelligence System
+FastAPI application launched by `python main.py --api`
+"""
+
+from typing import Dict, Any, AsyncIterator, Optional
+from fastapi import FastAPI, Body, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from config import settings
+from agents.orchestrator import orchestrator
+from human_intervention import ApprovalManager
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+app = FastAPI(
+    title=settings.APP_NAME,
+    version=settings.APP_VERSION,
+    description=settings.DESCRIPTION
+)
+
+approval_manager = ApprovalManager()
+
+
+class ApprovalRequest(BaseModel):
+    """Approval request payload"""
+
+    student_id: str
+    decision_type: str
+    decision_data: Dict[str, Any]
+    priority: str = "normal"
+
+
+def _sse_frame(data: str, event: Optional[str] = None) -> str:
+    """Format one server-sent event, splitting multi-line data across data fields"""
+    frame = "\n".join(f"data: {line}" for line in data.split("\n")) + "\n\n"
+    return f"event: {event}\n{frame}" if event else frame
+
+
+async def _sse(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """
+    Frame content chunks as server-sent events
+
+    Args:
+        chunks: Content chunks from an orchestrator stream
+
+    Yields:
+        SSE-formatted messages, ending with a ``done`` event, or with an
+        ``error`` event carrying the message if the stream fails
+    """
+    try:
+        async for chunk in chunks:
+            yield _sse_frame(chunk)
+    except Exception as e:
+        logger.error("Stream failed: %s", e)
+        yield _sse_frame(str(e) or type(e).__name__, event="error")
+        return
+    yield _sse_frame("", event="done")
+
+
+def _event_stream(chunks: AsyncIterator[str]) -> StreamingResponse:
+    """Wrap an orchestrator stream in a text/event-stream response"""
+    return StreamingResponse(_sse(chunks), media_type="text/event-stream")
+
+
+@app.post("/assess")
+async def assess(student_data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
+    """Student assessment; the score is returned now and the analysis is polled via /assess/{job_id}"""
+    return await orchestrator.submit_assessment(student_data)
+
+
+@app.get("/assess/{job_id}")
+def assessment_job(job_id: str) -> Dict[str, Any]:
+    """Poll a submitted assessment"""
+    result = orchestrator.get_assessment_job(job_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Unknown assessment job")
+    return result
+
+
+@app.post("/learning-path")
+def learning_path(student_data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
+    """Generate learning path"""
+    return orchestrator.get_learning_path(student_data)
+
+
+@app.post("/progress")
+def progress(student_data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
+    """Analyze progress"""
+    return orchestrator.get_progress(student_data)
+
+
+@app.post("/recommendations")
+def recommendations(student_data: Dict[str, Any] = Body(...)) -> Dict[str, Any]:
+    """Get recommendations"""
+    return orchestrator.get_recommendations(student_data)
+
+
+@app.post("/assess/stream")
+async def assess_stream(student_data: Dict[str, Any] = Body(...)) -> StreamingResponse:
+    """Stream the student assessment as it is generated"""
+    return _event_stream(orchestrator.stream_assess_student(student_data))
+
+
+@app.post("/learning-path/stream")
+async def learning_path_stream(student_data: Dict[str, Any] = Body(...)) -> StreamingResponse:
+    """Stream the learning path as it is generated"""
+    return _event_stream(orchestrator.stream_learning_path(student_data))
+
+
+@app.post("/progress/stream")
+async def progress_stream(student_data: Dict[str, Any] = Body(...)) -> StreamingResponse:
+    """Stream the progress analysis as it is generated"""
+    return _event_stream(orchestrator.stream_progress(student_data))
+
+
+@app.post("/recommendations/stream")
+async def recommendations_stream(student_data: Dict[str, Any] = Body(...)) -> StreamingResponse:
+    """Stream the recommendations as they are generated"""
+    return _event_stream(orchestrator.stream_recommendations(student_data))
+
+
+@app.post("/approval")
+def create_approval(request: ApprovalRequest) -> Dict[str, Any]:
+    """Create approval request"""
+    request_id = approval_manager.create_approval_request(
+        student_id=request.student_id,
+        decision_type=request.decision_type,
+        decision_data=request.decision_data,
+        priority=request.priority
+    )
+    if request_id is None:
+        return {"status": "error", "message": "Failed to create approval request"}
+    return {"status": "success", "request_id": request_id}
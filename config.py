@@ -15,8 +15,44 @@ class Settings:
     """Application settings"""
 
     # Gemini API Configuration
-    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY", "")
+    # Comma-separated GEMINI_API_KEYS spreads load across keys; the first is the primary key
+    GEMINI_API_KEYS = [
+        key.strip()
+        for key in os.getenv("GEMINI_API_KEYS", os.getenv("GEMINI_API_KEY", "")).split(",")
+        if key.strip()
+    ]
+    GEMINI_API_KEY = GEMINI_API_KEYS[0] if GEMINI_API_KEYS else ""
+    GEMINI_KEY_COOLDOWN_SECONDS = float(os.getenv("GEMINI_KEY_COOLDOWN_SECONDS", "30"))
+    # Concurrent async calls allowed on any one key
+    GEMINI_KEY_CONCURRENCY = int(os.getenv("GEMINI_KEY_CONCURRENCY", "8"))
+
+    # Gemini Transport Configuration
+    GEMINI_HTTP_TIMEOUT_SECONDS = float(os.getenv("GEMINI_HTTP_TIMEOUT_SECONDS", "60"))
+    GEMINI_HTTP_MAX_CONNECTIONS = int(os.getenv("GEMINI_HTTP_MAX_CONNECTIONS", "50"))
+    GEMINI_HTTP_MAX_KEEPALIVE = int(os.getenv("GEMINI_HTTP_MAX_KEEPALIVE", "20"))
+    USE_UVLOOP = os.getenv("USE_UVLOOP", "True").lower() == "true"
     AGENT_MODEL = "gemini-2.0-flash"
+    MAX_CONCURRENT_LLM_CALLS = int(os.getenv("MAX_CONCURRENT_LLM_CALLS", "4"))
+    MAX_TRACKED_ASSESSMENT_JOBS = int(os.getenv("MAX_TRACKED_ASSESSMENT_JOBS", "1000"))
+    # Assessments whose skill level is at least this certain from accuracy alone skip the model
+    SKILL_BYPASS_CONFIDENCE = float(os.getenv("SKILL_BYPASS_CONFIDENCE", "0.9"))
+
+    # Gemini Context Cache Configuration
+    CONTEXT_CACHE_ENABLED = os.getenv("CONTEXT_CACHE_ENABLED", "True").lower() == "true"
+    CONTEXT_CACHE_TTL_SECONDS = int(os.getenv("CONTEXT_CACHE_TTL_SECONDS", "3600"))
+    CONTEXT_CACHE_REFRESH_MARGIN_SECONDS = int(os.getenv("CONTEXT_CACHE_REFRESH_MARGIN_SECONDS", "300"))
+
+    # LLM Response Cache Configuration
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "True").lower() == "true"
+    LLM_CACHE_DIR = os.getenv("LLM_CACHE_DIR", ".llmcache")
+    LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+    LLM_CACHE_SEMANTIC = os.getenv("LLM_CACHE_SEMANTIC", "True").lower() == "true"
+    LLM_CACHE_SIMILARITY_THRESHOLD = float(os.getenv("LLM_CACHE_SIMILARITY_THRESHOLD", "0.92"))
+    # Combined answers reuse cached sections when every section and their summed similarity clear these;
+    # the section threshold never goes below LLM_CACHE_SIMILARITY_THRESHOLD
+    LLM_CACHE_SECTION_THRESHOLD = float(os.getenv("LLM_CACHE_SECTION_THRESHOLD", "0.92"))
+    LLM_CACHE_COMBINED_THRESHOLD = float(os.getenv("LLM_CACHE_COMBINED_THRESHOLD", "1.84"))
+    EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
 
     # API Configuration
     API_PORT = int(os.getenv("API_PORT", "8083"))
@@ -24,6 +60,11 @@ class Settings:
 
     # Database Configuration
     DB_FILE = os.getenv("DATABASE", "education.db")
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_POOL_TIMEOUT_SECONDS = float(os.getenv("DB_POOL_TIMEOUT_SECONDS", "10"))
+    # Repeated dashboard reads within this window are answered without querying
+    QUERY_CACHE_TTL_SECONDS = float(os.getenv("QUERY_CACHE_TTL_SECONDS", "3"))
+    QUERY_CACHE_MAX_ENTRIES = int(os.getenv("QUERY_CACHE_MAX_ENTRIES", "256"))
 
     # Application Settings
     DEBUG = os.getenv("DEBUG", "False").lower() == "true"
@@ -3,14 +3,61 @@ Approval manager for human intervention in Education Intelligence System
 Handles approval workflows for critical AI decisions
 """
 
+import json
+import sqlite3
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 from enum import Enum
 from utils.logger import setup_logger
+from utils.cache import MISSING, query_cache
 from utils.database import get_db_connection, close_db_connection
+from config import settings
 
 logger = setup_logger(__name__)
 
+_json_dumps = json.dumps
+
+# Statements are kept as constants so each pooled connection's statement cache reuses them
+_SQL_INSERT_APPROVAL = """
+    INSERT INTO approval_requests
+    (student_id, decision_type, decision_data, status, priority)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+# executemany rejects statements that return rows, so batches use the plain insert
+_SQL_INSERT_APPROVALS = _SQL_INSERT_APPROVAL
+
+# RETURNING hands back the new id from the insert itself (SQLite 3.35+)
+_INSERT_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+if _INSERT_RETURNING:
+    _SQL_INSERT_APPROVAL += "RETURNING id\n"
+
+_SQL_UPDATE_STATUS = """
+    UPDATE approval_requests
+    SET status = ?, reviewed_at = CURRENT_TIMESTAMP,
+        reviewer_id = ?, reviewer_comments = ?
+    WHERE id = ?
+"""
+
+_APPROVAL_COLUMNS = (
+    "id, student_id, decision_type, decision_data, status, priority, "
+    "created_at, reviewed_at, reviewer_id, reviewer_comments"
+)
+
+_SQL_SELECT_PENDING = f"""
+    SELECT {_APPROVAL_COLUMNS} FROM approval_requests
+    WHERE status = 'pending'
+    ORDER BY created_at ASC
+"""
+
+_SQL_SELECT_PENDING_PRIO = f"""
+    SELECT {_APPROVAL_COLUMNS} FROM approval_requests
+    WHERE status = 'pending' AND priority = ?
+    ORDER BY created_at ASC
+"""
+
+_SQL_SELECT_REQUEST = f"SELECT {_APPROVAL_COLUMNS} FROM approval_requests WHERE id = ?"
+
 
 class ApprovalStatus(Enum):
     """Approval status enumeration"""
@@ -45,37 +92,20 @@ class ApprovalManager:
         Returns:
             Approval request ID or None if failed
         """
+        connection = None
         try:
             connection = get_db_connection()
             cursor = connection.cursor()
 
-            # Create approval requests table if it doesn't exist
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS approval_requests (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    student_id TEXT NOT NULL,
-                    decision_type TEXT NOT NULL,
-                    decision_data TEXT NOT NULL,
-                    status TEXT DEFAULT 'pending',
-                    priority TEXT DEFAULT 'normal',
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    reviewed_at DATETIME,
-                    reviewer_id TEXT,
-                    reviewer_comments TEXT
-                )
-            """)
-
-            # Insert approval request
-            import json
-            cursor.execute("""
-                INSERT INTO approval_requests
-                (student_id, decision_type, decision_data, status, priority)
-                VALUES (?, ?, ?, ?, ?)
-            """, (student_id, decision_type, json.dumps(decision_data), "pending", priority))
+            cursor.execute(
+                _SQL_INSERT_APPROVAL,
+                (student_id, decision_type, _json_dumps(decision_data), "pending", priority)
+            )
+            request_id = cursor.fetchone()[0] if _INSERT_RETURNING else cursor.lastrowid
 
             connection.commit()
-            request_id = cursor.lastrowid
-            close_db_connection(connection)
+            query_cache.invalidate("pending", settings.DB_FILE, priority)
+            query_cache.invalidate("pending", settings.DB_FILE, None)
 
             self.logger.info(f"Approval request {request_id} created for student {student_id}")
             return str(request_id)
@@ -83,6 +113,49 @@ class ApprovalManager:
         except Exception as e:
             self.logger.error(f"Error creating approval request: {e}")
             return None
+        finally:
+            close_db_connection(connection)
+
+    def create_approval_requests_bulk(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Create several approval requests in one transaction
+
+        Args:
+            items: Request dicts with student_id, decision_type, decision_data
+                and optional priority keys
+
+        Returns:
+            Number of requests created, or 0 if the insert failed
+        """
+        connection = None
+        try:
+            rows = [
+                (
+                    item["student_id"],
+                    item["decision_type"],
+                    _json_dumps(item["decision_data"]),
+                    "pending",
+                    item.get("priority", "normal")
+                )
+                for item in items
+            ]
+
+            connection = get_db_connection()
+            cursor = connection.cursor()
+
+            cursor.executemany(_SQL_INSERT_APPROVALS, rows)
+
+            connection.commit()
+            query_cache.invalidate("pending", settings.DB_FILE)
+
+            self.logger.info(f"{len(rows)} approval requests created")
+            return len(rows)
+
+        except Exception as e:
+            self.logger.error(f"Error bulk creating approval requests: {e}")
+            return 0
+        finally:
+            close_db_connection(connection)
 
     def approve_request(
         self,
@@ -108,6 +181,46 @@ class ApprovalManager:
             comments
         )
 
+    def approve_requests_bulk(
+        self,
+        request_ids: List[str],
+        reviewer_id: str,
+        comments: str = ""
+    ) -> int:
+        """
+        Approve several approval requests in one transaction
+
+        Args:
+            request_ids: Approval request IDs
+            reviewer_id: ID of the reviewer
+            comments: Reviewer comments applied to every request
+
+        Returns:
+            Number of requests updated, or 0 if the update failed
+        """
+        connection = None
+        try:
+            connection = get_db_connection()
+            cursor = connection.cursor()
+
+            cursor.executemany(_SQL_UPDATE_STATUS, [
+                (ApprovalStatus.APPROVED.value, reviewer_id, comments, request_id)
+                for request_id in request_ids
+            ])
+
+            connection.commit()
+            updated = cursor.rowcount
+            query_cache.invalidate("pending", settings.DB_FILE)
+
+            self.logger.info(f"{updated} approval requests approved by {reviewer_id}")
+            return updated
+
+        except Exception as e:
+            self.logger.error(f"Error bulk approving requests: {e}")
+            return 0
+        finally:
+            close_db_connection(connection)
+
     def reject_request(
         self,
         request_id: str,
@@ -175,19 +288,15 @@ class ApprovalManager:
         Returns:
             True if update was successful
         """
+        connection = None
         try:
             connection = get_db_connection()
             cursor = connection.cursor()
 
-            cursor.execute("""
-                UPDATE approval_requests
-                SET status = ?, reviewed_at = CURRENT_TIMESTAMP,
-                    reviewer_id = ?, reviewer_comments = ?
-                WHERE id = ?
-            """, (status, reviewer_id, comments, request_id))
+            cursor.execute(_SQL_UPDATE_STATUS, (status, reviewer_id, comments, request_id))
 
             connection.commit()
-            close_db_connection(connection)
+            query_cache.invalidate("pending", settings.DB_FILE)
 
             self.logger.info(f"Approval request {request_id} updated to status: {status}")
             return True
@@ -195,6 +304,8 @@ class ApprovalManager:
         except Exception as e:
             self.logger.error(f"Error updating approval request: {e}")
             return False
+        finally:
+            close_db_connection(connection)
 
     def get_pending_requests(self, priority: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -206,31 +317,32 @@ class ApprovalManager:
         Returns:
             List of pending approval requests
         """
+        cache_key = ("pending", settings.DB_FILE, priority or None)
+        cached = query_cache.get(cache_key)
+        # Callers get their own row dicts, so editing a result cannot change the cache
+        if cached is not MISSING:
+            return [dict(row) for row in cached]
+
+        connection = None
         try:
             connection = get_db_connection()
             cursor = connection.cursor()
 
             if priority:
-                cursor.execute("""
-                    SELECT * FROM approval_requests
-                    WHERE status = 'pending' AND priority = ?
-                    ORDER BY created_at ASC
-                """, (priority,))
+                cursor.execute(_SQL_SELECT_PENDING_PRIO, (priority,))
             else:
-                cursor.execute("""
-                    SELECT * FROM approval_requests
-                    WHERE status = 'pending'
-                    ORDER BY created_at ASC
-                """)
-
-            results = cursor.fetchall()
-            close_db_connection(connection)
+                cursor.execute(_SQL_SELECT_PENDING)
 
+            # Rows are converted as they are read, without materializing them first
+            results = [dict(row) for row in cursor]
+            query_cache.set(cache_key, results)
             return [dict(row) for row in results]
 
         except Exception as e:
             self.logger.error(f"Error retrieving pending requests: {e}")
             return []
+        finally:
+            close_db_connection(connection)
 
     def get_request_status(self, request_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -242,19 +354,19 @@ class ApprovalManager:
         Returns:
             Request details or None if not found
         """
+        connection = None
         try:
             connection = get_db_connection()
             cursor = connection.cursor()
 
-            cursor.execute("""
-                SELECT * FROM approval_requests WHERE id = ?
-            """, (request_id,))
+            cursor.execute(_SQL_SELECT_REQUEST, (request_id,))
 
             result = cursor.fetchone()
-            close_db_connection(connection)
 
             return dict(result) if result else None
 
         except Exception as e:
             self.logger.error(f"Error retrieving request status: {e}")
             return None
+        finally:
+            close_db_connection(connection)
@@ -4,12 +4,32 @@ Processes and stores human feedback on AI recommendations
 """
 
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from utils.logger import setup_logger
+from utils.cache import MISSING, query_cache
 from utils.database import get_db_connection, close_db_connection
+from config import settings
 
 logger = setup_logger(__name__)
 
+# Statements are kept as constants so each pooled connection's statement cache reuses them
+_SQL_INSERT_FEEDBACK = """
+    INSERT INTO feedback (student_id, recommendation_id, feedback_type, comments, rating)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_SELECT_FEEDBACK_BY_STUDENT = """
+    SELECT id, student_id, recommendation_id, feedback_type, comments, rating, timestamp
+    FROM feedback WHERE student_id = ?
+    ORDER BY timestamp DESC
+"""
+
+# The rating filter matches idx_fb_rec_rating, so both aggregates come from the index
+_SQL_AVG_RATING = """
+    SELECT AVG(rating) as avg_rating, COUNT(rating) as rating_count FROM feedback
+    WHERE recommendation_id = ? AND rating IS NOT NULL
+"""
+
 
 class FeedbackHandler:
     """Handle human feedback on AI recommendations"""
@@ -38,6 +58,7 @@ class FeedbackHandler:
         Returns:
             True if feedback was stored successfully
         """
+        connection = None
         try:
             if feedback_type not in ["positive", "negative", "neutral"]:
                 self.logger.warning(f"Invalid feedback type: {feedback_type}")
@@ -46,27 +67,10 @@ class FeedbackHandler:
             connection = get_db_connection()
             cursor = connection.cursor()
 
-            # Create feedback table if it doesn't exist
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS feedback (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    student_id TEXT NOT NULL,
-                    recommendation_id TEXT NOT NULL,
-                    feedback_type TEXT NOT NULL,
-                    comments TEXT,
-                    rating INTEGER,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-
-            # Insert feedback
-            cursor.execute("""
-                INSERT INTO feedback (student_id, recommendation_id, feedback_type, comments, rating)
-                VALUES (?, ?, ?, ?, ?)
-            """, (student_id, recommendation_id, feedback_type, comments, rating))
+            cursor.execute(_SQL_INSERT_FEEDBACK, (student_id, recommendation_id, feedback_type, comments, rating))
 
             connection.commit()
-            close_db_connection(connection)
+            query_cache.invalidate("avg_rating", settings.DB_FILE, recommendation_id)
 
             self.logger.info(f"Feedback stored for student {student_id}")
             return True
@@ -74,6 +78,55 @@ class FeedbackHandler:
         except Exception as e:
             self.logger.error(f"Error storing feedback: {e}")
             return False
+        finally:
+            close_db_connection(connection)
+
+    def submit_feedback_bulk(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Submit several feedback records in one transaction
+
+        Args:
+            items: Feedback records with the submit_feedback arguments as keys;
+                records with an invalid feedback type are skipped
+
+        Returns:
+            Number of feedback records stored, or 0 if the insert failed
+        """
+        rows = []
+        for item in items:
+            if item.get("feedback_type") not in ["positive", "negative", "neutral"]:
+                self.logger.warning(f"Invalid feedback type: {item.get('feedback_type')}")
+                continue
+            rows.append((
+                item["student_id"],
+                item["recommendation_id"],
+                item["feedback_type"],
+                item.get("comments"),
+                item.get("rating")
+            ))
+
+        if not rows:
+            return 0
+
+        connection = None
+        try:
+            connection = get_db_connection()
+            cursor = connection.cursor()
+
+            cursor.executemany(_SQL_INSERT_FEEDBACK, rows)
+
+            connection.commit()
+            for recommendation_id in {row[1] for row in rows}:
+                query_cache.invalidate("avg_rating", settings.DB_FILE, recommendation_id)
+
+            self.logger.info(f"{len(rows)} feedback records stored")
+            return len(rows)
+
+        except Exception as e:
+            self.logger.error(f"Error storing feedback: {e}")
+            return 0
+        finally:
+            close_db_connection(connection)
 
     def get_feedback_history(self, student_id: str) -> list:
         """
@@ -85,23 +138,21 @@ class FeedbackHandler:
         Returns:
             List of feedback records
         """
+        connection = None
         try:
             connection = get_db_connection()
             cursor = connection.cursor()
 
-            cursor.execute("""
-                SELECT * FROM feedback WHERE student_id = ?
-                ORDER BY timestamp DESC
-            """, (student_id,))
-
-            results = cursor.fetchall()
-            close_db_connection(connection)
+            cursor.execute(_SQL_SELECT_FEEDBACK_BY_STUDENT, (student_id,))
 
-            return [dict(row) for row in results]
+            # Rows are converted as they are read, without materializing them first
+            return [dict(row) for row in cursor]
 
         except Exception as e:
             self.logger.error(f"Error retrieving feedback history: {e}")
             return []
+        finally:
+            close_db_connection(connection)
 
     def get_average_rating(self, recommendation_id: str) -> Optional[float]:
         """
@@ -113,20 +164,26 @@ class FeedbackHandler:
         Returns:
             Average rating or None if no ratings exist
         """
+        cache_key = ("avg_rating", settings.DB_FILE, recommendation_id)
+        cached = query_cache.get(cache_key)
+        if cached is not MISSING:
+            return cached
+
+        connection = None
         try:
             connection = get_db_connection()
             cursor = connection.cursor()
 
-            cursor.execute("""
-                SELECT AVG(rating) as avg_rating FROM feedback
-                WHERE recommendation_id = ? AND rating IS NOT NULL
-            """, (recommendation_id,))
+            cursor.execute(_SQL_AVG_RATING, (recommendation_id,))
 
             result = cursor.fetchone()
-            close_db_connection(connection)
 
-            return result["avg_rating"] if result and result["avg_rating"] else None
+            avg_rating = result["avg_rating"] if result and result["rating_count"] else None
+            query_cache.set(cache_key, avg_rating)
+            return avg_rating
 
         except Exception as e:
             self.logger.error(f"Error calculating average rating: {e}")
             return None
+        finally:
+            close_db_connection(connection)
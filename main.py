@@ -14,11 +14,27 @@ from utils.logger import setup_logger
 logger = setup_logger(__name__)
 
 
-def run_streamlit_ui():
-    """Launch the Streamlit UI"""
+def run_streamlit_ui(use_subprocess: bool = False):
+    """
+    Launch the Streamlit UI
+
+    Args:
+        use_subprocess: Run Streamlit in a child interpreter instead of in-process
+    """
     logger.info("Starting Streamlit UI...")
+    streamlit_file = Path(__file__).parent / "streamlit_ui.py"
+
+    if not use_subprocess:
+        try:
+            from streamlit.web import bootstrap
+        except ImportError:
+            bootstrap = None
+        if bootstrap is not None:
+            bootstrap.load_config_options(flag_options={})
+            bootstrap.run(str(streamlit_file), False, [], {})
+            return
+
     try:
-        streamlit_file = Path(__file__).parent / "streamlit_ui.py"
         subprocess.run(
             [sys.executable, "-m", "streamlit", "run", str(streamlit_file)],
             check=True
@@ -28,10 +44,25 @@ def run_streamlit_ui():
         sys.exit(1)
 
 
-def run_api_server():
-    """Launch the API server"""
+def run_api_server(use_subprocess: bool = False):
+    """
+    Launch the API server
+
+    Args:
+        use_subprocess: Run uvicorn in a child interpreter instead of in-process
+    """
     logger.info("Starting API server...")
     logger.info(f"API running on http://{settings.API_HOST}:{settings.API_PORT}")
+
+    if not use_subprocess:
+        try:
+            import uvicorn
+        except ImportError:
+            uvicorn = None
+        if uvicorn is not None:
+            uvicorn.run("api.main:app", host=settings.API_HOST, port=settings.API_PORT)
+            return
+
     try:
         # Example: uvicorn app:app --host localhost --port 8083
         subprocess.run(
@@ -58,7 +89,6 @@ def run_api_server():
 def run_cli():
     """Run command-line interface"""
     logger.info("Running CLI mode...")
-    from agents.orchestrator import orchestrator
 
     print("\n" + "=" * 60)
     print(f"{settings.APP_NAME} - CLI Interface")
@@ -105,20 +135,33 @@ def run_cli():
         print(f"Error: {e}")
 
 
-def main():
-    """Main entry point"""
+def print_version():
+    """Print application name and version"""
+    print(f"{settings.APP_NAME}")
+    print(f"Version: {settings.APP_VERSION}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the command-line parser
+
+    Returns:
+        Parser with streamlit/api/cli subcommands and the legacy mode flags
+    """
     parser = argparse.ArgumentParser(
         description=settings.DESCRIPTION,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
-  python main.py --streamlit          # Launch Streamlit UI
-  python main.py --api                # Start API server
-  python main.py --cli                # Run command-line interface
+  python main.py streamlit            # Launch Streamlit UI
+  python main.py api                  # Start API server
+  python main.py api --subprocess     # Start API server in a child process
+  python main.py cli                  # Run command-line interface
   python main.py --version            # Show version
         """
     )
 
+    # Legacy mode flags, kept alongside the subcommands
     parser.add_argument(
         "--streamlit",
         action="store_true",
@@ -135,7 +178,12 @@ Examples:
         help="Run command-line interface"
     )
     parser.add_argument(
-        "--version",
+        "--subprocess",
+        action="store_true",
+        help="Run the Streamlit UI or API server in a child process"
+    )
+    parser.add_argument(
+        "-V", "--version",
         action="store_true",
         help="Show version information"
     )
@@ -145,28 +193,55 @@ Examples:
         help="Enable verbose logging"
     )
 
-    args = parser.parse_args()
+    subparsers = parser.add_subparsers(dest="mode", title="modes")
+    streamlit_parser = subparsers.add_parser("streamlit", help="Launch Streamlit web interface")
+    api_parser = subparsers.add_parser("api", help="Start API server")
+    subparsers.add_parser("cli", help="Run command-line interface")
+
+    for subparser in (streamlit_parser, api_parser):
+        # SUPPRESS keeps a --subprocess given before the subcommand from being reset
+        subparser.add_argument(
+            "--subprocess",
+            action="store_true",
+            default=argparse.SUPPRESS,
+            help="Run in a child process instead of in-process"
+        )
+
+    return parser
+
+
+def main():
+    """Main entry point"""
+    # Answer --version without building the parser
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        print_version()
+        sys.exit(0)
+
+    args = build_parser().parse_args()
 
     # Show version and exit
     if args.version:
-        print(f"{settings.APP_NAME}")
-        print(f"Version: {settings.APP_VERSION}")
+        print_version()
         sys.exit(0)
 
     # Set verbose logging if requested
     if args.verbose:
         logger.info("Verbose logging enabled")
 
-    # Default to Streamlit if no option specified
-    if not args.api and not args.cli:
-        args.streamlit = True
+    # Default to Streamlit if no mode specified
+    if args.mode:
+        mode = args.mode
+    elif args.streamlit or not (args.api or args.cli):
+        mode = "streamlit"
+    else:
+        mode = "api" if args.api else "cli"
 
     try:
-        if args.streamlit:
-            run_streamlit_ui()
-        elif args.api:
-            run_api_server()
-        elif args.cli:
+        if mode == "streamlit":
+            run_streamlit_ui(use_subprocess=args.subprocess)
+        elif mode == "api":
+            run_api_server(use_subprocess=args.subprocess)
+        elif mode == "cli":
             run_cli()
 
     except KeyboardInterrupt:
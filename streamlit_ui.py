@@ -6,7 +6,35 @@ Interactive dashboard for student assessment and learning
 import streamlit as st
 import json
 from datetime import datetime
-from agents.orchestrator import orchestrator
+from utils.logger import setup_logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = setup_logger(__name__)
+
+SUBJECTS = ("Mathematics", "Physics", "Chemistry", "Biology", "English", "History", "Computer Science")
+
+# Static System tab content, built once and emitted as single markdown elements
+_SYSTEM_CONFIG_MD = (
+    "| Component | Setting |\n"
+    "|---|---|\n"
+    "| Backend | Direct agent integration |\n"
+    "| Framework | Agno + Gemini AI |"
+)
+
+_APPLICATION_INFO_MD = (
+    "| Field | Value |\n"
+    "|---|---|\n"
+    "| System | Education Intelligence |\n"
+    "| Version | 1.0.0 |\n"
+    "| Framework | Agno |\n"
+    "| Model | Gemini 2.0 Flash |"
+)
+
+_SUBJECTS_MD = "\n".join(f"- {subject}" for subject in SUBJECTS)
 
 # Page configuration
 st.set_page_config(
@@ -52,71 +80,164 @@ if "learning_path" not in st.session_state:
     st.session_state.learning_path = None
 
 
+_orchestrator = None
+
+
+def get_orchestrator():
+    """Import the orchestrator and its agent stack on first use"""
+    global _orchestrator
+    if _orchestrator is None:
+        from agents.orchestrator import orchestrator
+        _orchestrator = orchestrator
+    return _orchestrator
+
+
+class _UncachedResult(Exception):
+    """Carries an error result out of a cached call so Streamlit does not cache it"""
+
+    def __init__(self, result: dict):
+        super().__init__(result.get("message"))
+        self.result = result
+
+
+def _payload_key(data: dict) -> bytes:
+    """Serialize an agent payload to a stable cache key"""
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, sort_keys=True, default=str).encode("utf-8")
+
+
+def _load_payload(data_key: bytes) -> dict:
+    """Rebuild an agent payload from its cache key"""
+    return orjson.loads(data_key) if orjson is not None else json.loads(data_key)
+
+
+def _call_cacheable(operation: str, data_key: bytes) -> dict:
+    """Run an agent operation, raising error results so they are not cached"""
+    result = _call_agent(operation, _load_payload(data_key))
+    if result.get("status") == "error":
+        raise _UncachedResult(result)
+    return result
+
+
+@st.cache_data(ttl=300, max_entries=256, show_spinner=False)
+def _cached_call(operation: str, data_key: bytes) -> dict:
+    """Run an agent operation once per distinct input within the TTL"""
+    return _call_cacheable(operation, data_key)
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_plan(operation: str, data_key: bytes) -> dict:
+    """Run a learning path or progress operation once per distinct input for an hour; errors are not cached"""
+    return _call_cacheable(operation, data_key)
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _progress_summary(initial: int, current: int, assessments: int) -> dict:
+    """Derive the progress tab metrics once per distinct set of scores"""
+    return {
+        "improvement": current - initial,
+        "current_score": current,
+        "assessments": assessments,
+        "est_weeks": max(1, 4 - (current // 25))
+    }
+
+
+# Plans and progress reports change slowly, so they are reused for longer
+_LONG_CACHED_OPERATIONS = {"learning_path", "progress"}
+
+
 def call_agent(operation: str, data: dict) -> dict:
+    """Call agents, reusing the previous result when the inputs are unchanged"""
+    cached = _cached_plan if operation in _LONG_CACHED_OPERATIONS else _cached_call
+    try:
+        return cached(operation, _payload_key(data))
+    except _UncachedResult as e:
+        return e.result
+
+
+# Operation -> orchestrator method; only "assess" returns its result unwrapped
+_OPERATIONS = {
+    "assess": "assess_student",
+    "learning_path": "get_learning_path",
+    "progress": "get_progress",
+    "recommendations": "get_recommendations"
+}
+
+
+def _call_agent(operation: str, data: dict) -> dict:
     """Call agents directly"""
     try:
-        if operation == "assess":
-            result = orchestrator.assess_student(data)
-            print(f"DEBUG - Orchestrator result: {result}")
-            return result
-        elif operation == "learning_path":
-            result = orchestrator.get_learning_path(data)
-            print(f"DEBUG - Learning path result: {result}")
-            # Extract the analysis from the result if it has status
-            if isinstance(result, dict) and result.get("status") == "success":
-                return {
-                    "status": "success",
-                    "analysis": result.get("analysis", result),
-                    "timestamp": datetime.now().isoformat()
-                }
-            return {
-                "status": "success",
-                "analysis": result,
-                "timestamp": datetime.now().isoformat()
-            }
-        elif operation == "progress":
-            result = orchestrator.get_progress(data)
-            # Extract the analysis from the result if it has status
-            if isinstance(result, dict) and result.get("status") == "success":
-                return {
-                    "status": "success",
-                    "analysis": result.get("analysis", result),
-                    "timestamp": datetime.now().isoformat()
-                }
-            return {
-                "status": "success",
-                "analysis": result,
-                "timestamp": datetime.now().isoformat()
-            }
-        elif operation == "recommendations":
-            result = orchestrator.get_recommendations(data)
-            # Extract the analysis from the result if it has status
-            if isinstance(result, dict) and result.get("status") == "success":
-                return {
-                    "status": "success",
-                    "analysis": result.get("analysis", result),
-                    "timestamp": datetime.now().isoformat()
-                }
+        method = _OPERATIONS.get(operation)
+        if method is None:
             return {
-                "status": "success",
-                "analysis": result,
-                "timestamp": datetime.now().isoformat()
+                "status": "error",
+                "message": f"Unknown operation: {operation}"
             }
-        else:
+
+        result = getattr(get_orchestrator(), method)(data)
+        logger.debug(f"{operation} result status: {result.get('status') if isinstance(result, dict) else type(result).__name__}")
+        if operation == "assess":
+            return result
+
+        # Failures are passed through unwrapped, so call_agent does not cache them
+        if isinstance(result, dict) and result.get("status") == "error":
             return {
                 "status": "error",
-                "message": f"Unknown operation: {operation}"
+                "message": result.get("message") or result.get("error", "Unknown error")
             }
+
+        # Extract the analysis from the result if it has status
+        if isinstance(result, dict) and result.get("status") == "success":
+            result = result.get("analysis", result)
+        return {
+            "status": "success",
+            "analysis": result,
+            "timestamp": datetime.now().isoformat()
+        }
     except Exception as e:
-        import traceback
-        print(f"DEBUG - Error in call_agent: {str(e)}")
-        print(f"DEBUG - Traceback: {traceback.format_exc()}")
+        logger.exception(f"Error in call_agent ({operation}): {e}")
         return {
             "status": "error",
             "message": f"Error: {str(e)}"
         }
 
 
+# Markdown rendering slows down sharply on long agent outputs
+MARKDOWN_MAX_CHARS = 8000
+EXPANDED_MAX_CHARS = 16000
+
+
+def display_analysis_text(analysis: str):
+    """Render agent text as markdown, falling back to plain text when it is long"""
+    if len(analysis) <= MARKDOWN_MAX_CHARS:
+        st.markdown(analysis)
+    elif len(analysis) <= EXPANDED_MAX_CHARS:
+        st.text(analysis)
+    else:
+        with st.expander("Full analysis", expanded=False):
+            st.text(analysis)
+
+
+def subject_selectbox(key: str, label: str = "Subject") -> str:
+    """Subject picker shared by the tabs, always backed by the same SUBJECTS tuple"""
+    return st.selectbox(label, SUBJECTS, key=key)
+
+
+def weekly_schedule_markdown(schedule: dict) -> str:
+    """Render a learning path's weekly schedule as one markdown document"""
+    chunks = []
+    for week, details in schedule.items():
+        chunks.append(
+            f"##### {week} ({details.get('hours', 0)}h)\n"
+            f"- **Topic:** {details.get('focus_topic', 'N/A')}\n"
+            f"- **Resources:** {', '.join(details.get('resources', []))}\n"
+            f"- **Practice:** {details.get('practices', 0)} exercises\n"
+            f"- **Checkpoint:** {details.get('checkpoint', 'N/A')}\n"
+        )
+    return "\n".join(chunks)
+
+
 def display_assessment_results(result: dict):
     """Display assessment results"""
     if result.get("status") == "error":
@@ -155,21 +276,23 @@ def display_assessment_results(result: dict):
     if topics:
         topic_data = []
         for topic, data in topics.items():
+            status = data.get("status", "N/A")
+            status_color = "🟢" if status == "mastered" else "🟡" if status == "learning" else "🔴"
             topic_data.append({
                 "Topic": topic,
                 "Score": data.get("score", 0),
-                "Status": data.get("status", "N/A")
+                "Status": f"{status_color} {status.title()}"
             })
 
-        for item in topic_data:
-            col1, col2, col3 = st.columns([2, 1, 1])
-            with col1:
-                st.write(f"**{item['Topic']}**")
-            with col2:
-                st.metric("Score", f"{item['Score']}%")
-            with col3:
-                status_color = "🟢" if item['Status'] == "mastered" else "🟡" if item['Status'] == "learning" else "🔴"
-                st.write(f"{status_color} {item['Status'].title()}")
+        # One table element instead of three widgets per topic
+        st.dataframe(
+            topic_data,
+            column_config={
+                "Score": st.column_config.ProgressColumn("Score", format="%.0f%%", min_value=0, max_value=100)
+            },
+            hide_index=True,
+            use_container_width=True
+        )
 
     st.divider()
 
@@ -180,8 +303,7 @@ def display_assessment_results(result: dict):
         st.subheader("Strengths")
         strengths = assessment.get("strengths", [])
         if strengths:
-            for strength in strengths:
-                st.success(f"✓ {strength}")
+            st.table({"Strengths": [f"✓ {strength}" for strength in strengths]})
         else:
             st.info("No identified strengths")
 
@@ -189,8 +311,7 @@ def display_assessment_results(result: dict):
         st.subheader("Areas for Improvement")
         weaknesses = assessment.get("weaknesses", [])
         if weaknesses:
-            for weakness in weaknesses:
-                st.warning(f"⚠ {weakness}")
+            st.table({"Areas for Improvement": [f"⚠ {weakness}" for weakness in weaknesses]})
         else:
             st.info("No weak areas identified")
 
@@ -252,6 +373,10 @@ def display_assessment_results(result: dict):
 st.title("🎓 Education & Learning Intelligence System")
 st.markdown("AI-powered student assessment, learning path recommendation, and progress tracking")
 
+if st.button("🔄 Force refresh", key="force_refresh", help="Discard reused results and call the agents again"):
+    _cached_call.clear()
+    _cached_plan.clear()
+
 # Create tabs
 tab1, tab2, tab3, tab4 = st.tabs(["Assessment", "Learning Path", "Progress", "System Info"])
 
@@ -259,7 +384,9 @@ tab1, tab2, tab3, tab4 = st.tabs(["Assessment", "Learning Path", "Progress", "Sy
 # TAB 1: ASSESSMENT
 # ============================================================================
 
-with tab1:
+@st.fragment
+def _render_assessment_tab():
+    """Assessment tab; its widgets rerun only this fragment"""
     st.header("Student Assessment")
     st.markdown("Evaluate student knowledge and identify skill levels")
 
@@ -267,11 +394,7 @@ with tab1:
 
     with col1:
         student_name = st.text_input("Student Name", value="Alex Kumar", key="assess_name")
-        subject = st.selectbox(
-            "Subject",
-            ["Mathematics", "Physics", "Chemistry", "Biology", "English", "History", "Computer Science"],
-            key="assess_subject"
-        )
+        subject = subject_selectbox("assess_subject")
         difficulty_level = st.select_slider(
             "Difficulty Level",
             options=["beginner", "intermediate", "advanced"],
@@ -281,9 +404,9 @@ with tab1:
 
     with col2:
         questions_count = st.number_input("Total Questions", min_value=1, max_value=100, value=10, key="assess_questions")
-        correct_answers = st.number_input("Correct Answers", min_value=0, max_value=questions_count, value=8, key="assess_correct")
-        incorrect_answers = st.number_input("Incorrect Answers", min_value=0, max_value=questions_count, value=2, key="assess_incorrect")
-        partial_answers = st.number_input("Partial Answers", min_value=0, max_value=questions_count, value=0, key="assess_partial")
+        correct_answers = st.number_input("Correct Answers", min_value=0, max_value=100, value=8, key="assess_correct")
+        incorrect_answers = st.number_input("Incorrect Answers", min_value=0, max_value=100, value=2, key="assess_incorrect")
+        partial_answers = st.number_input("Partial Answers", min_value=0, max_value=100, value=0, key="assess_partial")
 
     st.divider()
 
@@ -316,21 +439,25 @@ with tab1:
 
     with col2:
         if st.button("🚀 Run Assessment", use_container_width=True, key="run_assessment"):
-            with st.spinner("Analyzing student performance..."):
-                assessment_data = {
-                    "student_name": student_name,
-                    "subject": subject,
-                    "questions_count": questions_count,
-                    "correct_answers": correct_answers,
-                    "incorrect_answers": incorrect_answers,
-                    "partial_answers": partial_answers,
-                    "difficulty_level": difficulty_level,
-                    "weak_areas": weak_areas,
-                    "strong_areas": strong_areas
-                }
-
-                result = call_agent("assess", assessment_data)
-                st.session_state.assessment_result = result
+            # Checked once on submit, so the answer inputs do not depend on the question count
+            if correct_answers + incorrect_answers + partial_answers > questions_count:
+                st.error("Correct, incorrect and partial answers cannot exceed the total questions")
+            else:
+                with st.spinner("Analyzing student performance..."):
+                    assessment_data = {
+                        "student_name": student_name,
+                        "subject": subject,
+                        "questions_count": questions_count,
+                        "correct_answers": correct_answers,
+                        "incorrect_answers": incorrect_answers,
+                        "partial_answers": partial_answers,
+                        "difficulty_level": difficulty_level,
+                        "weak_areas": weak_areas,
+                        "strong_areas": strong_areas
+                    }
+
+                    result = call_agent("assess", assessment_data)
+                    st.session_state.assessment_result = result
 
     # Display Results
     if st.session_state.assessment_result:
@@ -353,14 +480,20 @@ with tab1:
             }
             result = call_agent("assess", sample_data)
             st.session_state.assessment_result = result
-            st.rerun()
+            st.rerun(scope="fragment")
+
+
+with tab1:
+    _render_assessment_tab()
 
 
 # ============================================================================
 # TAB 2: LEARNING PATH
 # ============================================================================
 
-with tab2:
+@st.fragment
+def _render_learning_path_tab():
+    """Learning path tab; its widgets rerun only this fragment"""
     st.header("Personalized Learning Path")
     st.markdown("Get AI-recommended learning routes tailored to your needs")
 
@@ -368,11 +501,7 @@ with tab2:
 
     with col1:
         lp_name = st.text_input("Student Name", value="Sarah Chen", key="lp_name")
-        lp_subject = st.selectbox(
-            "Subject",
-            ["Mathematics", "Physics", "Chemistry", "Biology", "English", "History", "Computer Science"],
-            key="lp_subject"
-        )
+        lp_subject = subject_selectbox("lp_subject")
 
     with col2:
         lp_style = st.selectbox(
@@ -404,9 +533,8 @@ with tab2:
 
             st.subheader("Learning Path Recommendation")
 
-            # Always display as markdown (handles both string and dict content)
             if isinstance(analysis, str):
-                st.markdown(analysis)
+                display_analysis_text(analysis)
             elif isinstance(analysis, dict):
                 if "learning_path" in analysis:
                     # Handle structured dict response
@@ -423,24 +551,27 @@ with tab2:
 
                     if "weekly_schedule" in lp:
                         st.write("**Weekly Schedule:**")
-                        for week, details in lp["weekly_schedule"].items():
-                            with st.expander(f"{week} ({details.get('hours', 0)}h)"):
-                                st.write(f"**Topic:** {details.get('focus_topic', 'N/A')}")
-                                st.write(f"**Resources:** {', '.join(details.get('resources', []))}")
-                                st.write(f"**Practice:** {details.get('practices', 0)} exercises")
-                                st.write(f"**Checkpoint:** {details.get('checkpoint', 'N/A')}")
+                        # One markdown element for the whole plan instead of an expander per week
+                        with st.expander(f"{len(lp['weekly_schedule'])} weeks", expanded=False):
+                            st.markdown(weekly_schedule_markdown(lp["weekly_schedule"]))
                 else:
-                    # Generic dict display
-                    st.json(analysis)
+                    # Generic dict display; nested levels stay collapsed until opened
+                    st.json(analysis, expanded=1)
             else:
                 st.write(analysis)
 
 
+with tab2:
+    _render_learning_path_tab()
+
+
 # ============================================================================
 # TAB 3: PROGRESS
 # ============================================================================
 
-with tab3:
+@st.fragment
+def _render_progress_tab():
+    """Progress tab; its widgets rerun only this fragment"""
     st.header("Progress Tracking")
     st.markdown("Monitor learning progress and improvement over time")
 
@@ -448,11 +579,7 @@ with tab3:
 
     with col1:
         prog_name = st.text_input("Student Name", value="Jordan Lee", key="prog_name")
-        prog_subject = st.selectbox(
-            "Subject",
-            ["Mathematics", "Physics", "Chemistry", "Biology", "English", "History", "Computer Science"],
-            key="prog_subject"
-        )
+        prog_subject = subject_selectbox("prog_subject")
 
     with col2:
         initial_score = st.slider("Initial Score (%)", 0, 100, 65, key="initial_score")
@@ -489,39 +616,43 @@ with tab3:
                 st.success("Progress analysis complete!")
                 analysis = result.get("analysis", "")
 
+                summary = _progress_summary(initial_score, current_score, assessments)
                 col1, col2, col3, col4 = st.columns(4)
 
                 with col1:
-                    improvement = current_score - initial_score
-                    st.metric("Improvement", f"+{improvement}%")
+                    st.metric("Improvement", f"+{summary['improvement']}%")
 
                 with col2:
-                    st.metric("Current Score", f"{current_score}%")
+                    st.metric("Current Score", f"{summary['current_score']}%")
 
                 with col3:
-                    st.metric("Assessments", assessments)
+                    st.metric("Assessments", summary["assessments"])
 
                 with col4:
-                    est_weeks = max(1, 4 - (current_score // 25))
-                    st.metric("Est. to Goal", f"{est_weeks} weeks")
+                    st.metric("Est. to Goal", f"{summary['est_weeks']} weeks")
 
                 st.divider()
                 st.subheader("Progress Analysis")
 
-                # Display as markdown if string, otherwise as text
                 if isinstance(analysis, str):
-                    st.markdown(analysis)
+                    display_analysis_text(analysis)
                 else:
                     st.write(analysis)
             else:
                 st.error(f"Error: {result.get('message')}")
 
 
+with tab3:
+    _render_progress_tab()
+
+
 # ============================================================================
 # TAB 4: SYSTEM INFO
 # ============================================================================
 
-with tab4:
+@st.fragment
+def _render_system_info_tab():
+    """System info tab; its widgets rerun only this fragment"""
     st.header("System Information")
 
     # Health Check
@@ -543,7 +674,7 @@ with tab4:
                 "framework": "Agno Framework",
                 "model": "Gemini AI",
                 "status": "running"
-            })
+            }, expanded=1)
 
     with col3:
         if st.button("🔗 Agent Status", use_container_width=True):
@@ -555,37 +686,21 @@ with tab4:
     # System Details
     st.subheader("System Configuration")
 
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.write("**Backend:**")
-        st.write("Direct agent integration")
-
-    with col2:
-        st.write("**Framework:**")
-        st.write("Agno + Gemini AI")
+    st.markdown(_SYSTEM_CONFIG_MD)
 
     st.divider()
 
     st.subheader("Available Subjects")
-    subjects = ["Mathematics", "Physics", "Chemistry", "Biology", "English", "History", "Computer Science"]
-    cols = st.columns(3)
-    for i, subject in enumerate(subjects):
-        with cols[i % 3]:
-            st.write(f"• {subject}")
+    st.markdown(_SUBJECTS_MD)
 
     st.divider()
 
     st.subheader("Application Info")
-    col1, col2 = st.columns(2)
-
-    with col1:
-        st.metric("System", "Education Intelligence")
-        st.metric("Version", "1.0.0")
-
-    with col2:
-        st.metric("Framework", "Agno")
-        st.metric("Model", "Gemini 2.0 Flash")
+    st.markdown(_APPLICATION_INFO_MD)
 
     st.divider()
     st.info("Education Intelligence System is running with direct agent integration")
+
+
+with tab4:
+    _render_system_info_tab()
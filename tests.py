@@ -6,7 +6,8 @@ Tests cover agents, validators, database operations, and human intervention feat
 import pytest
 import sqlite3
 import os
-from unittest.mock import Mock, patch, MagicMock
+import time
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 from datetime import datetime
 
 # Import project modules
@@ -77,32 +78,39 @@ def sample_invalid_assessment_data():
 
 
 @pytest.fixture
-def in_memory_db():
-    """Create in-memory SQLite database for testing"""
+def mock_db_conn(monkeypatch):
+    """Mock connection and cursor served to the approval and feedback modules"""
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    for module in ("human_intervention.approval_manager", "human_intervention.feedback_handler"):
+        monkeypatch.setattr(f"{module}.get_db_connection", lambda: mock_conn)
+        monkeypatch.setattr(f"{module}.close_db_connection", lambda connection: None)
+    yield mock_conn, mock_cursor
+
+
+@pytest.fixture(scope="session")
+def _db_schema():
+    """Create the in-memory SQLite test schema once per session"""
     conn = sqlite3.connect(":memory:")
-    cursor = conn.cursor()
 
     # Create test tables
-    cursor.execute("""
+    conn.executescript("""
         CREATE TABLE students (
             student_id TEXT PRIMARY KEY,
             name TEXT NOT NULL,
             email TEXT NOT NULL,
             grade_level TEXT NOT NULL
-        )
-    """)
+        );
 
-    cursor.execute("""
         CREATE TABLE approvals (
             approval_id TEXT PRIMARY KEY,
             request_type TEXT NOT NULL,
             status TEXT NOT NULL,
             created_at TEXT,
             updated_at TEXT
-        )
-    """)
+        );
 
-    cursor.execute("""
         CREATE TABLE feedback (
             feedback_id TEXT PRIMARY KEY,
             student_id TEXT NOT NULL,
@@ -110,14 +118,25 @@ def in_memory_db():
             rating INTEGER,
             feedback_text TEXT,
             created_at TEXT
-        )
+        );
     """)
 
-    conn.commit()
     yield conn
     conn.close()
 
 
+@pytest.fixture
+def in_memory_db(_db_schema):
+    """In-memory SQLite database for testing, emptied before each test"""
+    _db_schema.rollback()
+    _db_schema.executescript("""
+        DELETE FROM students;
+        DELETE FROM approvals;
+        DELETE FROM feedback;
+    """)
+    return _db_schema
+
+
 # ============================================================================
 # TEST CASE 1: Student Data Validation (Valid Data)
 # ============================================================================
@@ -146,6 +165,12 @@ def test_validate_student_data_invalid(sample_invalid_student_data):
     assert result is False, "Invalid student data should fail validation"
 
 
+def test_validators_reject_non_dict_input():
+    """Test that the validators reject input that is not a dict"""
+    assert validate_student_data(None) is False, "None should fail student validation"
+    assert validate_assessment_data(["STU001", "Mathematics", 85]) is False, "A list should fail assessment validation"
+
+
 # ============================================================================
 # TEST CASE 3: Assessment Data Validation (Valid Score Range)
 # ============================================================================
@@ -192,16 +217,11 @@ def test_database_execute_query(in_memory_db):
 # TEST CASE 6: Approval Manager - Create Approval Request
 # ============================================================================
 
-@patch('human_intervention.approval_manager.get_db_connection')
-@patch('human_intervention.approval_manager.close_db_connection')
-def test_approval_manager_create_request(mock_close, mock_get_conn):
+def test_approval_manager_create_request(mock_db_conn):
     """Test creating an approval request"""
-    # Mock database connection
-    mock_conn = MagicMock()
-    mock_cursor = MagicMock()
-    mock_conn.cursor.return_value = mock_cursor
+    _, mock_cursor = mock_db_conn
     mock_cursor.lastrowid = 1
-    mock_get_conn.return_value = mock_conn
+    mock_cursor.fetchone.return_value = (1,)
 
     manager = ApprovalManager()
 
@@ -221,41 +241,28 @@ def test_approval_manager_create_request(mock_close, mock_get_conn):
 # TEST CASE 7: Approval Manager - Get Pending Requests
 # ============================================================================
 
-@patch('human_intervention.approval_manager.get_db_connection')
-@patch('human_intervention.approval_manager.close_db_connection')
-def test_approval_manager_get_pending_requests(mock_close, mock_get_conn):
+def test_approval_manager_get_pending_requests(mock_db_conn):
     """Test retrieving pending approval requests"""
-    # Mock database connection
-    mock_conn = MagicMock()
-    mock_cursor = MagicMock()
-    mock_conn.cursor.return_value = mock_cursor
+    mock_conn, mock_cursor = mock_db_conn
     mock_conn.row_factory = sqlite3.Row
-    mock_cursor.fetchall.return_value = [
+    mock_cursor.__iter__.return_value = iter([
         {"id": 1, "student_id": "STU001", "decision_type": "assessment", "status": "pending"},
         {"id": 2, "student_id": "STU002", "decision_type": "recommendation", "status": "pending"}
-    ]
-    mock_get_conn.return_value = mock_conn
+    ])
 
     manager = ApprovalManager()
     pending = manager.get_pending_requests()
 
     assert isinstance(pending, list), "Should return a list"
+    assert len(pending) == 2, "Should return every pending request"
 
 
 # ============================================================================
 # TEST CASE 8: Feedback Handler - Submit Feedback
 # ============================================================================
 
-@patch('human_intervention.feedback_handler.get_db_connection')
-@patch('human_intervention.feedback_handler.close_db_connection')
-def test_feedback_handler_submit_feedback(mock_close, mock_get_conn):
+def test_feedback_handler_submit_feedback(mock_db_conn):
     """Test submitting feedback for recommendations"""
-    # Mock database connection
-    mock_conn = MagicMock()
-    mock_cursor = MagicMock()
-    mock_conn.cursor.return_value = mock_cursor
-    mock_get_conn.return_value = mock_conn
-
     handler = FeedbackHandler()
 
     result = handler.submit_feedback(
@@ -273,18 +280,12 @@ def test_feedback_handler_submit_feedback(mock_close, mock_get_conn):
 # TEST CASE 9: Feedback Handler - Get Average Rating
 # ============================================================================
 
-@patch('human_intervention.feedback_handler.get_db_connection')
-@patch('human_intervention.feedback_handler.close_db_connection')
-def test_feedback_handler_get_average_rating(mock_close, mock_get_conn):
+def test_feedback_handler_get_average_rating(mock_db_conn):
     """Test calculating average rating for recommendations"""
-    # Mock database connection
-    mock_conn = MagicMock()
-    mock_cursor = MagicMock()
-    mock_conn.cursor.return_value = mock_cursor
+    _, mock_cursor = mock_db_conn
 
     # First call returns average rating
-    mock_cursor.fetchone.return_value = {"avg_rating": 4.0}
-    mock_get_conn.return_value = mock_conn
+    mock_cursor.fetchone.return_value = {"avg_rating": 4.0, "rating_count": 2}
 
     handler = FeedbackHandler()
     avg_rating = handler.get_average_rating("REC001")
@@ -312,6 +313,623 @@ def test_logger_setup():
     assert default_logger.name == "education_intelligence", "Default logger name should be set"
 
 
+# ============================================================================
+# TEST CASE 11: LLM Response Cache
+# ============================================================================
+
+def test_llm_cache_exact_hit(tmp_path, sample_student_data):
+    """Test LLM cache returns stored content for equivalent student data"""
+    from agents._llm_cache import LLMCache
+
+    cache = LLMCache(directory=str(tmp_path), ttl_seconds=60, similarity_threshold=0.92, semantic=False)
+    cache.set("assessment", sample_student_data, "Cached analysis")
+
+    reordered = dict(reversed(list(sample_student_data.items())))
+    assert cache.get("assessment", reordered) == "Cached analysis"
+    assert cache.get("progress", sample_student_data) is None
+
+
+def test_llm_cache_skips_repeat_agent_call(tmp_path, sample_student_data):
+    """Test cached agent methods only call the model once for identical input"""
+    from agents._llm_cache import LLMCache
+    from agents.assessment_agent import get_assessment_agent
+
+    assessment_agent = get_assessment_agent()
+
+    cache = LLMCache(directory=str(tmp_path), ttl_seconds=60, similarity_threshold=0.92, semantic=False)
+    with patch("agents._llm_cache.llm_cache", cache), \
+            patch.object(assessment_agent, "run", return_value=Mock(content="Fresh analysis")) as mock_run:
+        first = assessment_agent.assess_student(sample_student_data)
+        second = assessment_agent.assess_student(sample_student_data)
+
+    assert first == second == {"status": "success", "analysis": "Fresh analysis"}
+    assert mock_run.call_count == 1
+
+
+def test_cached_stream_replays_completed_stream(tmp_path, sample_student_data):
+    """Test streamed responses are cached once complete and replayed on repeat"""
+    import asyncio
+    from agents._llm_cache import LLMCache, cached_stream
+
+    calls = []
+
+    async def fake_stream():
+        calls.append(1)
+        for chunk in ("Fresh ", "analysis"):
+            yield chunk
+
+    async def collect():
+        return [chunk async for chunk in cached_stream("assessment", sample_student_data, fake_stream)]
+
+    cache = LLMCache(directory=str(tmp_path), ttl_seconds=60, similarity_threshold=0.92, semantic=False)
+    with patch("agents._llm_cache.llm_cache", cache):
+        first = asyncio.run(collect())
+        second = asyncio.run(collect())
+
+    assert first == ["Fresh ", "analysis"]
+    assert second == ["Fresh analysis"]
+    assert len(calls) == 1
+
+
+def test_llm_cache_semantic_index_stays_bounded(tmp_path, sample_student_data):
+    """Test the semantic tier skips duplicates, drops expired and excess entries, and misses on stale keys"""
+    faiss = pytest.importorskip("faiss")
+    np = pytest.importorskip("numpy")
+    from agents._llm_cache import LLMCache
+
+    def vector(seed):
+        v = np.random.default_rng(seed).random((1, 8), dtype=np.float32)
+        return v / np.linalg.norm(v)
+
+    def student(i):
+        return {**sample_student_data, "weak_areas": f"Topic {i}"}
+
+    with patch("agents._llm_cache.faiss", faiss), patch("agents._llm_cache.np", np):
+        cache = LLMCache(directory=str(tmp_path), ttl_seconds=60, similarity_threshold=0.92, max_index_entries=4)
+
+        cache.set("assessment", student(0), "First", vector=vector(0))
+        cache.set("assessment", student(0), "First again", vector=vector(0))
+        assert cache._indexes["assessment"].ntotal == 1, "Re-setting a key must not add a duplicate vector"
+
+        for i in range(1, 6):
+            cache.set("assessment", student(i), f"Analysis {i}", vector=vector(i))
+        assert cache._indexes["assessment"].ntotal <= 4
+        assert cache.get("assessment", student(99), vector=vector(5)) == "Analysis 5"
+
+        with patch("agents._llm_cache.time.monotonic", return_value=time.monotonic() + 120):
+            cache.set("assessment", student(6), "Fresh", vector=vector(6))
+        assert cache._index_keys["assessment"] == [cache.make_key("assessment", student(6))]
+
+        # Drop the exact payload, as diskcache does when an entry expires
+        stale_key = cache.make_key("assessment", student(6))
+        store = cache._get_store()
+        if store is not None:
+            store.delete(stale_key)
+        else:
+            cache._memory.pop(stale_key)
+        assert cache.get("assessment", student(99), vector=vector(6)) is None, "Stale semantic hits are misses"
+
+
+def test_llm_cache_semantic_hit_requires_matching_identity(tmp_path, sample_student_data):
+    """Test a near-identical record with different scores misses instead of reusing another analysis"""
+    faiss = pytest.importorskip("faiss")
+    np = pytest.importorskip("numpy")
+    from agents._llm_cache import LLMCache, canonical_text
+
+    first = {**sample_student_data, "student_name": "Ada", "questions_count": 10, "correct_answers": 9}
+    second = {**first, "student_name": "Ben", "correct_answers": 4}
+    reworded = {**first, "weak_areas": "integration by parts"}
+    assert canonical_text(first) == canonical_text(second), "Names and scores are not embedded"
+
+    shared_vector = np.ones((1, 8), dtype=np.float32) / np.sqrt(8)
+    with patch("agents._llm_cache.faiss", faiss), patch("agents._llm_cache.np", np):
+        cache = LLMCache(directory=str(tmp_path), ttl_seconds=60, similarity_threshold=0.92)
+        cache.set("assessment", first, "Ada scored 9/10", vector=shared_vector)
+
+        assert cache.get("assessment", second, vector=shared_vector) is None
+        assert cache.get("assessment", reworded, vector=shared_vector) == "Ada scored 9/10"
+
+
+# ============================================================================
+# TEST CASE 12: Batch Assessment Parsing
+# ============================================================================
+
+def test_assess_students_batch_preserves_order():
+    """Test batch assessment maps one JSON array entry to each student in order"""
+    import json
+    from agents.assessment_agent import get_assessment_agent
+
+    assessment_agent = get_assessment_agent()
+
+    students = [{"student_name": "Alice"}, {"student_name": "Bob"}]
+    content = "```json\n" + json.dumps([
+        {"student_name": "Alice", "skill_level": "Advanced", "summary": "A"},
+        {"student_name": "Bob", "skill_level": "Beginner", "summary": "B"}
+    ]) + "\n```"
+
+    with patch.object(assessment_agent, "run", return_value=Mock(content=content)):
+        results = assessment_agent.assess_students_batch(students)
+
+    assert [r["skill_level"] for r in results] == ["Advanced", "Beginner"]
+    assert [r["analysis"] for r in results] == ["A", "B"]
+
+    with patch.object(assessment_agent, "run", return_value=Mock(content="[]")):
+        results = assessment_agent.assess_students_batch(students)
+
+    assert [r["status"] for r in results] == ["error", "error"]
+
+
+# ============================================================================
+# TEST CASE 13: Gemini Context Cache
+# ============================================================================
+
+def test_cached_instruction_gemini_omits_system_instruction():
+    """Test the inline system instruction is dropped once a context cache is attached"""
+    from agents._context_cache import CachedInstructionGemini
+
+    model = CachedInstructionGemini(id="gemini-2.0-flash", api_key="test_api_key_12345")
+    assert model.get_request_params(system_message="Be helpful")["config"].system_instruction == "Be helpful"
+
+    model.cached_content = "cachedContents/test"
+    config = model.get_request_params(system_message="Be helpful")["config"]
+    assert config.system_instruction is None
+    assert config.cached_content == "cachedContents/test"
+
+
+# ============================================================================
+# TEST CASE 14: Gemini Key Pool Failover
+# ============================================================================
+
+def test_pooled_gemini_fails_over_on_rate_limit():
+    """Test a rate-limited key is cooled down and the call retried on another key"""
+    from agno.exceptions import ModelProviderError
+    from agno.models.google.gemini import Gemini
+    from agents._pool import GeminiPool, PooledGemini
+
+    def fake_invoke(model, *args, **kwargs):
+        if model.api_key == "primary_key":
+            raise ModelProviderError(message="Resource exhausted", status_code=429)
+        return f"served by {model.api_key}"
+
+    pool = GeminiPool(["primary_key", "secondary_key"], cooldown_seconds=30)
+    model = PooledGemini(id="gemini-2.0-flash", api_key="primary_key")
+
+    with patch("agents._pool.gemini_pool", pool), \
+            patch.object(Gemini, "invoke", autospec=True, side_effect=fake_invoke):
+        assert model.invoke([], Mock()) == "served by secondary_key"
+        assert pool.acquire().api_key == "secondary_key"
+
+    assert pool.endpoints[0].cooldown_until > 0
+    assert pool.endpoints[0].inflight == 0
+
+
+def test_pooled_gemini_caps_concurrent_calls_per_key():
+    """Test async calls never exceed a key's concurrency limit"""
+    import asyncio
+    from agno.models.google.gemini import Gemini
+    from agents._pool import GeminiPool, PooledGemini
+
+    active = []
+    peak = []
+
+    async def fake_ainvoke(model, *args, **kwargs):
+        active.append(1)
+        peak.append(len(active))
+        await asyncio.sleep(0.01)
+        active.pop()
+        return "ok"
+
+    async def run_calls():
+        return await asyncio.gather(*(model.ainvoke([], Mock()) for _ in range(6)))
+
+    pool = GeminiPool(["primary_key"], cooldown_seconds=30, concurrency_limit=2)
+    model = PooledGemini(id="gemini-2.0-flash", api_key="primary_key")
+
+    with patch("agents._pool.gemini_pool", pool), \
+            patch.object(Gemini, "ainvoke", autospec=True, side_effect=fake_ainvoke):
+        assert asyncio.run(run_calls()) == ["ok"] * 6
+
+    assert max(peak) == 2
+    assert pool.endpoints[0].inflight == 0
+
+
+# ============================================================================
+# TEST CASE 15: Student Data Schema
+# ============================================================================
+
+def test_student_data_defaults_and_validation():
+    """Test prompt fields fall back to defaults and malformed input is rejected before the model call"""
+    from pydantic import ValidationError
+    from agents._schemas import StudentData
+    from agents.assessment_agent import get_assessment_agent
+
+    student = StudentData.model_validate({"student_name": "Ada", "unknown_field": "ignored"})
+    assert student.student_name == "Ada"
+    assert student.questions_count == 10
+    assert student.weak_areas == "N/A"
+
+    with pytest.raises(ValidationError):
+        StudentData.model_validate({"questions_count": "many"})
+
+    assessment_agent = get_assessment_agent()
+    with patch("agents._llm_cache.settings.LLM_CACHE_ENABLED", False), \
+            patch.object(assessment_agent, "run") as mock_run:
+        result = assessment_agent.assess_student({"questions_count": "many"})
+
+    assert result["status"] == "error"
+    mock_run.assert_not_called()
+
+
+# ============================================================================
+# TEST CASE 16: Shared Gemini Transport
+# ============================================================================
+
+def test_shared_transport_reused_across_event_loops():
+    """Test agent models share one HTTP pool that works across asyncio.run calls"""
+    import asyncio
+    import httpx
+    from agents._transport import LoopLocalAsyncClient, shared_async_http
+    from agents.progress_agent import get_progress_agent
+
+    http_options = get_progress_agent().model.client_params["http_options"]
+    assert http_options["httpx_async_client"] is shared_async_http
+
+    client = LoopLocalAsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, text="ok")))
+    loop_clients = []
+
+    async def fetch():
+        text = (await client.get("http://gemini.test/")).text
+        loop_clients.append(client._loop_clients[asyncio.get_running_loop()][0])
+        return text
+
+    assert asyncio.run(fetch()) == "ok"
+    assert asyncio.run(fetch()) == "ok"
+    assert loop_clients[0] is not loop_clients[1]
+    assert all(loop_client.is_closed for loop_client in loop_clients), "Each loop's pool closes with its loop"
+    assert not isinstance(client._transport, httpx.AsyncHTTPTransport), "The outer client opens no pool itself"
+
+
+# ============================================================================
+# TEST CASE 17: Database Connection Pragmas
+# ============================================================================
+
+def test_db_connection_enables_wal(tmp_path):
+    """Test file databases are switched to WAL with a busy timeout"""
+    with patch("utils.database.settings.DB_FILE", str(tmp_path / "education.db")):
+        connection = get_db_connection()
+        try:
+            assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            assert connection.execute("PRAGMA busy_timeout").fetchone()[0] == 5000
+        finally:
+            close_db_connection(connection)
+
+
+# ============================================================================
+# TEST CASE 18: Database Connection Pool
+# ============================================================================
+
+def test_db_connection_pool_reuses_clean_connections(tmp_path):
+    """Test released connections are reused with uncommitted work rolled back"""
+    import queue
+    from utils.database import ConnectionPool
+
+    pool = ConnectionPool(str(tmp_path / "pool.db"), max_size=1, timeout=0.1)
+    with pool.connection() as connection:
+        connection.execute("CREATE TABLE notes (body TEXT)")
+        connection.commit()
+        connection.execute("INSERT INTO notes VALUES ('draft')")
+
+    with pool.connection() as reused:
+        assert reused is connection
+        assert reused.execute("SELECT COUNT(*) FROM notes").fetchone()[0] == 0
+
+        # The only connection is checked out, so a second caller times out
+        with pytest.raises(queue.Empty):
+            pool.acquire()
+
+
+# ============================================================================
+# TEST CASE 19: Database Schema Bootstrap
+# ============================================================================
+
+def test_approval_manager_on_fresh_database(tmp_path):
+    """Test the schema exists before the first write, so reads on a new database succeed"""
+    with patch("utils.database.settings.DB_FILE", str(tmp_path / "fresh.db")):
+        manager = ApprovalManager()
+        assert manager.get_pending_requests() == []
+
+        request_id = manager.create_approval_request("STU001", "learning_path", {"path": "Algebra"})
+        pending = manager.get_pending_requests()
+
+    assert [row["id"] for row in pending] == [int(request_id)]
+
+
+# ============================================================================
+# TEST CASE 20: Bulk Approval and Feedback
+# ============================================================================
+
+def test_bulk_approve_and_feedback(tmp_path):
+    """Test bulk approvals and feedback are written in one call each"""
+    with patch("utils.database.settings.DB_FILE", str(tmp_path / "bulk.db")):
+        manager = ApprovalManager()
+        request_ids = [
+            manager.create_approval_request(f"STU00{i}", "learning_path", {"path": "Algebra"})
+            for i in range(3)
+        ]
+        updated = manager.approve_requests_bulk(request_ids[:2], reviewer_id="REV001")
+
+        handler = FeedbackHandler()
+        stored = handler.submit_feedback_bulk([
+            {"student_id": "STU001", "recommendation_id": "REC001", "feedback_type": "positive", "rating": 5},
+            {"student_id": "STU002", "recommendation_id": "REC001", "feedback_type": "negative", "rating": 3},
+            {"student_id": "STU003", "recommendation_id": "REC001", "feedback_type": "unsure", "rating": 1}
+        ])
+
+        assert updated == 2
+        assert [row["id"] for row in manager.get_pending_requests()] == [int(request_ids[2])]
+        assert manager.get_request_status(request_ids[0])["status"] == "approved"
+        assert stored == 2
+        assert handler.get_average_rating("REC001") == 4.0
+
+
+@pytest.mark.parametrize("count", [1, 1000])
+def test_bulk_create_approvals_and_feedback(tmp_path, count):
+    """Test bulk inserts store every row in one transaction"""
+    with patch("utils.database.settings.DB_FILE", str(tmp_path / "bulk_insert.db")):
+        manager = ApprovalManager()
+        created = manager.create_approval_requests_bulk([
+            {"student_id": f"STU{i:04d}", "decision_type": "learning_path", "decision_data": {"step": i}}
+            for i in range(count)
+        ])
+
+        handler = FeedbackHandler()
+        stored = handler.submit_feedback_bulk([
+            {"student_id": f"STU{i:04d}", "recommendation_id": "REC001", "feedback_type": "positive", "rating": 4}
+            for i in range(count)
+        ])
+
+        assert created == count
+        assert len(manager.get_pending_requests()) == count
+        assert stored == count
+        assert handler.get_average_rating("REC001") == 4.0
+
+
+# ============================================================================
+# TEST CASE 21: Query Cache
+# ============================================================================
+
+def test_query_cache_serves_repeats_until_write(tmp_path):
+    """Test repeated dashboard reads hit the cache and writes invalidate it"""
+    with patch("utils.database.settings.DB_FILE", str(tmp_path / "cache.db")):
+        manager = ApprovalManager()
+        handler = FeedbackHandler()
+        manager.create_approval_request("STU001", "learning_path", {"path": "Algebra"})
+        handler.submit_feedback("STU001", "REC001", "positive", "Helpful", rating=5)
+
+        with patch("human_intervention.approval_manager.get_db_connection", wraps=get_db_connection) as pending_conn, \
+                patch("human_intervention.feedback_handler.get_db_connection", wraps=get_db_connection) as rating_conn:
+            assert len(manager.get_pending_requests()) == len(manager.get_pending_requests()) == 1
+            assert handler.get_average_rating("REC001") == handler.get_average_rating("REC001") == 5.0
+            assert pending_conn.call_count == rating_conn.call_count == 1
+
+        manager.get_pending_requests()[0]["status"] = "approved"
+        assert manager.get_pending_requests()[0]["status"] == "pending", "Cached rows must not be shared"
+
+        manager.create_approval_request("STU002", "learning_path", {"path": "Geometry"})
+        handler.submit_feedback("STU002", "REC001", "negative", "Too fast", rating=3)
+
+        assert len(manager.get_pending_requests()) == 2
+        assert handler.get_average_rating("REC001") == 4.0
+
+
+def test_feedback_handler_average_rating_of_zero(tmp_path):
+    """Test a zero average is returned as a rating, and no ratings as None"""
+    with patch("utils.database.settings.DB_FILE", str(tmp_path / "ratings.db")):
+        handler = FeedbackHandler()
+        handler.submit_feedback("STU001", "REC001", "negative", "Not useful", rating=0)
+        handler.submit_feedback("STU001", "REC002", "neutral", "No rating given")
+
+        assert handler.get_average_rating("REC001") == 0.0
+        assert handler.get_average_rating("REC002") is None
+
+
+# ============================================================================
+# TEST CASE 22: Batched Query Execution
+# ============================================================================
+
+def test_execute_query_batches_commits(tmp_path):
+    """Test executemany and deferred commits on a caller-owned connection"""
+    from utils.database import execute_query
+
+    with patch("utils.database.settings.DB_FILE", str(tmp_path / "batch.db")):
+        execute_query("CREATE TABLE scores (student_id TEXT, score INTEGER)")
+
+        connection = get_db_connection()
+        try:
+            execute_query(
+                "INSERT INTO scores VALUES (?, ?)",
+                [("STU001", 90), ("STU002", 75)],
+                many=True, commit=False, connection=connection
+            )
+            execute_query("INSERT INTO scores VALUES (?, ?)", ("STU003", 60), commit=False, connection=connection)
+            connection.commit()
+        finally:
+            close_db_connection(connection)
+
+        rows = execute_query("SELECT COUNT(*) FROM scores")
+
+        with pytest.raises(ValueError):
+            execute_query("INSERT INTO scores VALUES (?, ?)", ("STU004", 50), commit=False)
+
+    assert rows[0][0] == 3
+
+
+# ============================================================================
+# TEST CASE 23: Batch Assessment Score Validation
+# ============================================================================
+
+def test_validate_assessment_batch_matches_scalar_validator():
+    """Test the batch score mask agrees with the single-assessment range check"""
+    from utils.validators import validate_assessment_batch
+
+    scores = [0, 85, 100, 100.5, -1, None, "90", float("nan")]
+    assessments = [{"student_id": "STU001", "subject": "Math", "score": score} for score in scores]
+
+    mask = validate_assessment_batch(assessments)
+
+    assert [bool(valid) for valid in mask] == [True, True, True, False, False, False, False, False]
+
+
+# ============================================================================
+# TEST CASE 24: Email Validation
+# ============================================================================
+
+def test_validate_emails(sample_student_data):
+    """Test malformed emails fail student validation and bulk checks flag each address"""
+    from utils.validators import validate_emails
+
+    assert validate_student_data({**sample_student_data, "email": "john.example.com"}) is False
+    assert validate_emails(["john@example.com", "jane@", "a b@example.com", None, "ada@school.edu"]) == [
+        True, False, False, False, True
+    ]
+
+
+# ============================================================================
+# TEST CASE 25: Streamlit Agent Call Cache
+# ============================================================================
+
+@pytest.mark.parametrize("operation,method", [
+    ("recommendations", "get_recommendations"),
+    ("learning_path", "get_learning_path"),
+    ("progress", "get_progress")
+])
+def test_call_agent_does_not_cache_orchestrator_errors(operation, method):
+    """Test an orchestrator error is returned as an error and retried on the next call"""
+    streamlit_ui = pytest.importorskip("streamlit_ui")
+    orchestrator = Mock()
+    getattr(orchestrator, method).return_value = {"status": "error", "error": "quota exceeded"}
+    data = {"student_name": "Uncached Student", "subject": "Mathematics"}
+
+    with patch.object(streamlit_ui, "get_orchestrator", return_value=orchestrator):
+        first = streamlit_ui.call_agent(operation, data)
+        second = streamlit_ui.call_agent(operation, data)
+
+    assert first == {"status": "error", "message": "quota exceeded"}
+    assert second["status"] == "error"
+    assert getattr(orchestrator, method).call_count == 2, "Errors must not be served from the cache"
+
+
+# ============================================================================
+# TEST CASE 26: Streaming API Endpoints
+# ============================================================================
+
+STREAM_ENDPOINTS = [
+    ("/assess/stream", "agents.assessment_agent"),
+    ("/learning-path/stream", "agents.learning_path_agent"),
+    ("/progress/stream", "agents.progress_agent"),
+    ("/recommendations/stream", "agents.recommendation_agent")
+]
+
+
+def _post_stream(endpoint, module, fake_stream, sample_student_data):
+    """POST to a streaming endpoint with the model stream replaced by fake_stream"""
+    from fastapi.testclient import TestClient
+    from api.main import app
+    from agents.orchestrator import orchestrator
+    from config import settings
+
+    with patch(f"{module}.stream_content", fake_stream), \
+            patch.object(settings, "LLM_CACHE_ENABLED", False), \
+            patch.object(orchestrator, "_embed", return_value=None):
+        return TestClient(app).post(endpoint, json=sample_student_data).text
+
+
+@pytest.mark.parametrize("endpoint,module", STREAM_ENDPOINTS)
+def test_stream_endpoint_ends_with_done(endpoint, module, sample_student_data):
+    """Test streamed content is framed as SSE data and ends with a done event"""
+    async def fake_stream(agent, prompt):
+        for chunk in ("Fresh\nanalysis", " complete"):
+            yield chunk
+
+    body = _post_stream(endpoint, module, fake_stream, sample_student_data)
+
+    assert body == "data: Fresh\ndata: analysis\n\ndata:  complete\n\nevent: done\ndata: \n\n"
+
+
+@pytest.mark.parametrize("endpoint,module", STREAM_ENDPOINTS)
+def test_stream_endpoint_reports_errors(endpoint, module, sample_student_data):
+    """Test a failure mid-stream ends with an error event instead of done"""
+    async def fake_stream(agent, prompt):
+        yield "Partial"
+        raise RuntimeError("quota exceeded")
+
+    body = _post_stream(endpoint, module, fake_stream, sample_student_data)
+
+    assert body == "data: Partial\n\nevent: error\ndata: quota exceeded\n\n"
+    assert "event: done" not in body
+
+
+# ============================================================================
+# TEST CASE 27: Agno Session Table Index
+# ============================================================================
+
+def test_session_index_created_with_session_table(tmp_path):
+    """Test the session index is added in the process that creates the session table"""
+    from agents._db import IndexedSqliteDb
+
+    db_file = str(tmp_path / "agno.db")
+    db = IndexedSqliteDb(db_file=db_file)
+    with db.db_engine.connect():
+        pass  # A pooled connection opened before the table exists
+
+    assert db._get_table(table_type="sessions", create_table_if_not_found=True) is not None
+
+    conn = sqlite3.connect(db_file)
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    conn.close()
+    assert "ix_sessions_agent_time" in indexes
+
+
+# ============================================================================
+# TEST CASE 28: Local Skill Classification
+# ============================================================================
+
+@pytest.mark.parametrize("correct,total,difficulty,level", [
+    (4, 10, "intermediate", "Beginner"),
+    (5, 10, "intermediate", "Intermediate"),  # 0.5 opens the Intermediate band
+    (7, 10, "intermediate", "Intermediate"),
+    (8, 10, "intermediate", "Advanced"),  # 0.8 opens the Advanced band
+    (5, 10, "beginner", "Beginner"),  # easy questions weigh accuracy down
+    (0, 100, "intermediate", "Beginner"),
+    (100, 100, "intermediate", "Advanced")
+])
+def test_classify_skill_bands(correct, total, difficulty, level):
+    """Test accuracy maps to the skill band whose edges bound it"""
+    from agents._heuristics import classify_skill
+
+    assert classify_skill(correct, total, difficulty)[0] == level
+
+
+@pytest.mark.parametrize("correct,total", [(1, 1), (2, 2), (3, 3), (9, 10), (5, 10), (8, 10)])
+def test_classify_skill_uncertain_cases_stay_below_bypass(correct, total):
+    """Test few questions or scores on a band edge never clear the bypass confidence"""
+    from agents._heuristics import classify_skill
+    from config import settings
+
+    _, confidence = classify_skill(correct, total)
+    assert 0.0 <= confidence < settings.SKILL_BYPASS_CONFIDENCE
+
+
+def test_classify_skill_clear_and_empty_cases():
+    """Test many decisive answers give near-certain confidence and no questions give none"""
+    from agents._heuristics import classify_skill
+    from config import settings
+
+    assert classify_skill(100, 100)[1] > settings.SKILL_BYPASS_CONFIDENCE
+    assert classify_skill(0, 0) == ("Intermediate", 0.0)
+    assert classify_skill(12, 10) == classify_skill(10, 10), "Correct answers are clamped to the total"
+
+
 # ============================================================================
 # INTEGRATION TESTS (Optional bonus tests)
 # ============================================================================
@@ -343,6 +961,200 @@ class TestEducationOrchestrator:
             assert result is not None
             assert "skill_level" in result
 
+    @pytest.mark.integration
+    def test_orchestrator_full_analysis(self, sample_student_data):
+        """Test full analysis fans out to all four agents"""
+        from agents.orchestrator import EducationOrchestrator
+
+        orchestrator = EducationOrchestrator()
+        agent_result = {"status": "success", "analysis": "Looks good"}
+
+        with patch.object(orchestrator, "_embed", return_value="student_vec") as mock_embed, \
+                patch.object(orchestrator.assessment_agent, "aassess_student", AsyncMock(return_value=agent_result)) as mock_assess, \
+                patch.object(orchestrator.progress_agent, "aanalyze_progress", AsyncMock(return_value=agent_result)), \
+                patch.object(orchestrator.learning_path_agent, "arecommend_learning_path", AsyncMock(return_value=agent_result)), \
+                patch.object(orchestrator.recommendation_agent, "aget_recommendations", AsyncMock(return_value=agent_result)) as mock_recs:
+            result = orchestrator.full_analysis(sample_student_data)
+
+        assert result["status"] == "success"
+        assert result["assessment"]["assessment"]["final_summary"] == "Looks good"
+        for section in ("progress", "learning_path", "recommendations"):
+            assert result[section] == agent_result
+
+        # The embedding is computed once and shared by every agent's cache lookup
+        mock_embed.assert_called_once_with(sample_student_data)
+        mock_assess.assert_awaited_once_with(sample_student_data, student_vec="student_vec")
+        mock_recs.assert_awaited_once_with(sample_student_data, student_vec="student_vec")
+
+    @pytest.mark.integration
+    def test_orchestrator_assess_student_bypasses_clear_cases(self, sample_student_data):
+        """Test clear-cut accuracy is classified locally unless detailed analysis is requested"""
+        from agents.orchestrator import EducationOrchestrator
+
+        orchestrator = EducationOrchestrator()
+        agent_result = {"status": "success", "skill_level": "Advanced", "analysis": "Looks good"}
+        clear_cut = {**sample_student_data, "questions_count": 20, "correct_answers": 19}
+        borderline = {**sample_student_data, "questions_count": 20, "correct_answers": 16}
+
+        with patch.object(orchestrator, "_embed", return_value=None), \
+                patch.object(orchestrator.assessment_agent, "assess_student", return_value=agent_result) as mock_assess:
+            local = orchestrator.assess_student(clear_cut)
+            mock_assess.assert_not_called()
+
+            orchestrator.assess_student(borderline)
+            orchestrator.assess_student(clear_cut, detailed=True)
+
+        assert local["status"] == "success"
+        assert local["assessment"]["skill_level"] == "Advanced"
+        assert local["assessment"]["overall_score"] == 95.0
+        assert mock_assess.call_count == 2
+
+    @pytest.mark.integration
+    def test_orchestrator_submit_assessment(self, sample_student_data):
+        """Test submitted assessments return the score first and the analysis later"""
+        import asyncio
+        from agents.orchestrator import EducationOrchestrator
+
+        orchestrator = EducationOrchestrator()
+        agent_result = {"status": "success", "analysis": "Looks good"}
+
+        student_data = {**sample_student_data, "questions_count": 20, "correct_answers": 17}
+
+        async def submit_and_wait():
+            submitted = await orchestrator.submit_assessment(student_data)
+            pending = orchestrator.get_assessment_job(submitted["job_id"])
+            await asyncio.gather(*orchestrator._background_tasks)
+            return submitted, pending
+
+        with patch.object(orchestrator.assessment_agent, "aassess_student", AsyncMock(return_value=agent_result)):
+            submitted, pending = asyncio.run(submit_and_wait())
+
+        assert submitted["status"] == pending["status"] == "pending"
+        assert submitted["partial"]["overall_score"] == 85.0
+        completed = orchestrator.get_assessment_job(submitted["job_id"])
+        assert completed["assessment"]["final_summary"] == "Looks good"
+
+    @pytest.mark.integration
+    def test_orchestrator_bulk_assess_resumes_from_checkpoint(self, tmp_path):
+        """Test bulk assessment skips students already in the checkpoint file"""
+        import json
+        from agents.orchestrator import EducationOrchestrator
+
+        orchestrator = EducationOrchestrator()
+        checkpoint = tmp_path / "bulk.jsonl"
+        done = {"status": "success", "assessment": {"student_name": "Ada"}}
+        checkpoint.write_text(json.dumps({"student_id": "STU001", **done}) + "\n")
+
+        students = [
+            {"student_id": "STU001", "student_name": "Ada", "questions_count": 10, "correct_answers": 9},
+            {"student_id": "STU002", "student_name": "Ben", "questions_count": 10, "correct_answers": 6}
+        ]
+        batch = AsyncMock(return_value=[{"status": "success", "analysis": "Ben analysis"}])
+
+        with patch.object(orchestrator.assessment_agent, "aassess_students_batch", batch), \
+                patch("agents.orchestrator.os.fsync") as mock_fsync:
+            results = orchestrator.bulk_assess(students, output_jsonl=str(checkpoint), fsync_every=1)
+
+        batch.assert_awaited_once_with([students[1]])
+        assert mock_fsync.call_count == 2, "fsync_every=1 syncs after the batch as well as on close"
+        assert results[0] == done
+        assert results[1]["assessment"]["final_summary"] == "Ben analysis"
+        lines = checkpoint.read_text().splitlines()
+        assert [json.loads(line)["student_id"] for line in lines] == ["STU001", "STU002"]
+
+    @pytest.mark.integration
+    def test_orchestrator_get_combined_from_cache(self, tmp_path, sample_student_data):
+        """Test composite queries are answered from cached sections without agent calls"""
+        from agents._llm_cache import LLMCache
+        from agents.orchestrator import EducationOrchestrator
+
+        orchestrator = EducationOrchestrator()
+        cache = LLMCache(directory=str(tmp_path), ttl_seconds=60, similarity_threshold=0.92, semantic=False)
+        cache.set("learning_path", sample_student_data, "Cached path")
+        cache.set("recommendations", sample_student_data, "Cached recommendations")
+
+        with patch("agents._llm_cache.llm_cache", cache), \
+                patch.object(orchestrator.learning_path_agent, "arecommend_learning_path", AsyncMock()) as mock_path, \
+                patch.object(orchestrator.recommendation_agent, "aget_recommendations", AsyncMock()) as mock_recs:
+            result = orchestrator.get_combined(sample_student_data)
+
+        assert result["status"] == "success"
+        assert result["source"] == "cache"
+        assert "Cached path" in result["analysis"] and "Cached recommendations" in result["analysis"]
+        mock_path.assert_not_called()
+        mock_recs.assert_not_called()
+
+    def test_orchestrator_combine_from_cache_never_mixes_students(self, tmp_path, sample_student_data):
+        """Test cached sections are not reused for other students or below the cache threshold"""
+        faiss = pytest.importorskip("faiss")
+        np = pytest.importorskip("numpy")
+        from agents._llm_cache import LLMCache
+        from agents.orchestrator import EducationOrchestrator
+        from config import settings
+
+        orchestrator = EducationOrchestrator()
+        ada = {**sample_student_data, "student_name": "Ada", "correct_answers": 9}
+        ben = {**ada, "student_name": "Ben", "correct_answers": 3}
+        stored = np.array([[1.0, 0.0]], dtype=np.float32)
+        close = np.array([[0.88, np.sqrt(1 - 0.88 ** 2)]], dtype=np.float32)
+
+        with patch("agents._llm_cache.faiss", faiss), patch("agents._llm_cache.np", np):
+            cache = LLMCache(directory=str(tmp_path), ttl_seconds=60, similarity_threshold=0.92)
+            for template_id in ("learning_path", "recommendations"):
+                cache.set(template_id, ada, f"Ada's {template_id}", vector=stored)
+
+            with patch("agents._llm_cache.llm_cache", cache), \
+                    patch.object(settings, "LLM_CACHE_SECTION_THRESHOLD", 0.5), \
+                    patch.object(settings, "LLM_CACHE_COMBINED_THRESHOLD", 1.0):
+                sections = ("learning_path", "recommendations")
+                assert orchestrator._combine_from_cache(ben, sections, stored) is None
+                reworded = {**ada, "weak_areas": "Integration"}
+                assert orchestrator._combine_from_cache(reworded, sections, close) is None
+                assert orchestrator._combine_from_cache(reworded, sections, stored) is not None
+
+    @pytest.mark.integration
+    def test_orchestrator_unified_analysis(self, sample_student_data):
+        """Test unified analysis parses one structured response into all sections"""
+        import json
+        from agents.orchestrator import EducationOrchestrator
+
+        orchestrator = EducationOrchestrator()
+        payload = {
+            "assessment": {"skill_level": "Advanced", "strengths": ["Algebra"], "weaknesses": [], "summary": "Strong"},
+            "progress": {"analysis": "Steady"},
+            "learning_path": {"analysis": "Week 1"},
+            "recommendations": {"analysis": "Next topic"}
+        }
+
+        with patch.object(orchestrator.unified_analysis_agent, "run", return_value=Mock(content=json.dumps(payload))):
+            result = orchestrator.unified_analysis(sample_student_data)
+
+        assert result["status"] == "success"
+        assert result["assessment"]["assessment"]["skill_level"] == "Advanced"
+        assert result["assessment"]["assessment"]["final_summary"] == "Strong"
+        assert result["learning_path"] == {"status": "success", "analysis": "Week 1"}
+
+    def test_orchestrator_unified_analysis_falls_back_inside_event_loop(self, sample_student_data):
+        """Test the unified analysis fallback degrades instead of raising under a running loop"""
+        import asyncio
+        from agents.orchestrator import EducationOrchestrator
+
+        orchestrator = EducationOrchestrator()
+        fallback = {"status": "success", "progress": {"status": "success", "analysis": "Per-agent"}}
+
+        async def run_both():
+            sync_result = orchestrator.unified_analysis(sample_student_data)
+            async_result = await orchestrator.aunified_analysis(sample_student_data)
+            return sync_result, async_result
+
+        with patch.object(orchestrator.unified_analysis_agent, "run", side_effect=RuntimeError("bad schema")), \
+                patch.object(orchestrator.unified_analysis_agent, "arun", side_effect=RuntimeError("bad schema")), \
+                patch.object(orchestrator, "afull_analysis", AsyncMock(return_value=fallback)) as mock_full:
+            sync_result, async_result = asyncio.run(run_both())
+
+        assert sync_result == async_result == fallback
+        assert mock_full.await_count == 2
+
 
 # ============================================================================
 # PARAMETRIZED TESTS FOR EDGE CASES
@@ -368,17 +1180,6 @@ def test_assessment_score_validation(score, is_valid):
     assert result == is_valid, f"Score {score} validation should be {is_valid}"
 
 
-# ============================================================================
-# FIXTURE CLEANUP
-# ============================================================================
-
-@pytest.fixture(autouse=True)
-def cleanup():
-    """Cleanup after each test"""
-    yield
-    # Add cleanup code here if needed
-
-
 # ============================================================================
 # PYTEST CONFIGURATION
 # ============================================================================
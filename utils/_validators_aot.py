@@ -0,0 +1,24 @@
+"""
+Ahead-of-time build of the batch score validator
+Run ``python -m utils._validators_aot`` to compile utils/validators_native,
+which then loads without any JIT compile on worker start
+"""
+
+import os
+import numpy as np
+from numba.pycc import CC
+
+cc = CC("validators_native")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+@cc.export("valid_score_mask", "boolean[:](float64[:])")
+def valid_score_mask(scores):
+    out = np.empty(scores.shape, np.bool_)
+    for i in range(scores.size):
+        out[i] = (scores[i] >= 0.0) & (scores[i] <= 100.0)
+    return out
+
+
+if __name__ == "__main__":
+    cc.compile()
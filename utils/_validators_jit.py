@@ -0,0 +1,26 @@
+"""
+JIT fallback for the batch score validator
+Used when the ahead-of-time build in utils.validators_native is not available
+"""
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None and np is not None:
+    # cache=True stores the compiled kernel in __pycache__, so only the first process pays the compile
+    @njit(parallel=True, cache=True)
+    def valid_score_mask(scores):
+        out = np.empty(scores.shape, np.bool_)
+        for i in prange(scores.size):
+            out[i] = (scores[i] >= 0.0) & (scores[i] <= 100.0)
+        return out
+else:
+    valid_score_mask = None
@@ -0,0 +1,99 @@
+"""
+Short-lived query cache for Education Intelligence System
+Absorbs repeated dashboard reads between writes
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Iterator, Tuple
+from config import settings
+
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
+# Returned by QueryCache.get on a miss, so that None results can be cached
+MISSING = object()
+
+
+class _TTLCache:
+    """Minimal stand-in for cachetools.TTLCache when it is not installed"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return default
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return default
+        return entry[1]
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.pop(key, None)
+        return default if entry is None else entry[1]
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._entries)
+
+
+class QueryCache:
+    """Thread-safe TTL cache keyed by tuples, with prefix invalidation"""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize query cache
+
+        Args:
+            maxsize: Maximum number of cached results
+            ttl: Seconds a result stays valid
+        """
+        cache_type = TTLCache if TTLCache is not None else _TTLCache
+        self._entries = cache_type(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple, default: Any = MISSING) -> Any:
+        """
+        Look up a cached result
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached result or default
+        """
+        with self._lock:
+            return self._entries.get(key, default)
+
+    def set(self, key: Tuple, value: Any) -> None:
+        """Cache a result under key"""
+        with self._lock:
+            self._entries[key] = value
+
+    def invalidate(self, *prefix: Hashable) -> None:
+        """
+        Drop every cached result whose key starts with prefix
+
+        Args:
+            *prefix: Leading key elements, e.g. ("pending", db_path)
+        """
+        size = len(prefix)
+        with self._lock:
+            for key in [key for key in self._entries if key[:size] == prefix]:
+                self._entries.pop(key, None)
+
+
+query_cache = QueryCache(settings.QUERY_CACHE_MAX_ENTRIES, settings.QUERY_CACHE_TTL_SECONDS)
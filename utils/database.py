@@ -1,28 +1,210 @@
 """
 Database utilities for Education Intelligence System
+Connections are pooled per process, so Streamlit reruns and API requests reuse them
 """
 
+import logging
+import queue
 import sqlite3
-from pathlib import Path
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
 from config import settings
 from .logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Connection-scoped settings, applied to every new connection
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
+
+# Tables used by the human intervention workflows, created when a connection is opened
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS approval_requests (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id TEXT NOT NULL,
+    decision_type TEXT NOT NULL,
+    decision_data TEXT NOT NULL,
+    status TEXT DEFAULT 'pending',
+    priority TEXT DEFAULT 'normal',
+    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+    reviewed_at DATETIME,
+    reviewer_id TEXT,
+    reviewer_comments TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_ar_status_prio ON approval_requests(status, priority, created_at);
+
+CREATE TABLE IF NOT EXISTS feedback (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id TEXT NOT NULL,
+    recommendation_id TEXT NOT NULL,
+    feedback_type TEXT NOT NULL,
+    comments TEXT,
+    rating INTEGER,
+    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_fb_student ON feedback(student_id, timestamp DESC);
+CREATE INDEX IF NOT EXISTS idx_fb_rec_rating ON feedback(recommendation_id, rating) WHERE rating IS NOT NULL;
+"""
+
+# WAL mode is stored in the database file, so it is only switched on once per path
+_wal_enabled = set()
+_wal_lock = threading.Lock()
+
+
+def _configure_connection(connection: sqlite3.Connection, db_path: str) -> None:
+    """
+    Apply concurrency pragmas to a new connection
+
+    Args:
+        connection: sqlite3 connection object
+        db_path: Database path the connection was opened with
+    """
+    for pragma in _CONNECTION_PRAGMAS:
+        connection.execute(pragma)
+
+    if db_path == ":memory:" or db_path in _wal_enabled:
+        return
+    with _wal_lock:
+        if db_path not in _wal_enabled:
+            connection.execute("PRAGMA journal_mode=WAL")
+            _wal_enabled.add(db_path)
+
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3 connection that remembers the pool it belongs to"""
+
+    pool: "ConnectionPool" = None
+
+
+class ConnectionPool:
+    """Bounded pool of reusable connections to one database file"""
+
+    def __init__(self, db_path: str, max_size: int, timeout: float):
+        """
+        Initialize pool
+
+        Args:
+            db_path: Database file path
+            max_size: Maximum number of open connections
+            timeout: Seconds to wait for a free connection when all are in use
+        """
+        self.db_path = db_path
+        self.max_size = max_size
+        self.timeout = timeout
+        self._idle: "queue.Queue[PooledConnection]" = queue.Queue(maxsize=max_size)
+        self._opened = 0
+        self._lock = threading.Lock()
+
+    def _open(self) -> PooledConnection:
+        """Open a new pooled connection and make sure the schema exists"""
+        connection = sqlite3.connect(
+            self.db_path,
+            factory=PooledConnection,
+            check_same_thread=False
+        )
+        connection.row_factory = sqlite3.Row
+        connection.pool = self
+        _configure_connection(connection, self.db_path)
+        # Each pooled connection is opened once, so the DDL stays off the query path;
+        # it must run per connection because every ':memory:' connection is its own database
+        connection.executescript(SCHEMA)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Connected to database: {self.db_path}")
+        return connection
+
+    def acquire(self) -> PooledConnection:
+        """
+        Take a connection from the pool, opening one while below capacity
+
+        Returns:
+            sqlite3 connection object; pass it to release() when done
+
+        Raises:
+            queue.Empty: If no connection frees up within the timeout
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_open = self._opened < self.max_size
+            if can_open:
+                self._opened += 1
+        if not can_open:
+            return self._idle.get(timeout=self.timeout)
+
+        try:
+            return self._open()
+        except Exception:
+            with self._lock:
+                self._opened -= 1
+            raise
+
+    def release(self, connection: PooledConnection) -> None:
+        """
+        Return a connection to the pool, discarding any uncommitted work
+
+        Args:
+            connection: Connection obtained from acquire()
+        """
+        try:
+            if connection.in_transaction:
+                connection.rollback()
+            self._idle.put_nowait(connection)
+        except (sqlite3.Error, queue.Full):
+            with self._lock:
+                self._opened -= 1
+            connection.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[PooledConnection]:
+        """Borrow a connection for the duration of a with block"""
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool() -> ConnectionPool:
+    """
+    Get the connection pool for the configured database
+
+    Returns:
+        ConnectionPool for settings.DB_FILE
+    """
+    db_path = settings.DB_FILE
+    pool = _pools.get(db_path)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.setdefault(
+                db_path,
+                ConnectionPool(db_path, settings.DB_POOL_SIZE, settings.DB_POOL_TIMEOUT_SECONDS)
+            )
+    return pool
+
 
 def get_db_connection():
     """
-    Get database connection
+    Get database connection from the pool
+
+    Every connection must be handed back with close_db_connection().
 
     Returns:
         sqlite3 connection object
     """
     try:
-        db_path = Path(settings.DB_FILE)
-        connection = sqlite3.connect(str(db_path))
-        connection.row_factory = sqlite3.Row
-        logger.info(f"Connected to database: {db_path}")
-        return connection
+        return get_pool().acquire()
     except Exception as e:
         logger.error(f"Database connection error: {e}")
         raise
@@ -30,39 +212,61 @@ def get_db_connection():
 
 def close_db_connection(connection):
     """
-    Close database connection safely
+    Return a database connection to its pool, or close it if it is not pooled
 
     Args:
         connection: sqlite3 connection object
     """
-    if connection:
+    if not connection:
+        return
+    if isinstance(connection, PooledConnection) and connection.pool is not None:
+        connection.pool.release(connection)
+    else:
         connection.close()
         logger.info("Database connection closed")
 
 
-def execute_query(query: str, params: tuple = None):
+def execute_query(query: str, params=None, many: bool = False, commit: bool = True, connection=None):
     """
     Execute a database query
 
     Args:
         query: SQL query string
-        params: Query parameters
+        params: Query parameters, or a sequence of parameter tuples when many is True
+        many: Run the statement once per parameter tuple with executemany
+        commit: Commit after the statement; pass False to batch several calls
+            on the same connection into one commit
+        connection: Connection to run on; the caller keeps ownership and must
+            commit and release it. Without one, a pooled connection is used and
+            released after the statement
 
     Returns:
         Query results
+
+    Raises:
+        ValueError: If commit is False without a caller-owned connection, since
+            the pooled connection would roll the statement back on release
     """
-    connection = get_db_connection()
+    if not commit and connection is None:
+        raise ValueError("execute_query(commit=False) requires a caller-owned connection")
+    owned = connection is None
+    if owned:
+        connection = get_db_connection()
     try:
         cursor = connection.cursor()
-        if params:
+        if many:
+            result = cursor.executemany(query, params).fetchall()
+        elif params:
             result = cursor.execute(query, params).fetchall()
         else:
             result = cursor.execute(query).fetchall()
-        connection.commit()
+        if commit:
+            connection.commit()
         return result
     except Exception as e:
         logger.error(f"Query execution error: {e}")
         connection.rollback()
         raise
     finally:
-        close_db_connection(connection)
+        if owned:
+            close_db_connection(connection)
@@ -2,15 +2,24 @@
 Logger configuration for Education Intelligence System
 """
 
+import functools
 import logging
 import sys
 from config import settings
 
+_LEVEL = getattr(logging, settings.LOG_LEVEL, logging.INFO)
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
 
+
+@functools.cache
 def setup_logger(name: str = None) -> logging.Logger:
     """
     Setup and configure logger
 
+    Repeated calls for the same name return the configured logger directly.
+
     Args:
         name: Logger name (typically __name__)
 
@@ -22,17 +31,12 @@ def setup_logger(name: str = None) -> logging.Logger:
 
     # Only add handlers if they don't exist
     if not logger.handlers:
-        logger.setLevel(getattr(logging, settings.LOG_LEVEL, logging.INFO))
+        logger.setLevel(_LEVEL)
 
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, settings.LOG_LEVEL, logging.INFO))
-
-        # Formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        console_handler.setFormatter(formatter)
+        console_handler.setLevel(_LEVEL)
+        console_handler.setFormatter(_FORMATTER)
         logger.addHandler(console_handler)
 
     return logger
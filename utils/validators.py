@@ -2,10 +2,40 @@
 Data validators for Education Intelligence System
 """
 
+import bisect
+import functools
+import re
+from typing import Any, Iterable, List, Union
 from .logger import setup_logger
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 logger = setup_logger(__name__)
 
+_STUDENT_REQUIRED = frozenset({"student_id", "name", "email"})
+_ASSESSMENT_REQUIRED = frozenset({"student_id", "subject", "score"})
+
+_EMAIL_PATTERN = r"[^@\s]+@[^@\s]+\.[^@\s]+"
+_EMAIL_RE = re.compile(_EMAIL_PATTERN)
+
+
+def _is_valid_score(score: Any) -> bool:
+    """Check one score is numeric and within 0-100"""
+    return isinstance(score, (int, float)) and 0 <= score <= 100
+
+
+def _is_valid_email(email: Any) -> bool:
+    """Check one email has a local part, a domain and a dotted suffix"""
+    return isinstance(email, str) and _EMAIL_RE.fullmatch(email) is not None
+
 
 def validate_student_data(student_data: dict) -> bool:
     """
@@ -17,17 +47,17 @@ def validate_student_data(student_data: dict) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    required_fields = ["student_id", "name", "email"]
-
-    try:
-        for field in required_fields:
-            if field not in student_data or not student_data[field]:
-                logger.warning(f"Missing required field: {field}")
-                return False
-        return True
-    except Exception as e:
-        logger.error(f"Validation error: {e}")
+    if not isinstance(student_data, dict):
+        logger.warning(f"Student data must be a dict, got {type(student_data).__name__}")
+        return False
+    if _STUDENT_REQUIRED - student_data.keys() or not all(student_data[f] for f in _STUDENT_REQUIRED):
+        field = next(f for f in sorted(_STUDENT_REQUIRED) if not student_data.get(f))
+        logger.warning(f"Missing required field: {field}")
         return False
+    if not _is_valid_email(student_data["email"]):
+        logger.warning(f"Invalid email: {student_data['email']}")
+        return False
+    return True
 
 
 def validate_assessment_data(assessment_data: dict) -> bool:
@@ -40,21 +70,125 @@ def validate_assessment_data(assessment_data: dict) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    required_fields = ["student_id", "subject", "score"]
+    if not isinstance(assessment_data, dict):
+        logger.warning(f"Assessment data must be a dict, got {type(assessment_data).__name__}")
+        return False
+    if (_ASSESSMENT_REQUIRED - assessment_data.keys()
+            or any(assessment_data[f] is None for f in _ASSESSMENT_REQUIRED)):
+        field = next(f for f in sorted(_ASSESSMENT_REQUIRED) if assessment_data.get(f) is None)
+        logger.warning(f"Missing required field: {field}")
+        return False
+
+    # Validate score is numeric and between 0-100
+    score = assessment_data["score"]
+    if not _is_valid_score(score):
+        logger.warning(f"Invalid score: {score}")
+        return False
+
+    return True
+
+
+# Prefer the ahead-of-time build (see utils/_validators_aot.py); fall back to the cached JIT kernel
+try:
+    from .validators_native import valid_score_mask as _valid_score_mask
+except ImportError:
+    from ._validators_jit import valid_score_mask as _valid_score_mask
+
+
+def validate_assessment_scores(scores: Iterable[Any]) -> Union[List[bool], "np.ndarray"]:
+    """
+    Validate many assessment scores in one pass
 
-    try:
-        for field in required_fields:
-            if field not in assessment_data or assessment_data[field] is None:
-                logger.warning(f"Missing required field: {field}")
-                return False
+    Uses the precompiled native kernel when it has been built, a parallel
+    numba kernel when numba is installed, vectorized numpy comparisons when
+    only numpy is, and a plain loop otherwise.
 
-        # Validate score is numeric and between 0-100
-        score = assessment_data["score"]
-        if not isinstance(score, (int, float)) or score < 0 or score > 100:
-            logger.warning(f"Invalid score: {score}")
-            return False
+    Args:
+        scores: Score values; non-numeric values and NaN are invalid
 
-        return True
-    except Exception as e:
-        logger.error(f"Assessment validation error: {e}")
-        return False
+    Returns:
+        Boolean mask (numpy array when numpy is installed), True for scores in 0-100
+    """
+    if np is None:
+        return [_is_valid_score(score) for score in scores]
+
+    if isinstance(scores, np.ndarray) and scores.dtype.kind in "biuf":
+        values = scores.astype(np.float64, copy=False)
+    else:
+        values = np.array(
+            [score if isinstance(score, (int, float, np.number)) else np.nan for score in scores],
+            dtype=np.float64
+        )
+
+    if _valid_score_mask is not None:
+        return _valid_score_mask(values)
+    return (values >= 0.0) & (values <= 100.0)
+
+
+def validate_assessment_batch(assessments: Any) -> Union[List[bool], "np.ndarray"]:
+    """
+    Validate the score range of a batch of assessments
+
+    Args:
+        assessments: DataFrame with a ``score`` column, or a list of assessment dicts
+
+    Returns:
+        Boolean mask aligned with the assessments, True where the score is valid
+    """
+    if hasattr(assessments, "columns") and np is not None:
+        return validate_assessment_scores(assessments["score"].to_numpy())
+    return validate_assessment_scores([assessment.get("score") for assessment in assessments])
+
+
+@functools.cache
+def _email_database():
+    """Compile the email pattern into a Hyperscan database on first use"""
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[f"^{_EMAIL_PATTERN}$".encode()],
+        ids=[0],
+        elements=1,
+        flags=[hyperscan.HS_FLAG_MULTILINE]
+    )
+    return database
+
+
+def validate_emails(emails: Iterable[Any]) -> List[bool]:
+    """
+    Validate many email addresses in one pass
+
+    With Hyperscan installed the addresses are joined into one
+    newline-separated buffer and scanned once by its compiled DFA; each
+    match ends at the end of a valid line. Otherwise the compiled regex
+    is applied per address.
+
+    Args:
+        emails: Email addresses; non-string values are invalid
+
+    Returns:
+        One flag per address, True where the email is well formed
+    """
+    emails = list(emails)
+    if hyperscan is None:
+        return [_is_valid_email(email) for email in emails]
+
+    # Addresses that cannot be valid are blanked so they cannot shift line offsets
+    lines = [email if isinstance(email, str) and "\n" not in email else "" for email in emails]
+    buffer = "\n".join(lines).encode("utf-8")
+
+    line_ends = []
+    offset = 0
+    for line in lines:
+        offset += len(line.encode("utf-8"))
+        line_ends.append(offset)
+        offset += 1
+
+    valid = [False] * len(lines)
+
+    def on_match(match_id, start, end, flags, context):
+        index = bisect.bisect_left(line_ends, end)
+        if index < len(valid) and line_ends[index] == end:
+            valid[index] = True
+
+    _email_database().scan(buffer, match_event_handler=on_match)
+    return valid